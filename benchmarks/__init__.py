@@ -0,0 +1,19 @@
+"""Benchmarks for tomate.
+
+Synthetic netCDF archives are generated locally, and common operations
+(scanning, loading, viewing, computing, writing) are timed on them.
+In memory mode, the peak memory allocated by operations is recorded
+instead, along with the theoretical minimum.
+Results are written in JSON, to be compared across commits.
+
+Run from the project root::
+
+    python -m benchmarks run -o results.json
+    python -m benchmarks run --mode memory -o memory.json
+    python -m benchmarks compare base.json results.json
+
+Archives generation requires netCDF4 and cftime.
+"""
+
+from .registry import BENCHMARKS, Benchmark, Case, register
+from . import timing, memory
@@ -0,0 +1,129 @@
+"""Command line interface for benchmarks."""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+
+from . import BENCHMARKS
+from .archive import get_archives
+from .registry import MODES, compare, get_cases, get_metadata, run, select
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description=__doc__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p_run = subparsers.add_parser('run', help="Run benchmarks.")
+    p_run.add_argument('-o', '--output', default=None,
+                       help="JSON file to write results to. "
+                       "Default to stdout.")
+    p_run.add_argument('-r', '--root', default=None,
+                       help="Directory where archives are generated. "
+                       "Default to a 'tomate_benchmarks' folder in the "
+                       "temporary directory.")
+    p_run.add_argument('-s', '--scale', type=float, default=1.,
+                       help="Size factor of archives. Default to 1.")
+    p_run.add_argument('-m', '--mode', default='time', choices=list(MODES),
+                       help="Measure duration or peak memory. "
+                       "Default to 'time'.")
+    p_run.add_argument('-n', '--repeat', type=int, default=None,
+                       help="Number of repetitions. Default to 5 for "
+                       "timings, 1 for memory.")
+    p_run.add_argument('-b', '--bench', nargs='*', default=None,
+                       help="Benchmarks to run (shell-style patterns).")
+    p_run.add_argument('-a', '--archive', nargs='*', default=None,
+                       choices=list(get_archives()),
+                       help="Archives to run on.")
+    p_run.add_argument('-v', '--verbose', action='store_true')
+
+    p_cmp = subparsers.add_parser('compare', help="Compare two results files.")
+    p_cmp.add_argument('base', help="Reference results.")
+    p_cmp.add_argument('new', help="Results to compare.")
+    p_cmp.add_argument('-t', '--threshold', type=float, default=1.2,
+                       help="Ratio above which a result is flagged as "
+                       "regression. Default to 1.2.")
+    p_cmp.add_argument('--stat', default='min',
+                       choices=['min', 'median', 'overhead'],
+                       help="Statistic to compare. 'overhead' is the ratio "
+                       "of peak memory to the theoretical minimum. "
+                       "Default to 'min'.")
+
+    p_list = subparsers.add_parser('list', help="List benchmarks.")
+
+    return parser
+
+
+def main_run(args: argparse.Namespace) -> int:
+    root = args.root
+    if root is None:
+        root = os.path.join(tempfile.gettempdir(), 'tomate_benchmarks')
+
+    repeat = args.repeat
+    if repeat is None:
+        repeat = 5 if args.mode == 'time' else 1
+
+    benchmarks = select(BENCHMARKS, args.bench, args.mode)
+    cases = get_cases(root, args.scale, args.archive)
+    results = run(benchmarks, cases, repeat)
+
+    output = dict(meta=get_metadata(mode=args.mode, scale=args.scale,
+                                    repeat=repeat),
+                  results=results)
+    if args.output is None:
+        json.dump(output, sys.stdout, indent=1)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=1)
+    return 0
+
+
+def main_compare(args: argparse.Namespace) -> int:
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    rows = compare(base, new, args.threshold, args.stat)
+    width = max([len(r['key']) for r in rows] + [9])
+    print('{:{w}}  {:>10}  {:>10}  {:>6}'.format('benchmark', 'base', 'new',
+                                                  'ratio', w=width))
+    for r in rows:
+        print('{:{w}}  {:10.4g}  {:10.4g}  {:6.2f}  {}'.format(
+            r['key'], r['base'], r['new'], r['ratio'], r['flag'], w=width))
+
+    n_regress = sum(r['flag'] == 'regression' for r in rows)
+    if n_regress:
+        print("{} regression(s) above threshold {}.".format(n_regress,
+                                                             args.threshold))
+        return 1
+    return 0
+
+
+def main_list(args: argparse.Namespace) -> int:
+    width = max(len(b.name) for b in BENCHMARKS)
+    for b in BENCHMARKS:
+        print('{:6}  {:{w}}  {}'.format(b.mode, b.name, b.description,
+                                        w=width))
+    return 0
+
+
+def main(argv=None) -> int:
+    args = get_parser().parse_args(argv)
+
+    level = logging.INFO if getattr(args, 'verbose', False) else logging.WARNING
+    logging.basicConfig(level=logging.WARNING,
+                        format='%(levelname)s %(name)s: %(message)s')
+    logging.getLogger('tomate').setLevel(logging.WARNING)
+    logging.getLogger('benchmarks').setLevel(level)
+
+    commands = dict(run=main_run, compare=main_compare, list=main_list)
+    return commands[args.command](args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
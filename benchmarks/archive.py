@@ -0,0 +1,202 @@
+"""Synthetic netCDF archives.
+
+Generate small archives on disk, mimicking common layouts,
+and the constructors to scan them.
+
+All archives share the same grid, with latitude stored in
+descending order (as is often the case for satellite products),
+and a time coordinate whose origin differs from the one of the
+database, to exercise units conversion.
+
+Archives are only generated once per root directory and set of
+parameters: a stamp file records the parameters used.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+try:
+    import netCDF4 as nc
+except ImportError:
+    _has_netcdf = False
+else:
+    _has_netcdf = True
+
+try:
+    import cftime
+except ImportError:
+    _has_cftime = False
+else:
+    _has_cftime = True
+
+from tomate import Constructor, Lat, Lon, Time
+from tomate.db_types import DataCompute
+from tomate.filegroup import FilegroupNetCDF
+import tomate.scan_library as scanlib
+
+
+FILE_UNITS = 'days since 2000-01-01'
+"""Time units used in files."""
+DB_UNITS = 'hours since 1970-01-01'
+"""Time units used in databases."""
+
+
+def get_grid(scale: float = 1.) -> Dict[str, np.ndarray]:
+    """Return lat and lon values.
+
+    Latitude is descending.
+    """
+    n_lat = max(int(90 * scale), 4)
+    n_lon = max(int(120 * scale), 4)
+    return dict(lat=np.linspace(60., -30., n_lat),
+                lon=np.linspace(-80., 40., n_lon))
+
+
+def get_archives(scale: float = 1.) -> Dict[str, Dict[str, Any]]:
+    """Return parameters of each archive.
+
+    :param scale: Multiply number of time steps and grid size.
+
+    Each archive is defined by a list of filegroups. Each filegroup has
+    a subdirectory, a list of variables, a number of files, a number of
+    time steps per file, and whether variables are stored in separate
+    files (the 'var' dimension is then shared among files).
+    """
+    def n(x):
+        return max(int(x * scale), 1)
+
+    archives = {
+        'small_files': [
+            dict(name='daily', variables=['SST', 'SSH'],
+                 n_files=n(180), n_steps=1, var_shared=False)],
+        'big_files': [
+            dict(name='yearly', variables=['SST', 'SSH'],
+                 n_files=2, n_steps=n(90), var_shared=False)],
+        'shared_var': [
+            dict(name='split', variables=['SST', 'SSH', 'CHL'],
+                 n_files=n(60), n_steps=1, var_shared=True)],
+        'multi_fg': [
+            dict(name='sst', variables=['SST'],
+                 n_files=n(60), n_steps=1, var_shared=False),
+            dict(name='chl', variables=['CHL'],
+                 n_files=n(12), n_steps=5, var_shared=False)],
+    }
+    return {name: dict(filegroups=fgs, scale=scale)
+            for name, fgs in archives.items()}
+
+
+def get_filename(fg: Dict[str, Any], index: int, var: str = None) -> str:
+    """Return filename of a file of a filegroup."""
+    filename = '{}_{:04d}.nc'.format(fg['name'], index)
+    if var is not None:
+        filename = '{}_{}'.format(var, filename)
+    return filename
+
+
+def write_file(filename: str, variables: List[str],
+               time: np.ndarray, lat: np.ndarray, lon: np.ndarray,
+               in_file_name: Callable[[str], str] = None,
+               seed: int = 0):
+    """Write a single file."""
+    if in_file_name is None:
+        in_file_name = lambda v: v
+    rng = np.random.default_rng(seed)
+
+    with nc.Dataset(filename, 'w') as f:
+        f.createDimension('time', None)
+        f.createDimension('lat', lat.size)
+        f.createDimension('lon', lon.size)
+
+        f.createVariable('time', 'f8', ['time'])
+        f['time'].setncattr('units', FILE_UNITS)
+        f['time'][:] = time
+        f.createVariable('lat', 'f8', ['lat'])
+        f['lat'][:] = lat
+        f.createVariable('lon', 'f8', ['lon'])
+        f['lon'][:] = lon
+
+        shape = (time.size, lat.size, lon.size)
+        for var in variables:
+            name = in_file_name(var)
+            f.createVariable(name, 'f4', ['time', 'lat', 'lon'],
+                             fill_value=np.float32(1e20))
+            f[name].setncattr('long_name', 'Synthetic {}'.format(var))
+            f[name].setncattr('units', 'm')
+            data = np.ma.masked_array(rng.standard_normal(shape, dtype='f4'),
+                                      mask=np.zeros(shape, bool))
+            # Some land
+            data.mask[:, :lat.size//8, :lon.size//8] = True
+            f[name][:] = data
+
+
+def generate_archive(root: str, archive: Dict[str, Any], force: bool = False):
+    """Generate files of an archive.
+
+    :param root: Root directory of this archive.
+    :param archive: Archive parameters, as returned by :func:`get_archives`.
+    :param force: Regenerate files even if stamp corresponds.
+    """
+    if not (_has_netcdf and _has_cftime):
+        raise ImportError("netCDF4 and cftime packages are necessary "
+                          "for generating archives.")
+
+    stamp_file = os.path.join(root, 'stamp.json')
+    if not force and os.path.isfile(stamp_file):
+        with open(stamp_file) as f:
+            if json.load(f) == archive:
+                return
+
+    grid = get_grid(archive['scale'])
+    for fg in archive['filegroups']:
+        directory = os.path.join(root, fg['name'])
+        os.makedirs(directory, exist_ok=True)
+        for i in range(fg['n_files']):
+            time = np.arange(i*fg['n_steps'], (i+1)*fg['n_steps'],
+                             dtype='f8')
+            if fg['var_shared']:
+                for var in fg['variables']:
+                    write_file(os.path.join(directory, get_filename(fg, i, var)),
+                               [var], time, **grid,
+                               in_file_name=lambda v: 'data', seed=i)
+            else:
+                write_file(os.path.join(directory, get_filename(fg, i)),
+                           fg['variables'], time, **grid, seed=i)
+
+    with open(stamp_file, 'w') as f:
+        json.dump(archive, f)
+
+
+def get_constructor(root: str, archive: Dict[str, Any]) -> Constructor:
+    """Return constructor for an archive.
+
+    The database is of type DataCompute.
+    """
+    cstr = Constructor(root, [Time('time', None, DB_UNITS), Lat(), Lon()])
+
+    for fg in archive['filegroups']:
+        coords = [cstr.CSS('lat'), cstr.CSS('lon'), cstr.CSS('time', 'shared')]
+        if fg['var_shared']:
+            pregex = r'%(var:text)_{}_%(time:idx:dummy)\.nc'.format(fg['name'])
+        else:
+            pregex = r'{}_%(time:idx:dummy)\.nc'.format(fg['name'])
+
+        cstr.add_filegroup(FilegroupNetCDF, coords, name=fg['name'],
+                           root=fg['name'], variables_shared=fg['var_shared'])
+        cstr.set_fg_regex(pregex)
+        cstr.add_scan_in_file(scanlib.nc.scan_dims, 'lat', 'lon', 'time')
+        cstr.add_scan_coords_attributes(scanlib.nc.scan_units, 'time')
+
+        if fg['var_shared']:
+            cstr.add_scan_filename(scanlib.get_string_from_match, 'var')
+            cstr.set_elements_constant('var', in_idx='data',
+                                       dimensions=['time', 'lat', 'lon'])
+        else:
+            cstr.add_scan_in_file(scanlib.nc.scan_variables, 'var')
+        cstr.add_scan_variables_attributes(scanlib.nc.scan_variables_attributes)
+        cstr.add_scan_variables_attributes(scanlib.nc.scan_variables_datatype)
+
+    cstr.set_data_types([DataCompute])
+    return cstr
@@ -0,0 +1,230 @@
+"""Memory benchmarks.
+
+Each benchmark records the peak memory allocated by one operation,
+and compares it to the theoretical minimum: the size of the arrays the
+operation must return or hold, computed from the keyrings shapes and
+variables datatypes.
+An overhead of 1 means no temporary array was needed.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import numpy as np
+
+from tomate.keys.keyring import Keyring
+from tomate.var_types.variable_masked import VariableMasked
+
+from .registry import Case, register
+from .timing import make_db, make_db_loaded
+
+if TYPE_CHECKING:
+    from tomate.data_base import DataBase
+    from tomate.scope import Scope
+
+
+def get_nbytes(db: 'DataBase', variable: str, scope: 'Scope',
+               dims: List[str] = None, masked: bool = None) -> int:
+    """Return size of a variable array, in bytes.
+
+    Masked arrays count one more byte by element, for the mask.
+
+    :param scope: Scope giving the size of each dimension.
+    :param dims: [opt] Dimensions of the array. Default to all
+        the variable dimensions.
+    :param masked: [opt] If the array is masked. Default to True
+        if the variable is masked.
+    """
+    var = db[variable]
+    if dims is None:
+        dims = var.dims
+    if masked is None:
+        masked = isinstance(var, VariableMasked)
+    size = int(np.prod([scope[d].size for d in dims]))
+    itemsize = np.dtype(var.datatype).itemsize
+    if masked:
+        itemsize += 1
+    return size * itemsize
+
+
+def _setup_load(keys: Dict[str, Any]):
+    def setup(case: Case) -> Dict[str, Any]:
+        db = make_db(case)
+        keys_ = {d: k(db) if callable(k) else k for d, k in keys.items()}
+        keyring = Keyring(**keys_)
+        keyring.make_full(db.dims)
+        keyring.make_total()
+        scope = db.get_subscope('avail', keyring)
+        return dict(db=db, keys=keys_, scope=scope)
+    return setup
+
+
+def _min_load(state: Dict[str, Any]) -> int:
+    return sum(get_nbytes(state['db'], var, state['scope'])
+               for var in state['scope'].var)
+
+
+def _load(state: Dict[str, Any]):
+    state['db'].load(**state['keys'])
+
+
+# Loading
+
+@register(setup=_setup_load({}), mode='memory', minimum=_min_load)
+def load_all(state):
+    """Load everything."""
+    _load(state)
+
+
+@register(setup=_setup_load(dict(
+    time=lambda db: slice(0, db.avail.time.size//2),
+    lat=lambda db: slice(db.avail.lat.size//4, 3*db.avail.lat.size//4))),
+          mode='memory', minimum=_min_load)
+def load_slice(state):
+    """Load a slice of time and lat."""
+    _load(state)
+
+
+@register(setup=_setup_load(dict(
+    time=lambda db: list(range(0, db.avail.time.size, 3)),
+    lat=lambda db: list(range(0, db.avail.lat.size, 5)))),
+          mode='memory', minimum=_min_load)
+def load_list(state):
+    """Load scattered time steps and latitudes."""
+    _load(state)
+
+
+# Accessing
+
+def _min_loaded_all(db: 'DataBase') -> int:
+    return sum(get_nbytes(db, var, db.loaded) for var in db.loaded.var)
+
+
+@register(setup=make_db_loaded, mode='memory', minimum=_min_loaded_all)
+def view_stack(db):
+    """View all variables stacked."""
+    db.view(stack=True)
+
+
+def _view_list_keys(db: 'DataBase') -> Dict[str, List[int]]:
+    return dict(time=list(range(0, db.loaded.time.size, 2)),
+                lat=list(range(0, db.loaded.lat.size, 3)),
+                lon=list(range(0, db.loaded.lon.size, 3)))
+
+
+def _min_view_list(db: 'DataBase') -> int:
+    keyring = Keyring(**_view_list_keys(db))
+    keyring.make_full(db.dims)
+    keyring.make_total()
+    scope = db.get_subscope('loaded', keyring)
+    return sum(get_nbytes(db, var, scope) for var in scope.var)
+
+
+@register(setup=make_db_loaded, mode='memory', minimum=_min_view_list)
+def view_list(db):
+    """View scattered indices in all dimensions."""
+    db.view(**_view_list_keys(db))
+
+
+# Computing
+
+def _min_reduction(dims: List[str]):
+    def minimum(db: 'DataBase') -> int:
+        var = db.loaded.var[0]
+        return get_nbytes(db, var, db.loaded,
+                          [d for d in db[var].dims if d not in dims])
+    return minimum
+
+
+@register(setup=make_db_loaded, mode='memory',
+          minimum=_min_reduction(['lat', 'lon']))
+def mean_spatial(db):
+    """Spatial average of the first variable."""
+    db.mean(db.loaded.var[0], ['lat', 'lon'])
+
+
+@register(setup=make_db_loaded, mode='memory',
+          minimum=_min_reduction(['time']))
+def mean_temporal(db):
+    """Temporal average of the first variable."""
+    db.mean(db.loaded.var[0], 'time')
+
+
+@register(setup=make_db_loaded, mode='memory',
+          minimum=_min_reduction(['time']))
+def sum_temporal(db):
+    """Temporal sum of the first variable."""
+    db.sum(db.loaded.var[0], 'time')
+
+
+@register(setup=make_db_loaded, mode='memory',
+          minimum=_min_reduction(['time']))
+def std_dev_temporal(db):
+    """Temporal standard deviation of the first variable."""
+    db.std_dev(db.loaded.var[0], 'time')
+
+
+def _min_mean_disk(db: 'DataBase') -> int:
+    var = db.avail.var[0]
+    keyring = Keyring(time=slice(0, 12))
+    keyring.make_full(db.dims)
+    keyring.make_total()
+    chunk = get_nbytes(db, var, db.get_subscope('avail', keyring))
+    result = get_nbytes(db, var, db.avail,
+                        [d for d in db[var].dims if d != 'time'])
+    return chunk + result
+
+
+@register(setup=make_db, mode='memory', minimum=_min_mean_disk)
+def mean_temporal_disk(db):
+    """Temporal average of the first variable, streamed from disk."""
+    db.mean_disk(db.avail.var[0], 'time', size=12)
+
+
+@register(setup=make_db_loaded, mode='memory', minimum=lambda db: 50*8)
+def histogram(db):
+    """Histogram of the first variable, with fixed bins."""
+    db.histogram(db.loaded.var[0], 50, (-3., 3.))
+
+
+@register(setup=make_db, mode='memory', minimum=_min_mean_disk)
+def histogram_disk(db):
+    """Histogram of the first variable, streamed from disk."""
+    db.histogram_disk(db.avail.var[0], 50, (-3., 3.), size=12)
+
+
+# Masked variables
+
+def _min_full(db: 'DataBase') -> int:
+    return get_nbytes(db, db.loaded.var[0], db.loaded)
+
+
+@register(setup=make_db_loaded, mode='memory', minimum=_min_full)
+def masked_add(db):
+    """Add the first variable to itself."""
+    var = db[db.loaded.var[0]]
+    var + var
+
+
+@register(setup=make_db_loaded, mode='memory',
+          minimum=lambda db: get_nbytes(db, db.loaded.var[0], db.loaded,
+                                        masked=False))
+def masked_filled(db):
+    """Fill masked values of the first variable with NaN."""
+    db[db.loaded.var[0]].filled('nan')
+
+
+def _min_mask(db: 'DataBase') -> int:
+    return int(np.prod(db[db.loaded.var[0]].shape))
+
+
+@register(setup=make_db_loaded, mode='memory', minimum=_min_mask)
+def masked_set_mask(db):
+    """Set mask of the first variable from a boolean."""
+    db[db.loaded.var[0]].set_mask(False)
+
+
+@register(setup=make_db_loaded, mode='memory',
+          minimum=lambda db: db.loaded.time.size * 8)
+def masked_coverage(db):
+    """Compute coverage of the first variable for each time step."""
+    db[db.loaded.var[0]].get_coverage('lat', 'lon')
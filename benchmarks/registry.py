@@ -0,0 +1,261 @@
+"""Benchmarks registry and runner."""
+
+import fnmatch
+import gc
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import tomate
+
+from .archive import generate_archive, get_archives
+
+
+log = logging.getLogger(__name__)
+
+
+class Case():
+    """Archive on which benchmarks are run.
+
+    :param name: Name of the archive.
+    :param root: Root directory of the archive files.
+    :param archive: Archive parameters.
+    """
+    def __init__(self, name: str, root: str, archive: Dict[str, Any]):
+        self.name = name
+        self.root = root
+        self.archive = archive
+
+    def __repr__(self):
+        return "Case: {} ({})".format(self.name, self.root)
+
+
+class Benchmark():
+    """A benchmarked operation.
+
+    :param func: Operation to benchmark. Takes the state returned by `setup`.
+    :param setup: Prepare state from a :class:`Case`. Not measured.
+    :param teardown: [opt] Clean state. Not measured.
+    :param archives: [opt] Names of archives to run on. Default to all.
+    :param mode: 'time' to measure duration, 'memory' to measure
+        peak memory allocations.
+    :param minimum: [opt] For memory mode, compute from the state the
+        minimum number of bytes the operation has to allocate.
+
+    :attr name: str: Name of the benchmark.
+    """
+    def __init__(self, func: Callable[[Any], Any],
+                 setup: Callable[[Case], Any],
+                 teardown: Callable[[Any], None] = None,
+                 archives: List[str] = None,
+                 mode: str = 'time',
+                 minimum: Callable[[Any], int] = None):
+        if mode not in MODES:
+            raise ValueError("Mode should be one of {} (is {})"
+                             .format(list(MODES), mode))
+        self.name = func.__name__
+        self.func = func
+        self.setup = setup
+        self.teardown = teardown
+        self.archives = archives
+        self.mode = mode
+        self.minimum = minimum
+
+    def __repr__(self):
+        return "Benchmark: {} ({})".format(self.name, self.mode)
+
+    @property
+    def description(self) -> str:
+        """First line of the operation docstring."""
+        doc = self.func.__doc__ or ''
+        return doc.strip().split('\n')[0]
+
+    def time(self, case: Case) -> float:
+        """Time operation once, in seconds."""
+        state = self.setup(case)
+        gc.collect()
+        start = time.perf_counter()
+        self.func(state)
+        duration = time.perf_counter() - start
+        if self.teardown is not None:
+            self.teardown(state)
+        return duration
+
+    def memory(self, case: Case) -> Tuple[int, Optional[int]]:
+        """Measure peak memory allocated by the operation, in bytes.
+
+        Only allocations made during the operation are counted, as traced
+        by the `tracemalloc` module (which includes numpy arrays data).
+
+        :returns: Peak allocation, and theoretical minimum if available.
+        """
+        state = self.setup(case)
+        minimum = None
+        if self.minimum is not None:
+            minimum = self.minimum(state)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            self.func(state)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        if self.teardown is not None:
+            self.teardown(state)
+        return peak, minimum
+
+
+MODES = {'time': 's', 'memory': 'B'}
+"""Available modes, and unit of their results."""
+
+BENCHMARKS = []
+"""Registered benchmarks."""
+
+
+def register(setup: Callable[[Case], Any] = None,
+             teardown: Callable[[Any], None] = None,
+             archives: List[str] = None,
+             mode: str = 'time',
+             minimum: Callable[[Any], int] = None) -> Callable:
+    """Register a benchmark.
+
+    Decorator on the benchmarked operation.
+    See :class:`Benchmark` for arguments.
+    """
+    def decorator(func):
+        BENCHMARKS.append(Benchmark(func, setup, teardown, archives,
+                                    mode, minimum))
+        return func
+    return decorator
+
+
+def get_cases(root: str, scale: float = 1.,
+              archives: List[str] = None) -> List[Case]:
+    """Generate archives if necessary and return cases.
+
+    :param root: Directory in which to generate archives.
+    :param scale: Size of archives.
+    :param archives: [opt] Names of archives to use. Default to all.
+    """
+    cases = []
+    for name, archive in get_archives(scale).items():
+        if archives is not None and name not in archives:
+            continue
+        case_root = os.path.join(root, '{}_{}'.format(name, scale))
+        log.info("Generating archive %s in %s", name, case_root)
+        generate_archive(case_root, archive)
+        cases.append(Case(name, case_root, archive))
+    return cases
+
+
+def select(benchmarks: List[Benchmark], patterns: Optional[List[str]],
+           mode: str = None) -> List[Benchmark]:
+    """Select benchmarks whose name matches any pattern.
+
+    :param mode: [opt] Only keep benchmarks of this mode.
+    """
+    if mode is not None:
+        benchmarks = [b for b in benchmarks if b.mode == mode]
+    if not patterns:
+        return list(benchmarks)
+    return [b for b in benchmarks
+            if any(fnmatch.fnmatch(b.name, p) for p in patterns)]
+
+
+def get_metadata(**kwargs: Any) -> Dict[str, Any]:
+    """Return information on the environment."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'],
+                                capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    meta = dict(commit=commit,
+                date=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                python=platform.python_version(),
+                numpy=np.__version__,
+                tomate=tomate.__version__,
+                machine=platform.machine(),
+                platform=platform.platform())
+    meta.update(kwargs)
+    return meta
+
+
+def run(benchmarks: List[Benchmark], cases: List[Case],
+        repeat: int = 5) -> Dict[str, Dict[str, Any]]:
+    """Run benchmarks on each case.
+
+    :param repeat: Number of time each operation is measured.
+    :returns: Results for each benchmark and case, with a key of the form
+        'benchmark[archive]'. For memory benchmarks, results also contain
+        the theoretical minimum, and the overhead (ratio of the peak
+        allocation to that minimum).
+    """
+    results = {}
+    for case in cases:
+        for bench in benchmarks:
+            if bench.archives is not None and case.name not in bench.archives:
+                continue
+            key = '{}[{}]'.format(bench.name, case.name)
+            res = dict(benchmark=bench.name, archive=case.name,
+                       mode=bench.mode, unit=MODES[bench.mode])
+
+            if bench.mode == 'time':
+                values = [bench.time(case) for _ in range(repeat)]
+            else:
+                values = []
+                for _ in range(repeat):
+                    peak, minimum = bench.memory(case)
+                    values.append(peak)
+                res['minimum'] = minimum
+                res['overhead'] = None
+                if minimum:
+                    res['overhead'] = min(values) / minimum
+
+            res.update(values=values, min=min(values),
+                       median=statistics.median(values))
+            results[key] = res
+            log.info("%s: %.4g %s", key, res['min'], res['unit'])
+    return results
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any],
+            threshold: float = 1.2,
+            stat: str = 'min') -> List[Dict[str, Any]]:
+    """Compare two sets of results.
+
+    :param base: Reference results, as written by the runner.
+    :param new: Results to compare.
+    :param threshold: Ratio new/base above which a result is flagged
+        as a regression (and below the inverse as an improvement).
+    :param stat: Statistic to compare. Results without this statistic
+        (for instance 'overhead' for timings) are skipped.
+
+    :returns: For each result present in both sets, the two values, their
+        ratio and a flag ('regression', 'improvement' or '').
+    """
+    rows = []
+    for key, res in new['results'].items():
+        if key not in base['results']:
+            continue
+        old = base['results'][key].get(stat)
+        value = res.get(stat)
+        if old is None or value is None:
+            continue
+        ratio = value / old if old else float('inf')
+        flag = ''
+        if ratio > threshold:
+            flag = 'regression'
+        elif ratio < 1 / threshold:
+            flag = 'improvement'
+        rows.append(dict(key=key, unit=res['unit'], base=old, new=value,
+                         ratio=ratio, flag=flag))
+    return rows
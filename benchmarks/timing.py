@@ -0,0 +1,216 @@
+"""Timing benchmarks.
+
+Each benchmark times one operation on an archive.
+A setup function prepares the state the operation needs, it is run
+before each repetition and is not timed.
+"""
+
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict
+
+from tomate.keys.keyring import Keyring
+
+from .archive import get_constructor
+from .registry import Case, register
+
+if TYPE_CHECKING:
+    from tomate.data_base import DataBase
+
+
+def make_db(case: Case, scan: bool = True) -> 'DataBase':
+    """Create database for this case."""
+    cstr = get_constructor(case.root, case.archive)
+    return cstr.make_data(scan=scan)
+
+
+def make_db_loaded(case: Case) -> 'DataBase':
+    """Create database with all data loaded."""
+    db = make_db(case)
+    db.load()
+    return db
+
+
+def get_plan_keyrings(db: 'DataBase') -> Dict[str, Any]:
+    """Return keyrings to plan loading one time step out of two."""
+    keyring = Keyring(time=list(range(0, db.avail.time.size, 2)))
+    keyring.make_full(db.dims)
+    keyring.make_total()
+    keyring = db.get_subscope('avail', keyring).parent_keyring
+    memory = Keyring(**{d: list(range(k.size)) for d, k in keyring.items()})
+    return dict(db=db, keyring=keyring, memory=memory)
+
+
+# Scanning
+
+@register(setup=lambda case: make_db(case, scan=False))
+def scan_files(db):
+    """Scan all files."""
+    db.scan_files()
+
+
+def _setup_compile(case: Case) -> 'DataBase':
+    db = make_db(case, scan=False)
+    db.scan_files()
+    return db
+
+
+@register(setup=_setup_compile)
+def compile_scanned(db):
+    """Compile scanned values."""
+    db.compile_scanned()
+
+
+# Loading
+
+@register(setup=lambda case: get_plan_keyrings(make_db(case)))
+def plan_load(state):
+    """Retrieve load commands for one time step out of two."""
+    for fg in state['db'].filegroups:
+        cmd = fg.get_fg_keyrings(state['keyring'], state['memory'])
+        fg.get_commands(*cmd)
+
+
+@register(setup=make_db)
+def load_all(db):
+    """Load everything."""
+    db.load()
+
+
+@register(setup=make_db)
+def load_slice(db):
+    """Load a slice of time, lat and lon."""
+    n_lat = db.avail.lat.size
+    db.load(time=slice(0, db.avail.time.size//2),
+            lat=slice(n_lat//4, 3*n_lat//4), lon=slice(0, None, 2))
+
+
+@register(setup=make_db)
+def load_list(db):
+    """Load scattered time steps and latitudes."""
+    db.load(time=list(range(0, db.avail.time.size, 3)),
+            lat=list(range(0, db.avail.lat.size, 5)))
+
+
+@register(setup=make_db)
+def load_int(db):
+    """Load a single time step."""
+    db.load(time=db.avail.time.size//2)
+
+
+# Accessing
+
+@register(setup=make_db_loaded)
+def view_int(db):
+    """View each time step separately."""
+    var = db.loaded.var[0]
+    for i in range(db.loaded.time.size):
+        db.view(var, time=i)
+
+
+@register(setup=make_db_loaded)
+def view_int_compiled(db):
+    """View each time step separately, with a compiled view."""
+    cview = db.compile_view(db.loaded.var[0], along='time')
+    for i in range(db.loaded.time.size):
+        cview(i)
+
+
+@register(setup=make_db_loaded)
+def view_list(db):
+    """View scattered indices in all dimensions."""
+    db.view(time=list(range(0, db.loaded.time.size, 2)),
+            lat=list(range(0, db.loaded.lat.size, 3)),
+            lon=list(range(0, db.loaded.lon.size, 3)))
+
+
+@register(setup=make_db_loaded)
+def view_stack(db):
+    """View all variables stacked."""
+    db.view(stack=True)
+
+
+# Computing
+
+@register(setup=make_db_loaded)
+def mean_spatial(db):
+    """Spatial average of the first variable."""
+    db.mean(db.loaded.var[0], ['lat', 'lon'])
+
+
+@register(setup=make_db_loaded)
+def mean_temporal(db):
+    """Temporal average of the first variable."""
+    db.mean(db.loaded.var[0], 'time')
+
+
+@register(setup=make_db_loaded)
+def mean_spatial_threads(db):
+    """Spatial average of the first variable, with 4 threads."""
+    db.mean(db.loaded.var[0], ['lat', 'lon'], threads=4)
+
+
+@register(setup=make_db)
+def mean_temporal_disk(db):
+    """Temporal average of the first variable, streamed from disk."""
+    db.mean_disk(db.avail.var[0], 'time', size=12)
+
+
+@register(setup=make_db_loaded)
+def resample_monthly(db):
+    """Monthly average of the first variable."""
+    db.resample(db.loaded.var[0], freq='month')
+
+
+# Writing
+
+def _setup_write(case: Case) -> Dict[str, Any]:
+    db = make_db_loaded(case)
+    directory = tempfile.mkdtemp(prefix='tomate_bench_')
+    return dict(db=db, directory=directory)
+
+
+def _teardown_write(state: Dict[str, Any]):
+    for filename in os.listdir(state['directory']):
+        os.remove(os.path.join(state['directory'], filename))
+    os.rmdir(state['directory'])
+
+
+@register(setup=_setup_write, teardown=_teardown_write)
+def write(state):
+    """Write all loaded data, one file per filegroup."""
+    db = state['db']
+    for fg in db.filegroups:
+        db.write('out_{}.nc'.format(fg.name), directory=state['directory'],
+                 var=fg.variables)
+
+
+@register(setup=_setup_write, teardown=_teardown_write)
+def write_split(state):
+    """Write all loaded data, one file per 5 time steps, with 2 workers."""
+    state['db'].write_split('time', 5, directory=state['directory'],
+                            workers=2)
+
+
+def _setup_map(case: Case) -> Dict[str, Any]:
+    db = make_db(case)
+    directory = tempfile.mkdtemp(prefix='tomate_bench_')
+    return dict(db=db, directory=directory)
+
+
+@register(setup=_setup_map, teardown=_teardown_write)
+def map_to_disk(state):
+    """Copy the first variable to new files of 5 time steps, with 2 workers."""
+    db = state['db']
+    db.map_to_disk(lambda db: None, r'out_%(time:idx)\.nc', size=5,
+                   directory=state['directory'], workers=2,
+                   var=db.avail.var[0])
+
+
+@register(setup=_setup_map, teardown=_teardown_write)
+def write_append(state):
+    """Stream the first variable in one file, appending 5 time steps at once."""
+    db = state['db']
+    var = db.avail.var[0]
+    for _ in db.iter_load('time', 5, var):
+        db.write_append('out.nc', 'time', directory=state['directory'])
@@ -13,8 +13,7 @@ The main way is still to store data in numpy arrays.
 
 
 import logging
-from typing import List, Iterable, Union
-import itertools
+from typing import Any, List, Iterable, Optional, Tuple, Union
 
 import numpy as np
 
@@ -97,6 +96,25 @@ class AccessorABC():
         """
         raise NotImplementedError
 
+    @classmethod
+    def get_index(cls, keyring: Keyring, array: Array) -> Any:
+        """Return index corresponding to a keyring.
+
+        Indexing the array with it must give the same result as
+        :func:`take`. This allows to compute the index once and reuse it.
+
+        :param keyring: Part of the array to take.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def take_index(index: Any, array: Array) -> Array:
+        """Retrieve part of an array from an index.
+
+        :param index: Index, as returned by :func:`get_index`.
+        """
+        raise NotImplementedError
+
     @classmethod
     def place(cls, keyring: Keyring, array: Array, chunk: Array):
         """Assign a part of array with another array.
@@ -131,6 +149,26 @@ class AccessorABC():
             the two dimensions (if in different order than current)
         :raises IndexError: `order` has incorrect length.
         """
+        axes = cls.get_reorder_axes(current, order)
+        if axes is not None:
+            if log_lvl:
+                log.log(getattr(logging, log_lvl.upper()),
+                        "Reordering %s -> %s", *axes)
+            return cls.moveaxis(array, *axes)
+        return array
+
+    @staticmethod
+    def get_reorder_axes(current: List[str],
+                         order: List[str]) -> Optional[Tuple[List[int], List[int]]]:
+        """Return axes to move to reorder dimensions.
+
+        :param current: Current dimensions order.
+        :param order: Target dimensions order. See :func:`reorder`.
+        :returns: Source and destination positions of axes, to
+            pass to :func:`moveaxis`. None if `order` is the same
+            as `current`.
+        :raises IndexError: `order` has incorrect length.
+        """
         if len(order) != len(current):
             if len(order) != 2:
                 raise IndexError("Length of order must be the same as the array, or 2.")
@@ -142,11 +180,8 @@ class AccessorABC():
             source = list(range(len(order)))
             dest = [order.index(n) for n in current]
         if source != dest:
-            if log_lvl:
-                log.log(getattr(logging, log_lvl.upper()),
-                        "Reordering %s -> %s", source, dest)
-            return cls.moveaxis(array, source, dest)
-        return array
+            return source, dest
+        return None
 
     @staticmethod
     def concatenate(arrays: List[Array],
@@ -203,7 +238,7 @@ class Accessor(AccessorABC):
         n_int = [k.type for k in keyring.keys].count('int')
         if n_list >= 2:
             return False
-        if n_list > 1 and n_int >= 1:
+        if n_list >= 1 and n_int >= 1:
             return False
 
         return True
@@ -249,27 +284,81 @@ class Accessor(AccessorABC):
         cls.check_applicable(keyring, array)
         return array[tuple(keyring.keys_values)]
 
+    @staticmethod
+    def get_orthogonal_index(keyring: Keyring, shape: List[int]) -> Tuple:
+        """Return index selecting keys independently along each dimension.
+
+        Integer keys are kept as is, and squeeze their dimension.
+        List keys, and slice keys placed between two integer or list keys,
+        are transformed into integer arrays shaped so that they broadcast
+        against each other (as with `numpy.ix_`). Those advanced indices
+        being adjacent, the result of indexing has the dimensions of the
+        non-integer keys, in order.
+        Slice keys outside of that block stay slices, so that contiguous
+        parts of the array are copied as a whole.
+
+        :param shape: Shape of the array to index.
+        """
+        keys = [slice(None) if k.type == 'none' else k.value
+                for k in keyring.keys]
+        types = [k.type for k in keyring.keys]
+        advanced = [i for i, t in enumerate(types) if t in ['int', 'list']]
+        if not advanced:
+            return tuple(keys)
+
+        idx_ortho = [i for i in range(advanced[0], advanced[-1]+1)
+                     if types[i] != 'int']
+        arrays = []
+        for i in idx_ortho:
+            if types[i] == 'list':
+                arrays.append(np.asarray(keys[i], dtype=np.intp))
+            else:
+                arrays.append(np.arange(*keys[i].indices(shape[i])))
+        for i, arr in zip(idx_ortho, np.ix_(*arrays)):
+            keys[i] = arr
+        return tuple(keys)
+
+    @classmethod
+    def get_index(cls, keyring: Keyring, array: np.ndarray) -> Tuple:
+        """Return index corresponding to a keyring.
+
+        Indexing the array with it gives the same result as :func:`take`.
+
+        :param keyring: Part of the array to take.
+        """
+        cls.check_applicable(keyring, array)
+        if cls.has_normal_access(keyring):
+            return tuple(keyring.keys_values)
+        return cls.get_orthogonal_index(keyring, cls.shape(array))
+
+    @staticmethod
+    def take_index(index: Tuple, array: np.ndarray) -> np.ndarray:
+        """Retrieve part of an array from an index.
+
+        Amounts to `array[index]`.
+
+        :param index: Index, as returned by :func:`get_index`.
+        """
+        return array[index]
+
     @classmethod
     def take_complex(cls, keyring: Keyring, array: np.ndarray) -> np.ndarray:
         """Retrieve part of an array without normal indexing.
 
-        Amounts to `array[keyring]`.
+        Amounts to `array[keyring]`, where each key acts independently on
+        its dimension. This is done in a single indexing operation.
         Returns a copy of the array.
 
         :param keyring: Part of the array to take.
+
+        See also
+        --------
+        get_orthogonal_index: Index used.
         """
         cls.check_applicable(keyring, array)
-
-        out = array
-        keys = []
-        for i, k in enumerate(keyring.keys):
-            keys_ = tuple(keys + [k.value])
-            log.debug('take_complex executing out = %s%s',
-                      'array' if i == 0 else 'out', list(keys_))
-            out = out[keys_]
-            if k.shape != 0:
-                keys.append(slice(None, None))
-        return out
+        keys = cls.get_orthogonal_index(keyring, cls.shape(array))
+        log.debug('take_complex executing array%s', keyring.print())
+        return array[keys]
 
     @classmethod
     def place(cls, keyring: Keyring, array: np.ndarray, chunk: np.ndarray):
@@ -313,25 +402,22 @@ class Accessor(AccessorABC):
     def place_complex(cls, keyring: Keyring, array: np.ndarray, chunk: np.ndarray):
         """Assign part of an array without normal indexing.
 
-        Amounts to `array[keyring] = chunk`.
-        List keys are transformed in combination of integers.
+        Amounts to `array[keyring] = chunk`, where each key acts
+        independently on its dimension. This is done in a single
+        indexing operation.
 
         :param keyring: Part of array to assign.
         :param array: Array to assign.
         :param chunk: Array to be assigned.
+
+        See also
+        --------
+        get_orthogonal_index: Index used.
         """
         cls.check_parent(keyring, chunk)
-
-        list_keys = [n for n, k in keyring.items() if k.type == 'list']
-        krg = keyring.copy()
-        for m in itertools.product(*[range(keyring[d].shape) for d in list_keys]):
-            krg_chunk = [0] * len(list_keys)
-            for i_d, d in enumerate(list_keys):
-                krg[d] = keyring[d].value[m[i_d]]
-                krg_chunk[i_d] = m[i_d]
-            log.debug('place_complex executing array%s = chunk%s',
-                      krg.print(), krg_chunk)
-            array[tuple(krg.keys_values)] = chunk[tuple(krg_chunk)]
+        keys = cls.get_orthogonal_index(keyring, cls.shape(array))
+        log.debug('place_complex executing array%s = chunk', keyring.print())
+        array[keys] = chunk
 
     @staticmethod
     def moveaxis(array: np.ndarray,
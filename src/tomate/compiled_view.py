@@ -0,0 +1,168 @@
+"""Reusable view of loaded data."""
+
+# This file is part of the 'tomate' project
+# (http://github.com/Descanonge/tomate) and subject
+# to the MIT License as defined in the file 'LICENSE',
+# at the root of this project. © 2020 Clément HAËCK
+
+
+from typing import Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from tomate.custom_types import Array
+from tomate.keys.keyring import Keyring
+
+if TYPE_CHECKING:
+    from tomate.data_base import DataBase
+
+
+class CompiledView():
+    """View of loaded data, computed once and reused.
+
+    Keys are processed when the view is compiled: for each variable,
+    the index to apply to its data, and the axes to move to obtain the
+    asked order, are stored.
+    Calling the view then only amounts to indexing arrays.
+
+    One dimension can be left free (`along`). It is then indexed with an
+    integer that can be changed at each call, at little cost. That
+    dimension is squeezed.
+
+    The view is only valid for the data it was compiled for. If the data
+    changes shape (by loading again for instance), it must be compiled
+    again.
+
+    Should be created with :func:`DataBase.compile_view
+    <tomate.data_base.DataBase.compile_view>`.
+
+    :param db: Database.
+    :param keyring: Keys acting on loaded scope, full, total, and
+        with indices for variables.
+    :param along: [opt] Dimension left free.
+    :param stack: [opt] Concatenate variables into one array.
+    :param order: [opt] Dimensions order.
+
+    :attr keyring: Keyring: Keys of the view. The key for the `along`
+        dimension is updated with the current index.
+    :attr along: str: Dimension left free, or None.
+    :attr variables: List[str]: Variables viewed.
+    """
+
+    def __init__(self, db: 'DataBase', keyring: Keyring,
+                 along: str = None, stack: Union[str, bool] = None,
+                 order: List[str] = None):
+        self._db = db
+        self.keyring = keyring
+        self.along = along
+        self.stack = stack
+
+        self._variables = [db.variables[var] for var in keyring['var']]
+        self.variables = [v.name for v in self._variables]
+        self._squeeze = keyring['var'].size == 0 and not stack
+
+        if order is not None:
+            order_novar = [d for d in order if d != 'var']
+        else:
+            order_novar = None
+
+        self._shapes = []
+        self._indices = []
+        self._along_pos = []
+        self._axes = []
+        for var in self._variables:
+            var.check_loaded()
+            krg = keyring.subset(var.dims)
+            krg.make_str_idx(**db.loaded.dims)
+            self._shapes.append(var.acs.shape(var.data))
+            self._indices.append(var.acs.get_index(krg, var.data))
+            self._along_pos.append(var.dims.index(along)
+                                   if along in var.dims else None)
+            axes = None
+            if order_novar is not None:
+                axes = var.acs.get_reorder_axes(krg.get_non_zeros(),
+                                                order_novar)
+            self._axes.append(axes)
+
+        self._axis_stack = None
+        if stack:
+            if order is not None:
+                self._axis_stack = order.index('var')
+            else:
+                self._axis_stack = db.dims.index('var')
+
+    def __repr__(self):
+        s = ["Compiled view", "Variables: {}".format(', '.join(self.variables))]
+        if self.along is not None:
+            s.append("Along: {} (index {})".format(self.along, self.index))
+        s.append("Keys: {}".format(self.keyring.print()))
+        return '\n'.join(s)
+
+    @property
+    def index(self) -> Optional[int]:
+        """Current index of the free dimension."""
+        if self.along is None:
+            return None
+        return self.keyring[self.along].value
+
+    def set_index(self, index: int):
+        """Point the view to another index of the free dimension.
+
+        :param index: Index in the loaded scope.
+        :raises TypeError: If the view has no free dimension.
+        """
+        if self.along is None:
+            raise TypeError("View was not compiled with a free dimension.")
+        index = int(index)
+        self.keyring[self.along].set(index)
+        for i, pos in enumerate(self._along_pos):
+            if pos is not None:
+                idx = list(self._indices[i])
+                idx[pos] = index
+                self._indices[i] = tuple(idx)
+
+    def check_data(self):
+        """Check data has not changed shape since compilation.
+
+        :raises RuntimeError: If data has changed.
+        """
+        for var, shape in zip(self._variables, self._shapes):
+            if not var.is_loaded() or var.acs.shape(var.data) != shape:
+                raise RuntimeError("Data of variable {} has changed since the"
+                                   " view was compiled.".format(var.name))
+
+    def __call__(self, index: int = None) -> Union[Array, Tuple[Array]]:
+        """Return subset of data.
+
+        :param index: [opt] Index of the free dimension to view.
+            If None, the current index is used.
+        :returns: Subset of data, as :func:`DataBase.view
+            <tomate.data_base.DataBase.view>` would.
+        """
+        if index is not None:
+            self.set_index(index)
+        self.check_data()
+
+        out = []
+        for var, idx, axes in zip(self._variables, self._indices, self._axes):
+            arr = var.acs.take_index(idx, var.data)
+            if axes is not None:
+                arr = var.acs.moveaxis(arr, *axes)
+            out.append(arr)
+
+        if self._axis_stack is not None:
+            return self._variables[0].acs.stack(out, axis=self._axis_stack)
+        if self._squeeze:
+            return out[0]
+        return tuple(out)
+
+    def __iter__(self) -> Iterator[Union[Array, Tuple[Array]]]:
+        """Iterate over the loaded indices of the free dimension."""
+        if self.along is None:
+            raise TypeError("View was not compiled with a free dimension.")
+        for index in range(self._db.loaded[self.along].size):
+            yield self(index)
+
+    def __len__(self) -> int:
+        """Size of the free dimension in the loaded scope."""
+        if self.along is None:
+            raise TypeError("View was not compiled with a free dimension.")
+        return self._db.loaded[self.along].size
@@ -20,6 +20,7 @@ from tomate.filegroup.filegroup_load import FilegroupLoad
 from tomate.filegroup.scanner import PostLoadingFunc, ScannerCS
 from tomate.filegroup.spec import CoordScanSpec, VariableSpec
 from tomate.keys.key import Key, KeyValue
+from tomate.profiling import Hook, HookRegistry
 from tomate.variables_info import VariablesInfo
 
 
@@ -43,6 +44,7 @@ class Constructor():
     :attr db_types: List[Type[DataBase]]: Subclass of DataBase to use to create
         a new dynamic database class.
     :attr allow_advanced: bool: If advanced Filegroups arrangement is allowed.
+    :attr hooks: HookRegistry: Profiling hooks transmitted to the database.
     """
 
     CSS = CoordScanSpec
@@ -63,6 +65,8 @@ class Constructor():
 
         self.allow_advanced = False
 
+        self.hooks = HookRegistry()
+
     @property
     def current_fg(self) -> FilegroupLoad:
         """Current filegroup.
@@ -436,6 +440,20 @@ class Constructor():
             for_append = self
         for_append.post_loading_funcs.append(plf)
 
+    def add_hook(self, hook: Hook, current_fg: bool = False):
+        """Add a profiling hook.
+
+        :param hook: Callable notified of the start and end of the scanning,
+            loading and writing stages. See :class:`HookRegistry
+            <tomate.profiling.HookRegistry>` for details.
+        :param current_fg: Will apply only for current filegroup, otherwise will
+            apply for the whole database (default).
+        """
+        if current_fg:
+            self.current_fg.hooks.add(hook)
+        else:
+            self.hooks.add(hook)
+
     def set_data_types(self, db_types: Union[Type[DataBase],
                                              List[Type[DataBase]]] = None):
         """Set database subclasses.
@@ -484,6 +502,7 @@ class Constructor():
         db_class = self.create_data_class()
         db = db_class(**args)
         db.post_loading_funcs += self.post_loading_funcs
+        db.hooks += self.hooks
         db.allow_advanced = self.allow_advanced
 
         if scan:
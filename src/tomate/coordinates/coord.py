@@ -8,11 +8,12 @@
 
 import logging
 import bisect
+import math
 from typing import Any, List, Optional, Sequence
 
 import numpy as np
 
-from tomate.keys.key import list2slice
+from tomate.keys.key import list2slice, range2slice
 from tomate.custom_types import KeyLike
 
 
@@ -24,6 +25,10 @@ class Coord():
 
     Contains strictly monoteous, float values.
 
+    Regularly spaced values can be stored only by their first value, step,
+    and size (see :func:`set_regular`). The values array is then computed
+    when accessed, and indices of values are found arithmetically.
+
     :param name: str: Name of the coordinate.
     :param array: [opt] Values of the coordinate.
     :param units: [opt] Coordinate units
@@ -56,6 +61,21 @@ class Coord():
         if array is not None:
             self.update_values(array)
 
+    @property
+    def _array(self) -> Optional[np.ndarray]:
+        """Values array.
+
+        If the coordinate is regular, it is computed at each access.
+        """
+        if self._regular is not None:
+            return self._get_regular_values()
+        return self._values
+
+    @_array.setter
+    def _array(self, values: Optional[np.ndarray]):
+        self._regular = None
+        self._values = values
+
     def update_values(self, values: Sequence, dtype=None):
         """Change values.
 
@@ -99,7 +119,36 @@ class Coord():
         """Use numpy getitem for the array."""
         if not self.has_data():
             raise AttributeError(f"Coordinate '{self.name}' data was not set.")
-        return self._array.__getitem__(y)
+        return self._get_values(y)
+
+    def _get_values(self, key: KeyLike) -> np.ndarray:
+        """Return values, computed if coordinate is regular."""
+        if self._regular is not None:
+            return self._get_regular_values(key)
+        return self._values[key]
+
+    def _get_regular_values(self, key: KeyLike = None) -> np.ndarray:
+        """Compute values of a regular coordinate.
+
+        :param key: [opt] Part of the values to return. Default to all.
+        """
+        start, step = self._regular
+        if key is None:
+            key = slice(None)
+        if isinstance(key, (int, np.integer)):
+            return np.float64(start + step * range(self._size)[key])
+        if isinstance(key, slice):
+            idx = np.arange(*key.indices(self._size))
+        else:
+            idx = np.asarray(key)
+            if idx.dtype.kind in 'iu':
+                if np.any((idx >= self._size) | (idx < -self._size)):
+                    raise IndexError("Index out of range for coordinate"
+                                     f" '{self.name}' of size {self._size}.")
+                idx = idx % self._size
+            else:
+                idx = np.arange(self._size)[key]
+        return start + step * idx.astype(np.float64)
 
     def __repr__(self):
         s = [str(self)]
@@ -108,6 +157,8 @@ class Coord():
         if self.has_data():
             s.append(f"Size: {self.size}")
             s.append(f"Extent: {self.get_extent_str()}")
+        if self._regular is not None:
+            s.append("Regular: step {}".format(self._regular[1]))
         if self.is_descending():
             s.append("Descending: yes")
         if self.units:
@@ -133,18 +184,76 @@ class Coord():
 
     def copy(self) -> "Coord":
         """Return a copy of itself."""
+        if self._regular is not None:
+            new = self.__class__(self.name, None, self.units, self.fullname)
+            new.set_regular(*self._regular, self.size)
+            return new
         return self.__class__(self.name, self._array, self.units, self.fullname)
 
+    def set_regular(self, start: float, step: float, size: int):
+        """Set regularly spaced values.
+
+        Only the first value, step and size are stored.
+        The coordinate stays regular until its values are changed
+        with :func:`update_values`, or it is sliced with a list.
+
+        :param start: First value.
+        :param step: Step between values. Negative for a descending
+            coordinate.
+        :param size: Number of values.
+        :raises ValueError: If the step is zero, or size is not positive.
+        """
+        if step == 0:
+            raise ValueError("Step of a regular coordinate cannot be zero.")
+        if size < 1:
+            raise ValueError("Size of a regular coordinate must be positive.")
+        self._values = None
+        self._regular = (float(start), float(step))
+        self._size = int(size)
+        self._descending = bool(step < 0 and size > 1)
+
+    def make_regular(self, threshold: float = None) -> bool:
+        """Only store first value and step, if values are regular.
+
+        :param threshold: [opt] Threshold for float comparison. If None,
+            the `float_comparison` attribute is used.
+        :returns: True if the coordinate is regular.
+        """
+        if self._regular is not None:
+            return True
+        if not self.has_data() or self.size < 2:
+            return False
+        if not self.is_regular(threshold):
+            return False
+        first, last = self._values[[0, -1]]
+        self.set_regular(first, (last - first) / (self.size - 1), self.size)
+        return True
+
     def slice(self, key: KeyLike):
         """Slice the coordinate.
 
+        A regular coordinate stays regular if `key` is an
+        integer, a slice, or a list of regularly spaced indices.
+
         :raises IndexError: If there is no data.
         """
         if not self.has_data():
             raise IndexError("Coordinate has no values to slice.")
         if key is None:
             key = slice(None, None)
-        data = self._array[key]
+        if self._regular is not None and isinstance(key, (list, np.ndarray)):
+            idx = np.asarray(key)
+            if idx.ndim == 1 and idx.size > 0 and idx.dtype.kind in 'iu':
+                key = int(idx[0]) if idx.size == 1 else list2slice(key)
+        if self._regular is not None and isinstance(key, (int, np.integer, slice)):
+            start, step = self._regular
+            rng = range(self.size)[key]
+            if isinstance(rng, int):
+                rng = range(rng, rng+1)
+            if len(rng) > 0:
+                self.set_regular(start + step*rng.start, step*rng.step, len(rng))
+                return
+        data = self._get_values(key)
         self.update_values(data)
 
     def empty(self):
@@ -197,7 +306,7 @@ class Coord():
         slc = slice(start, stop, step)
 
         if self.is_descending():
-            slc = list2slice(list(range(*slc.indices(self.size)))[::-1])
+            slc = range2slice(range(*slc.indices(self.size))[::-1])
 
         return slc
 
@@ -211,25 +320,31 @@ class Coord():
         :param threshold: Threshold used for float comparison. If
             None, the `float_threshold` attribute is used.
         """
+        if self._regular is not None:
+            return True
         if threshold is None:
             threshold = self.float_comparison
         diff = np.diff(self[:])
-        regular = np.all(diff - diff[0] <= threshold)
+        regular = np.all(np.abs(diff - diff[0]) <= threshold)
         return regular
 
     def has_data(self) -> bool:
         """If coordinate has data."""
-        return self._array is not None
+        return self._values is not None or self._regular is not None
 
     def change_units(self, new: str):
         """Change units.
 
         Wrapper around `self.change_units_other`.
+        A regular coordinate stays regular if the new values are.
 
         :param new: New units.
         """
+        regular = self._regular is not None
         self.update_values(self.change_units_other(self._array, self.units, new))
         self.units = new
+        if regular:
+            self.make_regular()
 
     @staticmethod
     def change_units_other(values: Sequence, old: str, new: str):
@@ -241,6 +356,8 @@ class Coord():
 
         Check if the coordinate is regular up to threshold.
         """
+        if self._regular is not None:
+            return self._regular[1]
         if threshold is None:
             threshold = self.float_comparison
         if not self.is_regular(threshold):
@@ -258,7 +375,7 @@ class Coord():
         """
         if slc is None:
             slc = slice(None, None)
-        values = self._array[slc]
+        values = self._get_values(slc)
         return list(values[[0, -1]])
 
     def get_extent_str(self, slc: KeyLike = None) -> str:
@@ -267,7 +384,7 @@ class Coord():
         :param slc: [opt] Constrain to a slice.
         """
         if self.size == 1:
-            return self.format(self._array[0])
+            return self.format(self._get_values(0))
         s = "{} - {}".format(*[self.format(v)
                                for v in self.get_extent(slc)])
         return s
@@ -296,6 +413,9 @@ class Coord():
                 'above': 'right',
                 'closest': 'closest'}[loc]
 
+        if self._regular is not None:
+            return int(self._get_indices_regular(value, loc_))
+
         C = self._array
         if self._descending:
             C = C[::-1]
@@ -308,19 +428,95 @@ class Coord():
         return idx
 
     def get_indices(self, values: Sequence[float],
-                    loc: str = 'closest') -> List[int]:
+                    loc: str = 'closest') -> np.ndarray:
         """Return indices of the elements closest to values.
 
+        All values are searched at once, in a vectorized manner.
+
         :param loc: [opt] {'closest', 'below', 'above'}
+        :returns: Array of integer indices.
+        """
+        loc_ = {'below': 'left',
+                'above': 'right',
+                'closest': 'closest'}[loc]
+        values = np.asarray(values, dtype=np.float64)
+
+        if self._regular is not None:
+            indices = self._get_indices_regular(values, loc_)
+        else:
+            C = self._values
+            if self._descending:
+                C = C[::-1]
+            indices = get_closest_array(C, values, loc_)
+            if self._descending:
+                indices = self.size-1 - indices
+
+        return np.asarray(indices, dtype=np.int64)
+
+    def _get_indices_regular(self, values: np.ndarray,
+                             loc: str = 'closest') -> np.ndarray:
+        """Return indices closest to values for a regular coordinate.
+
+        Computed arithmetically, works as :func:`get_closest`.
+
+        :param values: Array of values, or a scalar.
+        :param loc: {'closest', 'left', 'right'}
         """
-        indices = [self.get_index(v, loc) for v in values]
-        return indices
+        start, step = self._regular
+        n = self.size
+        if step < 0:
+            start, step = start + step*(n-1), -step
+
+        # Scalars are faster without numpy
+        if np.ndim(values) == 0:
+            pos = (float(values) - start) / step
+            exact = abs(pos - round(pos)) * step < self.float_comparison
+            if exact:
+                pos = round(pos)
+            # Same as bisect_left
+            right = min(max(math.ceil(pos), 0), n)
+            if right == 0:
+                idx = 0
+            elif right == n:
+                idx = n-1
+            elif loc == 'closest':
+                idx = right-1 if pos - (right-1) <= right - pos else right
+            elif loc == 'left':
+                idx = right if exact else right-1
+            else:
+                idx = right
+        else:
+            pos = (np.asarray(values, dtype=np.float64) - start) / step
+            rounded = np.round(pos)
+            exact = np.abs(pos - rounded) * step < self.float_comparison
+            pos = np.where(exact, rounded, pos)
+            right = np.clip(np.ceil(pos), 0, n).astype(int)
+
+            if loc == 'closest':
+                idx = np.where(pos - (right-1) <= right - pos, right-1, right)
+            elif loc == 'left':
+                idx = np.where(exact, right, right-1)
+            else:
+                idx = right
+            idx = np.where(right == 0, 0, np.where(right == n, n-1, idx))
+
+        if self._regular[1] < 0:
+            idx = n-1 - idx
+        return idx
 
     def get_index_exact(self, value: float) -> Optional[int]:
         """Return index of value if present in coordinate.
 
         None if value is not present.
         """
+        if self._regular is not None:
+            start, step = self._regular
+            idx = int(round((value - start) / step))
+            if (0 <= idx < self.size
+                    and abs(start + step*idx - value) < self.float_comparison):
+                return idx
+            return None
+
         idx = np.where(np.abs(self._array - value) < self.float_comparison)[0]
         if len(idx) == 0:
             return None
@@ -373,3 +569,43 @@ def get_closest(L: List[float], elt: float, loc: str = 'closest') -> int:
         out = pos
 
     return out
+
+
+def get_closest_array(L: np.ndarray, elts: np.ndarray,
+                      loc: str = 'closest') -> np.ndarray:
+    """Return indices closest to each of `elts` in `L`.
+
+    Vectorized version of :func:`get_closest`, using a binary search
+    (`numpy.searchsorted`).
+
+    :param L: Ascending sorted array. Can be a view with
+        a negative stride.
+    :param elts: Values to search.
+    :param loc:
+        'closest' -> take closest elt,
+        'left' -> take closest to the left,
+        'right' -> take closest to the right,
+
+    :raises TypeError: If loc is invalid.
+    """
+    loc_opt = ['left', 'right', 'closest']
+    if loc not in loc_opt:
+        raise TypeError("Invalid loc type."
+                        " Expected one of: 'left', 'right', 'closest'")
+
+    n = len(L)
+    pos = np.searchsorted(L, elts, side='left')
+    if n == 1:
+        return np.zeros_like(pos)
+
+    # Indices safe for comparisons, edges are dealt with after
+    inner = np.clip(pos, 1, n-1)
+    if loc == 'closest':
+        out = np.where(elts - L[inner-1] <= L[inner] - elts, inner-1, inner)
+    elif loc == 'left':
+        out = np.where(L[inner] == elts, inner, inner-1)
+    else:
+        out = pos
+
+    out = np.where(pos == 0, 0, np.where(pos == n, n-1, out))
+    return out
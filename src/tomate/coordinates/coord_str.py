@@ -15,7 +15,16 @@ from tomate.custom_types import KeyLike
 
 
 class CoordStr(Coord):
-    """Coordinate with string values."""
+    """Coordinate with string values.
+
+    The index of each value is stored in a dictionnary, so that
+    finding values is done in constant time.
+    If a value is present multiple times, its first index is kept.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._index = {}
+        super().__init__(*args, **kwargs)
 
     def update_values(self, values: Union[str, Sequence[str]], dtype=None):
         """Change values.
@@ -28,6 +37,17 @@ class CoordStr(Coord):
             values = [values]
         self._array = np.array(values, dtype=dtype)
         self._size = self._array.size
+        self._set_index()
+
+    def _set_index(self):
+        """Store index of values."""
+        self._index = {}
+        for i, value in enumerate(self._array.tolist()):
+            self._index.setdefault(value, i)
+
+    def empty(self):
+        super().empty()
+        self._index = {}
 
     def __repr__(self):
         s = [super().__str__()]
@@ -47,16 +67,26 @@ class CoordStr(Coord):
 
         :param y: Name or index of value.
         """
-        if isinstance(y, int):
-            return y
+        if isinstance(y, (int, np.integer)):
+            return int(y)
         return self.get_index(y)
 
     def get_index(self, value: str, loc: str = None) -> int:
-        if value not in self._array:
+        try:
+            return self._index[value]
+        except KeyError:
             raise KeyError(f"'{value}' not in coordinate '{self.name}'.")
-        i = np.where(self._array == value)[0][0]
-        i = int(i)
-        return i
+
+    def get_indices(self, values: Sequence[str],
+                    loc: str = None) -> np.ndarray:
+        """Return indices of values.
+
+        :returns: Array of integer indices.
+        :raises KeyError: If a value is not in the coordinate.
+        """
+        if isinstance(values, str):
+            values = [values]
+        return np.array([self.get_index(v) for v in values], dtype=np.int64)
 
     def get_index_exact(self, value: str) -> Optional[int]:
         try:
@@ -79,7 +109,7 @@ class CoordStr(Coord):
         :returns: List of values indices, or a single value index,
             depending on key size.
         """
-        if isinstance(y, (int, str)):
+        if isinstance(y, (int, np.integer, str)):
             return self.get_str_index(y)
 
         if isinstance(y, slice):
@@ -89,10 +119,18 @@ class CoordStr(Coord):
             if isinstance(stop, str):
                 stop = self.get_str_index(stop)
             y = slice(start, stop, y.step)
-            y = list(range(*y.indices(self.size)))
+            return list(range(*y.indices(self.size)))
 
-        indices = [self.get_str_index(i) for i in y]
-        return indices
+        if isinstance(y, np.ndarray) and y.dtype.kind in 'iu':
+            return y.tolist()
+
+        index = self._index
+        try:
+            return [index[i] if isinstance(i, str) else int(i) for i in y]
+        except KeyError as e:
+            # Raise with the proper message
+            self.get_index(e.args[0])
+            raise
 
     def get_str_names(self, y: KeyLike) -> Union[str, List[str]]:
         """Return values names.
@@ -103,7 +141,7 @@ class CoordStr(Coord):
         idx = self.get_str_indices(y)
         if isinstance(idx, int):
             return self._array[idx]
-        names = [self._array[i] for i in idx]
+        names = self._array[idx].tolist()
         return names
 
     def __getitem__(self, y: KeyLike) -> str:
@@ -121,16 +159,26 @@ class CoordStr(Coord):
             var = []
         return iter(var)
 
+    def __contains__(self, value: str) -> bool:
+        return value in self._index
+
     def append(self, var: str):
         """Add value."""
-        values = list(self[:]) + [var]
-        self.update_values(values)
+        if not self.has_data():
+            self.update_values([var])
+            return
+        self._array = np.append(self._array, var)
+        self._index.setdefault(var, self._size)
+        self._size = self._array.size
 
     def remove(self, var: str):
-        """Remove value."""
-        values = list(self[:])
-        values.remove(var)
-        self.update_values(values)
+        """Remove value.
+
+        :raises ValueError: If value is not present.
+        """
+        if var not in self._index:
+            raise ValueError(f"'{var}' not in coordinate '{self.name}'.")
+        self.update_values(np.delete(self._array, self._index[var]))
 
     @staticmethod
     def format(value: str, fmt: str = '{:s}') -> str:
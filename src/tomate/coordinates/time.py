@@ -9,9 +9,12 @@ Use user settings to set locales.
 # at the root of this project. © 2020 Clément HAËCK
 
 
+from datetime import datetime
 import locale
 import logging
-from typing import List, Sequence, Union, Tuple
+from typing import Dict, List, Sequence, Union, Tuple
+
+import numpy as np
 
 try:
     import cftime
@@ -21,6 +24,7 @@ else:
     _has_cftime = True
 
 from tomate.coordinates.coord import Coord
+import tomate.coordinates.time_conversion as tconv
 from tomate.custom_types import KeyLike
 
 
@@ -33,22 +37,31 @@ class Time(Coord):
 
     Values are stored as floats, and can be converted
     to datetime objects.
-    All conversion are done with the cftime package.
-    The standard CF calendar is used. Using a different
-    calendar is not presently supported, but can be implemented.
+    Conversions are done with numpy datetime64 for the standard and
+    proleptic gregorian calendars, and with the cftime package otherwise
+    (see :mod:`tomate.coordinates.time_conversion`).
+    The standard CF calendar is used by default.
     This coordinate needs units, which must  be CF compliant.
     See `<http://cfconventions.org>`__.
 
     Use user settings to set locales.
 
+    Calendar fields (year, month, day, ...) of the values are computed
+    when first needed, and kept until values change.
+
     :attr units: str: CF-compliant time units.
     :attr calendar: str: CF-compliant calendar. Defaults to 'standard'.
     """
+
+    FIELDS = ['year', 'month', 'day', 'dayofyr']
+    """Calendar fields available in :attr:`calendar_fields`."""
+
     def __init__(self, name: str = 'time', array: Sequence = None,
                  units: str = None, fullname: str = None,
                  calendar: str = 'standard'):
         if not _has_cftime:
             raise ImportError("cftime package necessary for using Time coordinate.")
+        self._fields = None
         super().__init__(name, array, units=units, fullname=fullname)
         if self.units == '':
             raise ValueError("Time coordinate must be supplied"
@@ -56,11 +69,80 @@ class Time(Coord):
 
         self.calendar = calendar
 
+    def copy(self) -> 'Time':
+        new = super().copy()
+        new.calendar = self.calendar
+        return new
+
+    def update_values(self, values: Sequence, dtype=None):
+        self._fields = None
+        super().update_values(values, dtype=dtype)
+
+    def set_regular(self, start: float, step: float, size: int):
+        self._fields = None
+        super().set_regular(start, step, size)
+
+    def empty(self):
+        self._fields = None
+        super().empty()
+
+    def slice(self, key: KeyLike):
+        fields = self._fields
+        super().slice(key)
+        if fields is not None:
+            if key is None:
+                key = slice(None)
+            self._fields = (fields[0], {name: np.atleast_1d(f[key])
+                                        for name, f in fields[1].items()})
+
+    @property
+    def calendar_fields(self) -> Dict[str, np.ndarray]:
+        """Calendar fields of values.
+
+        Dictionnary of integer arrays, for each field in :attr:`FIELDS`.
+        Computed once, and reset when values are changed.
+        """
+        key = (self.units, self.calendar)
+        if self._fields is None or self._fields[0] != key:
+            self._fields = (key, self.get_calendar_fields(self[:]))
+        return self._fields[1]
+
+    def get_calendar_fields(self, values: Sequence[float]) -> Dict[str, np.ndarray]:
+        """Return calendar fields of timestamps.
+
+        :param values: Timestamps in the coordinate units.
+        :returns: Integer array for each field in :attr:`FIELDS`.
+        """
+        return tconv.get_calendar_fields(values, self.units, self.calendar,
+                                         self.FIELDS)
+
+    def get_days(self, values: Sequence[float] = None) -> np.ndarray:
+        """Return an integer identifying the day of timestamps.
+
+        It increases with dates.
+
+        :param values: [opt] Timestamps in the coordinate units. If None,
+            use coordinate values (from the cached calendar fields).
+        """
+        if values is None:
+            fields = self.calendar_fields
+        else:
+            fields = self.get_calendar_fields(values)
+        return (fields['year']*12 + fields['month'])*32 + fields['day']
+
+    def get_months(self) -> np.ndarray:
+        """Return an integer identifying the month of values.
+
+        It increases with dates.
+        """
+        fields = self.calendar_fields
+        return fields['year']*12 + fields['month']
+
     def get_extent_str(self, slc: KeyLike = None) -> str:
         if self.size == 1:
             return self.format(self.index2date(0))
-        return "{} - {}".format(*[self.format(v)
-                                  for v in self.index2date(slc)[[0, -1]]])
+        dates = tconv.num2date(self.get_extent(slc), self.units, self.calendar)
+        return "{} - {}".format(*[self.format(v) for v in dates])
 
     def index2date(self, indices: KeyLike = None,
                    pydate: bool = False) -> Union['cftime.datetime',
@@ -75,19 +157,14 @@ class Time(Coord):
         if indices is None:
             indices = slice(None, None)
 
-        if pydate:
-            dates = cftime.num2pydate(self[indices], self.units, self.calendar)
-        else:
-            dates = cftime.num2date(self[indices], self.units, self.calendar)
-        return dates
+        return tconv.num2date(self[indices], self.units, self.calendar,
+                              pydate=pydate)
 
     @staticmethod
     def change_units_other(values: Sequence[float], old: str, new: str,
                            calendar: str = 'standard'):
         """Change time units."""
-        dates = cftime.num2date(values, old, calendar)
-        values = cftime.date2num(dates, new, calendar)
-        return values
+        return tconv.change_units(values, old, new, calendar)
 
     def get_index(self, value: Union['cftime.datetime',
                                      Tuple[Union[int]], float],
@@ -101,12 +178,50 @@ class Time(Coord):
         :param loc: {'closest', 'below', 'above'}
             Works as for Coord.get_index.
         """
-        if isinstance(value, (list, tuple)):
-            value = cftime.datetime(*value, calendar=self.calendar)
-        if isinstance(value, cftime.datetime):
-            value = cftime.date2num(value, self.units, self.calendar)
+        if isinstance(value, (list, tuple, cftime.datetime, datetime)):
+            value = tconv.date2num([value], self.units, self.calendar)[0]
         return super().get_index(value, loc)
 
+    def get_indices(self, values: Sequence[Union['cftime.datetime',
+                                                 Tuple[Union[int]], float]],
+                    loc: str = 'closest') -> np.ndarray:
+        """Return indices of values.
+
+        Dates are converted all at once.
+
+        :param values: Time values, can be timestamps corresponding to
+            self units, datetime objects, or lists of values that
+            can be transformed to date.
+        :param loc: {'closest', 'below', 'above'}
+            Works as for Coord.get_indices.
+        """
+        return super().get_indices(self.dates2num(values), loc)
+
+    def dates2num(self, values: Sequence[Union['cftime.datetime',
+                                               Tuple[Union[int]], float]]
+                  ) -> np.ndarray:
+        """Convert multiple time values to timestamps.
+
+        Dates are converted all at once.
+
+        :param values: Time values, can be timestamps corresponding to
+            self units, datetime objects, or lists of values that
+            can be transformed to date.
+        :returns: Array of timestamps in the coordinate units.
+        """
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'iuf':
+            return values
+        is_date = np.array([isinstance(v, (list, tuple, cftime.datetime,
+                                           datetime))
+                            for v in values], dtype=bool)
+        num = np.zeros(len(values))
+        if np.any(is_date):
+            num[is_date] = tconv.date2num(
+                [v for v, d in zip(values, is_date) if d],
+                self.units, self.calendar)
+        num[~is_date] = [v for v, d in zip(values, is_date) if not d]
+        return num
+
     def get_index_by_day(self, value: Union['cftime.datetime',
                                             Tuple[Union[int, float]],
                                             float, int],
@@ -117,48 +232,44 @@ class Time(Coord):
             specified loc.
         :raises TypeError: If `loc` is not valid.
         """
-        if isinstance(value, (list, tuple)):
-            value = cftime.datetime(*value, calendar=self.calendar)
-        if isinstance(value, cftime.datetime):
-            value = cftime.date2num(value, self.units, self.calendar)
-
-        date = to_date(cftime.num2date(value, self.units, self.calendar))
-        if loc == 'below':
-            idx = self.get_index(value, loc=loc)
-            if to_date(self.index2date(idx)) != date:
-                raise IndexError("No timestamp below on same day.")
-            return idx
-        if loc == 'above':
-            idx = self.get_index(value, loc=loc)
-            if to_date(self.index2date(idx)) != date:
-                raise IndexError("No timestamp above on same day.")
-            return idx
-        if loc == 'closest':
-            lo = self.get_index(value, loc='below')
-            hi = self.get_index(value, loc='above')
-            same_day = [to_date(self.index2date(idx)) == date
-                        for idx in [lo, hi]]
-            if all(same_day):
-                if (self[hi] - value) < (value - self[lo]):
-                    return hi
-                return lo
-            if same_day[0]:
-                return lo
-            if same_day[1]:
-                return hi
-            raise IndexError("No timestamp on same day.")
-
-        raise TypeError("Invalid loc type."
-                        " Expected one of: 'left', 'right', 'closest'")
+        if isinstance(value, (list, tuple, cftime.datetime, datetime)):
+            value = tconv.date2num([value], self.units, self.calendar)[0]
+        return int(self.get_indices_by_day([value], loc)[0])
 
     def get_indices_by_day(self, values: Sequence[float],
-                           loc: str = 'closest') -> List[int]:
+                           loc: str = 'closest') -> np.ndarray:
         """Return indices of the elements closest to values.
 
         Selection indices only on the same day as values.
+        All values are searched at once.
+
+        :param values: Time values, as for :func:`get_indices`.
+        :returns: Array of integer indices.
+        :raises IndexError: If no timestamp is found on the same day with
+            specified loc, for any of the values.
+        :raises TypeError: If `loc` is not valid.
         """
-        indices = [self.get_index_by_day(v, loc) for v in values]
-        return indices
+        if loc not in ['below', 'above', 'closest']:
+            raise TypeError("Invalid loc type."
+                            " Expected one of: 'below', 'above', 'closest'")
+        values = self.dates2num(values)
+        target = self.get_days(values)
+        days = self.get_days()
+
+        if loc in ['below', 'above']:
+            indices = self.get_indices(values, loc=loc)
+            if np.any(days[indices] != target):
+                raise IndexError("No timestamp {} on same day.".format(loc))
+            return indices
+
+        lo = self.get_indices(values, loc='below')
+        hi = self.get_indices(values, loc='above')
+        same_lo = days[lo] == target
+        same_hi = days[hi] == target
+        if not np.all(same_lo | same_hi):
+            raise IndexError("No timestamp on same day.")
+        hi_closer = (self[hi] - values) < (values - self[lo])
+        return np.where(same_hi & (hi_closer | ~same_lo), hi, lo)
 
     def subset_by_day(self,
                       dmin: Union['cftime.datetime', List[int],
@@ -194,11 +305,13 @@ class Time(Coord):
                 except IndexError:
                     idx = self.get_index(date, loc=loc)
 
+                # Go to the first or last timestamp of the day
                 inv = {'above': 1, 'below': -1}[loc]
-                while ((idx < self.size-1 if inv == 1 else idx > 0)
-                       and to_date(self.index2date(idx))
-                       == to_date(self.index2date(idx+inv))):
-                    idx += inv
+                days = self.get_days()
+                if inv == 1:
+                    idx = int(np.searchsorted(days, days[idx], 'right')) - 1
+                else:
+                    idx = int(np.searchsorted(days, days[idx], 'left'))
                 if exclude:
                     idx += inv
             indices.append(idx)
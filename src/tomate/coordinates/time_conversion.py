@@ -0,0 +1,266 @@
+"""Fast conversion of timestamps.
+
+For the standard and proleptic gregorian calendars, timestamps are
+converted using numpy datetime64 arithmetic, which is exact
+(to the microsecond) and vectorized.
+CF units are parsed once.
+Other calendars, or dates outside of the supported range (before the
+gregorian reform of 1582-10-15, or after year 9999), fall back to cftime.
+
+Functions of the form `x2y` return None if the fast path cannot be used.
+"""
+
+# This file is part of the 'tomate' project
+# (http://github.com/Descanonge/tomate) and subject
+# to the MIT License as defined in the file 'LICENSE',
+# at the root of this project. © 2020 Clément HAËCK
+
+
+from datetime import datetime
+import functools
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import cftime
+except ImportError:
+    _has_cftime = False
+else:
+    _has_cftime = True
+
+
+FAST_CALENDARS = ['standard', 'gregorian', 'proleptic_gregorian']
+"""Calendars supported by the fast path."""
+
+DATE_MIN = np.datetime64('1582-10-15', 'us')
+"""First date supported by the fast path."""
+DATE_MAX = np.datetime64('10000-01-01', 'us')
+"""Upper bound (excluded) of dates supported by the fast path."""
+
+UNITS_STEPS = {
+    **dict.fromkeys(['days', 'day', 'd'], 86400 * 10**6),
+    **dict.fromkeys(['hours', 'hour', 'hrs', 'hr', 'h'], 3600 * 10**6),
+    **dict.fromkeys(['minutes', 'minute', 'mins', 'min'], 60 * 10**6),
+    **dict.fromkeys(['seconds', 'second', 'secs', 'sec', 's'], 10**6),
+    **dict.fromkeys(['milliseconds', 'millisecond', 'msecs', 'msec', 'ms'],
+                    10**3),
+    **dict.fromkeys(['microseconds', 'microsecond', 'usecs', 'usec', 'us'], 1),
+}
+"""Length of time units, in microseconds."""
+
+
+@functools.lru_cache(maxsize=128)
+def parse_units(units: str,
+                calendar: str) -> Optional[Tuple[int, np.datetime64]]:
+    """Parse CF time units.
+
+    :returns: Length of the units in microseconds, and reference date.
+        None if units or calendar are not supported by the fast path.
+    """
+    if not _has_cftime or calendar not in FAST_CALENDARS:
+        return None
+    parts = units.lower().split(' since ')
+    if len(parts) != 2:
+        return None
+    step = UNITS_STEPS.get(parts[0].strip())
+    if step is None:
+        return None
+
+    try:
+        # cftime deals with the many formats of the reference date
+        ref = cftime.num2date(0, units, calendar)
+    except Exception:
+        return None
+    ref = fields2datetime64([ref])
+    if ref is None:
+        return None
+    return step, ref[0]
+
+
+def fields2datetime64(dates: Sequence[Any]) -> Optional[np.ndarray]:
+    """Convert dates to datetime64.
+
+    :param dates: Tuples of (year, month, day[, hour, ...]), or date
+        objects with these fields (datetime or cftime objects in a
+        calendar supported by the fast path).
+    :returns: Array of datetime64 (microsecond precision), or None if a date
+        is not supported.
+    """
+    pydates = []
+    for d in dates:
+        if isinstance(d, (list, tuple)):
+            args = d
+        else:
+            calendar = getattr(d, 'calendar', 'standard')
+            if calendar not in FAST_CALENDARS:
+                return None
+            args = (d.year, d.month, d.day, d.hour, d.minute,
+                    d.second, d.microsecond)
+        try:
+            pydates.append(datetime(*args))
+        except (TypeError, ValueError):
+            return None
+    out = np.array(pydates, dtype='datetime64[us]')
+    if not _in_range(out):
+        return None
+    return out
+
+
+def num2datetime64(values: Sequence[float], units: str,
+                   calendar: str) -> Optional[np.ndarray]:
+    """Convert timestamps to datetime64.
+
+    Values are rounded to the microsecond exactly as cftime does: floats
+    are scaled in extended precision, rounded to the nearest
+    microsecond, and snapped to the second when a microsecond away from
+    it.
+
+    :returns: Array of datetime64 (microsecond precision),
+        None if the fast path does not apply.
+    """
+    parsed = parse_units(units, calendar)
+    if parsed is None:
+        return None
+    step, ref = parsed
+    values = np.asarray(values)
+    if not np.all(np.abs(values.astype('f8')) * step < 2.**62):
+        return None
+    if values.dtype.kind in 'iub':
+        offsets = values.astype(np.int64) * step
+    else:
+        scaled = values.astype(np.longdouble) * step
+        offsets = np.rint(scaled).astype(np.int64)
+        if step >= 10**6:
+            remainder = offsets % 10**6
+            for value, func in [(1, np.floor), (999999, np.ceil)]:
+                idx = np.flatnonzero(remainder == value)
+                offsets.flat[idx] = func(scaled.flat[idx])
+    dates = ref + offsets.astype('timedelta64[us]')
+    if not _in_range(dates):
+        return None
+    return dates
+
+
+def datetime642num(dates: np.ndarray, units: str,
+                   calendar: str) -> Optional[np.ndarray]:
+    """Convert datetime64 to timestamps.
+
+    :returns: Array of timestamps, None if the fast path does not apply.
+    """
+    parsed = parse_units(units, calendar)
+    if parsed is None:
+        return None
+    step, ref = parsed
+    dates = np.asarray(dates).astype('datetime64[us]')
+    if not _in_range(dates):
+        return None
+    return (dates - ref).astype(np.int64) / step
+
+
+def datetime642fields(dates: np.ndarray,
+                      fields: List[str]) -> Optional[Dict[str, np.ndarray]]:
+    """Return calendar fields of datetime64.
+
+    :param fields: Fields to compute, among 'year', 'month', 'day',
+        'dayofyr', 'hour', 'minute', 'second', and 'microsecond'.
+    :returns: Integer array for each field, None if a field is not supported.
+    """
+    if any(f not in _FIELDS_FUNCS for f in fields):
+        return None
+    dates = np.asarray(dates).astype('datetime64[us]')
+    return {f: _FIELDS_FUNCS[f](dates).astype(np.int64) for f in fields}
+
+
+def num2date(values: Sequence[float], units: str, calendar: str = 'standard',
+             pydate: bool = False):
+    """Convert timestamps to dates.
+
+    :param pydate: If True, return datetime.datetime objects, rather than
+        cftime objects.
+    :returns: Date, or array of dates, as cftime.num2date would.
+    """
+    if pydate:
+        dates = num2datetime64(values, units, calendar)
+        if dates is not None:
+            dates = np.asarray(dates).astype(object)
+            return dates.item() if dates.ndim == 0 else dates
+        return cftime.num2pydate(values, units, calendar)
+    return cftime.num2date(values, units, calendar)
+
+
+def date2num(dates: Sequence[Any], units: str,
+             calendar: str = 'standard') -> np.ndarray:
+    """Convert dates to timestamps.
+
+    :param dates: Tuples of (year, month, day[, hour, ...]), or
+        date objects.
+    :returns: Array of timestamps.
+    """
+    dates64 = fields2datetime64(dates)
+    if dates64 is not None:
+        num = datetime642num(dates64, units, calendar)
+        if num is not None:
+            return num
+    dates = [cftime.datetime(*d, calendar=calendar)
+             if isinstance(d, (list, tuple)) else d
+             for d in dates]
+    return np.asarray(cftime.date2num(dates, units, calendar), dtype='f8')
+
+
+def change_units(values: Sequence[float], old: str, new: str,
+                 calendar: str = 'standard') -> np.ndarray:
+    """Change time units of timestamps."""
+    dates = num2datetime64(values, old, calendar)
+    if dates is not None:
+        num = datetime642num(dates, new, calendar)
+        if num is not None:
+            return num
+    dates = cftime.num2date(values, old, calendar)
+    return cftime.date2num(dates, new, calendar)
+
+
+def get_calendar_fields(values: Sequence[float], units: str, calendar: str,
+                        fields: List[str]) -> Dict[str, np.ndarray]:
+    """Return calendar fields of timestamps.
+
+    :param fields: Fields to compute, attributes of cftime objects.
+    :returns: 1D integer array for each field.
+    """
+    values = np.atleast_1d(values)
+    dates = num2datetime64(values, units, calendar)
+    if dates is not None:
+        out = datetime642fields(dates, fields)
+        if out is not None:
+            return out
+
+    dates = cftime.num2date(values, units, calendar)
+    out = np.array([[getattr(d, f) for f in fields] for d in dates],
+                   dtype=np.int64)
+    out = out.reshape(-1, len(fields))
+    return {name: out[:, i] for i, name in enumerate(fields)}
+
+
+def _in_range(dates: np.ndarray) -> bool:
+    """Check dates are supported by the fast path."""
+    if dates.size == 0:
+        return True
+    return bool(dates.min() >= DATE_MIN and dates.max() < DATE_MAX)
+
+
+def _units_since(dates: np.ndarray, units: str, origin: str) -> np.ndarray:
+    """Return number of `units` since `origin` units (truncated)."""
+    return (dates.astype('datetime64[{}]'.format(units))
+            - dates.astype('datetime64[{}]'.format(origin))).astype(np.int64)
+
+
+_FIELDS_FUNCS = {
+    'year': lambda d: d.astype('datetime64[Y]').astype(np.int64) + 1970,
+    'month': lambda d: d.astype('datetime64[M]').astype(np.int64) % 12 + 1,
+    'day': lambda d: _units_since(d, 'D', 'M') + 1,
+    'dayofyr': lambda d: _units_since(d, 'D', 'Y') + 1,
+    'hour': lambda d: _units_since(d, 'h', 'D'),
+    'minute': lambda d: _units_since(d, 'm', 'h'),
+    'second': lambda d: _units_since(d, 's', 'm'),
+    'microsecond': lambda d: _units_since(d, 'us', 's'),
+}
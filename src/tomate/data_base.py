@@ -8,9 +8,11 @@
 import logging
 from typing import Any, Dict, List, Tuple, Type, Union, TYPE_CHECKING
 
+from tomate.compiled_view import CompiledView
 from tomate.coordinates.coord import Coord
 from tomate.coordinates.variables import Variables
 from tomate.custom_types import Array, KeyLike, KeyLikeValue
+from tomate.keys.key import Key
 from tomate.keys.keyring import Keyring
 from tomate.scope import Scope
 from tomate.variable_base import Variable
@@ -154,19 +156,16 @@ class DataBase():
         """
         self.variables[key].set_data(value, Keyring())
 
-    def __getattribute__(self, name: str):
-        """Get attribute.
+    def __getattr__(self, name: str):
+        """Get coordinate from current scope.
 
-        If `name` is a coordinate name, return coordinate from
-        current scope.
+        Only called if `name` is not found as a normal attribute,
+        so that normal attributes access is not slowed down.
         """
-        if name in super().__getattribute__('dims'):
-            if not self.loaded.is_empty():
-                scope = super().__getattribute__('loaded')
-            else:
-                scope = super().__getattribute__('avail')
-            return scope[name]
-        return super().__getattribute__(name)
+        if name in self.__dict__.get('dims', []):
+            return self.scope[name]
+        raise AttributeError("'{}' object has no attribute '{}'"
+                             .format(self.__class__.__name__, name))
 
     @property
     def scope(self) -> Scope:
@@ -226,26 +225,7 @@ class DataBase():
         keyring.make_idx_str(var=self.loaded.var)
 
         variables = [self.variables[var] for var in keyring['var']]
-        dims = [[d for d in self.variables[var].dims
-                 if d in keyring.get_non_zeros()]
-                for var in keyring['var']]
-
-        if stack and len(variables) > 1:
-            if not all(v in self.loaded.var for v in keyring['var']):
-                raise RuntimeError("Cannot stack variables"
-                                   " (variable not loaded)")
-            if (stack != 'force'
-                and not all(v.datatype == variables[0].datatype
-                            for v in variables[1:])):
-                raise RuntimeError("Cannot stack variables"
-                                   " (different datatypes)")
-            if (order is None and not all(d == dims[0] for d in dims[1:])):
-                raise RuntimeError("Cannot stack variables (different "
-                                   "dimensions or order not specified)")
-            if (order is not None and not all(set(d) == set(dims[0])
-                                              for d in dims[1:])):
-                raise RuntimeError("Cannot stack variables"
-                                   " (different dimensions)")
+        self._check_stack(keyring, stack, order)
 
         if order is not None:
             order_novar = [d for d in order if d != 'var']
@@ -265,6 +245,88 @@ class DataBase():
 
         return out
 
+    def _check_stack(self, keyring: Keyring, stack: Union[str, bool] = None,
+                     order: List[str] = None):
+        """Check if variables can be stacked.
+
+        :param keyring: Full keyring, with indices for variables.
+        :raises RuntimeError: If the user ask for an impossible stack.
+        """
+        if not stack or keyring['var'].size <= 1:
+            return
+
+        variables = [self.variables[var] for var in keyring['var']]
+        dims = [[d for d in var.dims if d in keyring.get_non_zeros()]
+                for var in variables]
+
+        if not all(v in self.loaded.var for v in keyring['var']):
+            raise RuntimeError("Cannot stack variables"
+                               " (variable not loaded)")
+        if (stack != 'force'
+            and not all(v.datatype == variables[0].datatype
+                        for v in variables[1:])):
+            raise RuntimeError("Cannot stack variables"
+                               " (different datatypes)")
+        if (order is None and not all(d == dims[0] for d in dims[1:])):
+            raise RuntimeError("Cannot stack variables (different "
+                               "dimensions or order not specified)")
+        if (order is not None and not all(set(d) == set(dims[0])
+                                          for d in dims[1:])):
+            raise RuntimeError("Cannot stack variables"
+                               " (different dimensions)")
+
+    def compile_view(self, *keys: KeyLike, keyring: Keyring = None,
+                     along: str = None, stack: Union[str, bool] = None,
+                     order: List[str] = None,
+                     **kw_keys: KeyLike) -> CompiledView:
+        """Return a reusable view of loaded data.
+
+        Keys are processed only once, calling the returned object is
+        then equivalent to :func:`view`, with less overhead.
+        One dimension can be left free, and indexed at each call.
+        This is useful when repeatedly viewing the same part of data,
+        for instance for each time step in an animation.
+
+        Arguments are the same as for :func:`view`.
+
+        :param along: [opt] Dimension to leave free. The view can then
+            be pointed to any index of that dimension (in the loaded scope),
+            which is squeezed. The initial index is given by the key
+            for that dimension, or 0.
+
+        :raises RuntimeError: If the user ask for an impossible stack
+        :raises TypeError: If the key for `along` is not an integer.
+
+        Examples
+        --------
+        >>> cview = db.compile_view('SST', along='time', lat=slice(0, 50))
+        >>> for i in range(db.loaded.time.size):
+        ...     frame = cview(i)
+
+        See also
+        --------
+        tomate.compiled_view.CompiledView
+        """
+        self.check_loaded()
+        kw_keys = self.get_kw_keys(*keys, **kw_keys)
+        if along is not None:
+            index = kw_keys.get(along, 0)
+            if keyring is not None and along not in kw_keys and along in keyring:
+                index = keyring[along].value
+            if not isinstance(index, Key.INT_TYPES):
+                raise TypeError("Key for free dimension '{}' must be an "
+                                "integer (is {})".format(along, index))
+            kw_keys[along] = int(index)
+
+        keyring = Keyring.get_default(keyring, **kw_keys)
+        keyring.make_full(self.dims)
+        keyring.make_total()
+        keyring.make_idx_str(var=self.loaded.var)
+        self._check_stack(keyring, stack, order)
+
+        return CompiledView(self, keyring, along=along, stack=stack,
+                            order=order)
+
     def view_by_value(self, *keys: KeyLike, by_day: bool = False,
                       stack: Union[str, bool] = None, order: List[str] = None,
                       **kw_keys: KeyLike) -> Union[Array, Tuple[Array]]:
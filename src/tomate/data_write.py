@@ -193,7 +193,8 @@ def serialize_coord_scan(cs):
 
 
 def serialize_vi(vi):
-    top = {"attrs": vi._attrs,
+    attrs = {attr: getattr(vi, attr) for attr in vi.attributes}
+    top = {"attrs": attrs,
            "infos": vi._infos}
     return top
 
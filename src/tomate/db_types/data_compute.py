@@ -9,15 +9,21 @@ All functions were not thoroughly tested, use with caution.
 # at the root of this project. © 2020 Clément HAËCK
 
 
-from typing import Any, Callable, Dict, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
 import logging
 
 import numpy as np
 
+from tomate.coordinates.coord import Coord
+from tomate.coordinates.time import Time
 from tomate.custom_types import Array, KeyLike
 from tomate.data_base import DataBase
+from tomate.db_types.data_disk import DataDisk
 from tomate.keys.keyring import Keyring
-from tomate.var_types.variable_masked import VariableMasked
+from tomate.var_types.variable_masked import (VariableMasked, get_valid,
+                                              reduce_masked)
 
 log = logging.getLogger(__name__)
 
@@ -30,12 +36,59 @@ class DataCompute(DataBase):
     See :class:`DataBase` for more information.
     """
 
-    def histogram(self, variable, bins=None, bounds=None,
+    def histogram(self, variable, bins=10, bounds=None,
                   density=False, **keys) -> Tuple[np.ndarray]:
-        """Compute histogram."""
-        data = self.view(variable, **keys).compressed()
-        return np.histogram(data, bins=bins, range=bounds,
-                            density=density)
+        """Compute histogram.
+
+        Masked and NaN values are ignored.
+        If the bin edges are fixed (`bins` is a sequence, or `bounds`
+        is given), a :class:`HistogramAccumulator` is used, which
+        avoids a copy of the valid values.
+
+        :param bins: [opt] Number of bins, or bin edges.
+        :param bounds: [opt] Range of the bins.
+        :param density: [opt] If True, return the probability density.
+        :returns: Histogram and bin edges, as numpy.histogram.
+        """
+        data = self.view(variable, **keys)
+        if bounds is None and np.ndim(bins) == 0:
+            data = np.ma.getdata(data)[get_valid(data)]
+            return np.histogram(data, bins=bins, density=density)
+
+        hist = HistogramAccumulator(bins, bounds)
+        hist.add(data)
+        return hist.get(density), hist.edges
+
+    def histogram_disk(self, variable: str, bins: Union[int, Sequence[float]],
+                       bounds: Tuple[float, float] = None,
+                       density: bool = False, along: str = 'time',
+                       size: int = 12, **keys: KeyLike) -> Tuple[np.ndarray]:
+        """Compute histogram over data on disk, chunk by chunk.
+
+        Data is loaded by slices of the `along` dimension (see
+        :func:`iter_load<tomate.db_types.data_disk.DataDisk.iter_load>`),
+        and accumulated in a :class:`HistogramAccumulator`.
+        Data previously loaded is lost, and the database is unloaded
+        at the end.
+
+        :param bins: Number of bins, or bin edges.
+        :param bounds: Range of the bins. Necessary if `bins`
+            is a number.
+        :param density: [opt] If True, return the probability density.
+        :param along: [opt] Dimension to iterate along.
+        :param size: [opt] Maximum size of chunks along `along`.
+        :param keys: [opt] Part of the data. Keys act on the available scope.
+        :returns: Histogram and bin edges, as numpy.histogram.
+        :raises TypeError: If the database is not a DataDisk.
+        """
+        if not isinstance(self, DataDisk):
+            raise TypeError("Database must be a subclass of DataDisk to"
+                            " compute on data on disk.")
+        hist = HistogramAccumulator(bins, bounds)
+        keys['var'] = variable
+        for _ in self.iter_load(along, size, **keys):
+            hist.add(self[variable][:])
+        return hist.get(density), hist.edges
 
     def gradient(self, variable: str,
                  coords: List[str], fill=None) -> Array:
@@ -68,7 +121,7 @@ class DataCompute(DataBase):
         magn = np.linalg.norm(grad, axis=0)
 
         if isinstance(self[variable], VariableMasked):
-            mask = self[variable].mask.copy()
+            mask = np.ma.getmaskarray(self[variable][:]).copy()
             magn = np.ma.array(magn, mask=mask)
         return magn
 
@@ -81,12 +134,14 @@ class DataCompute(DataBase):
         return der
 
     def mean(self, variable: str, dims: Union[str, List[str]] = None,
-             kwargs: Dict[str, Any] = None,
+             kwargs: Dict[str, Any] = None, threads: int = None,
              **keys: KeyLike) -> Array:
         """Compute average on a given window.
 
         :param dims: Coordinates to compute the mean along.
         :param kwargs: [opt] Arguments passed to numpy.nanmean
+        :param threads: [opt] Number of threads to compute with.
+            See :func:`apply_along_axes`.
         :param keys: Part of the data to select.
 
         Examples
@@ -99,14 +154,15 @@ class DataCompute(DataBase):
         """
         try:
             return self.apply_along_axes(np.nanmean, variable, dims,
-                                         kwargs, **keys)
+                                         kwargs, threads, **keys)
         except SqueezedAxesException as e:
             log.warning("You are averaging only on squeezed dimensions."
                         " Returning a view.")
             return e.var.view(keyring=e.keyring)
 
     def sum(self, variable: str, dims: Union[str, List[str]] = None,
-            kwargs: Dict[str, Any] = None, **keys: KeyLike):
+            kwargs: Dict[str, Any] = None, threads: int = None,
+            **keys: KeyLike):
         """Compute sum on a given window.
 
         Arguments similar to :func:`mean`.
@@ -114,14 +170,14 @@ class DataCompute(DataBase):
         """
         try:
             return self.apply_along_axes(np.nansum, variable,
-                                         dims, kwargs, **keys)
+                                         dims, kwargs, threads, **keys)
         except SqueezedAxesException as e:
             log.warning("You are summing only on squeezed dimensions."
                         " Returning a view.")
             return e.var.view(keyring=e.keyring)
 
     def std_dev(self, variable: str, dims: Union[str, List[str]] = None,
-                kwargs: Dict[str, Any] = None,
+                kwargs: Dict[str, Any] = None, threads: int = None,
                 **keys: KeyLike):
         """Compute standard deviation on a given window.
 
@@ -130,12 +186,116 @@ class DataCompute(DataBase):
         """
         try:
             return self.apply_along_axes(np.nanstd, variable,
-                                         dims, kwargs, **keys)
+                                         dims, kwargs, threads, **keys)
         except SqueezedAxesException as e:
             log.warning("You are computing standard deviation only on "
                         "squeezed dimensions.")
             return np.zeros(e.keyring.shape, dtype='f')
 
+    def reduce_disk(self, variable: str, dims: Union[str, List[str]] = None,
+                    how: str = 'mean', along: str = 'time', size: int = 12,
+                    **keys: KeyLike) -> Array:
+        """Compute a reduction over data on disk, chunk by chunk.
+
+        Data is loaded by slices of the `along` dimension (see
+        :func:`iter_load<tomate.db_types.data_disk.DataDisk.iter_load>`).
+        Partial results of each chunk are merged with numerically stable
+        updates (number of valid values, mean, and sum of squared
+        deviations), so that only one chunk is in memory at any time.
+        As with :func:`mean`, NaN and masked values are ignored.
+
+        Data previously loaded is lost, and the database is unloaded
+        at the end.
+
+        :param dims: [opt] Dimensions to reduce along. Default to all
+            dimensions of the variable.
+        :param how: {'mean', 'sum', 'std'} Reduction to compute.
+        :param along: [opt] Dimension to iterate along.
+        :param size: [opt] Maximum size of chunks along `along`.
+        :param keys: [opt] Part of the data to reduce. Keys act on the
+            available scope.
+
+        :returns: Result, as :func:`mean`, :func:`sum` or :func:`std_dev`
+            would on the same data. Where there is no valid values, the
+            result is masked if the variable is masked, NaN otherwise
+            (0 for a sum).
+        :raises TypeError: If the database is not a DataDisk.
+        :raises ValueError: If `how` is not valid.
+
+        Examples
+        --------
+        >>> clim = db.reduce_disk('SST', 'time', lat=slice(0, 50))
+
+        Compute the average SST over all available time steps, loading
+        12 time steps at once.
+        """
+        if not isinstance(self, DataDisk):
+            raise TypeError("Database must be a subclass of DataDisk to"
+                            " reduce data on disk.")
+        if how not in ['mean', 'sum', 'std']:
+            raise ValueError("Reduction should be one of 'mean', 'sum',"
+                             " 'std' (is {})".format(how))
+
+        var = self[variable]
+        if dims is None:
+            dims = var.dims
+        elif isinstance(dims, str):
+            dims = [dims]
+
+        keys['var'] = variable
+
+        axes = tuple(var.dims.index(d) for d in dims)
+        remaining = [d for d in var.dims if d not in dims]
+        moments = []
+        masked = False
+        dtype = None
+        for _ in self.iter_load(along, size, **keys):
+            data = var[:]
+            masked |= isinstance(data, np.ma.MaskedArray)
+            dtype = data.dtype
+            chunk = get_moments(data, axes)
+            if along in dims and moments:
+                moments = [merge_moments(moments[0], chunk)]
+            else:
+                moments.append(chunk)
+            del data
+
+        if along not in dims:
+            axis = remaining.index(along)
+            moments = [[np.concatenate(m, axis=axis) for m in zip(*moments)]]
+        result = finalize_moments(*moments[0], how, masked, dtype)
+
+        squeeze = tuple(i for i, d in enumerate(remaining)
+                        if isinstance(keys.get(d), (int, np.integer)))
+        if squeeze:
+            result = result.squeeze(axis=squeeze)
+        return result
+
+    def mean_disk(self, variable: str, dims: Union[str, List[str]] = None,
+                  along: str = 'time', size: int = 12, **keys: KeyLike) -> Array:
+        """Compute average over data on disk, chunk by chunk.
+
+        See :func:`reduce_disk` for details.
+        """
+        return self.reduce_disk(variable, dims, 'mean', along, size, **keys)
+
+    def sum_disk(self, variable: str, dims: Union[str, List[str]] = None,
+                 along: str = 'time', size: int = 12, **keys: KeyLike) -> Array:
+        """Compute sum over data on disk, chunk by chunk.
+
+        See :func:`reduce_disk` for details.
+        """
+        return self.reduce_disk(variable, dims, 'sum', along, size, **keys)
+
+    def std_dev_disk(self, variable: str, dims: Union[str, List[str]] = None,
+                     along: str = 'time', size: int = 12,
+                     **keys: KeyLike) -> Array:
+        """Compute standard deviation over data on disk, chunk by chunk.
+
+        See :func:`reduce_disk` for details.
+        """
+        return self.reduce_disk(variable, dims, 'std', along, size, **keys)
+
     def create_mean_variable(self, variable: str, dims: Union[str, List[str]],
                              name: str = None,
                              kwargs: Dict[str, Any] = None,
@@ -168,10 +328,93 @@ class DataCompute(DataBase):
 
         return self[name]
 
+    def resample(self, variable: str, coord: str = 'time',
+                 freq: Union[str, int] = 'month', how: str = 'mean',
+                 **keys: KeyLike) -> Tuple[Array, Coord]:
+        """Reduce data by groups along a coordinate.
+
+        Groups boundaries are computed once, and all groups are reduced
+        at once, with segment-wise operations (`numpy.ufunc.reduceat`).
+        As with :func:`mean`, NaN and masked values are ignored.
+
+        :param coord: Coordinate to resample.
+        :param freq: Group together timestamps of the same 'day', 'month'
+            or 'year' (the coordinate must then be a subclass of Time).
+            If an integer, group together that number of consecutive indices.
+        :param how: {'mean', 'sum', 'std', 'min', 'max'} Reduction
+            applied on each group.
+        :param keys: Part of the data to select.
+
+        :returns: Resampled data, and resampled coordinate. Each group
+            is labeled by its first value.
+            If the variable is masked, groups with no valid value are
+            masked. Otherwise, they are NaN (0 for a sum).
+        :raises ValueError: If `how` or `freq` is not valid,
+            or if the coordinate is squeezed by the keys.
+        :raises TypeError: If grouping by date on a coordinate that is
+            not a subclass of Time.
+
+        Examples
+        --------
+        >>> monthly, time = db.resample('SST', freq='month')
+
+        Compute monthly averages, `time` containing the first timestamp of
+        each month.
+        """
+        if how not in RESAMPLE_FUNCS:
+            raise ValueError("Reduction should be one of {} (is {})"
+                             .format(list(RESAMPLE_FUNCS), how))
+
+        var = self[variable]
+        var.check_loaded()
+
+        keyring = Keyring.get_default(**keys)
+        keyring.make_full(var.dims)
+        keyring.limit(var.dims)
+        keyring.sort_by(var.dims)
+        keyring.make_total()
+        keyring.set_shape(self.loaded.dims)
+        if keyring[coord].type == 'int':
+            raise ValueError("Cannot resample along squeezed coordinate"
+                             " '{}'.".format(coord))
+
+        c = self.loaded[coord].copy()
+        c.slice(keyring[coord].value)
+        order, starts = get_groups(c, freq)
+
+        data = var.view(keyring=keyring)
+        axis = keyring.get_non_zeros().index(coord)
+        if order is not None:
+            data = np.take(data, order, axis=axis)
+            c.update_values(c[order])
+        log.debug("Resampling '%s' along %s in %d groups",
+                  variable, coord, starts.size)
+
+        result = reduce_groups(data, starts, axis, how)
+        c.update_values(c[starts])
+        return result, c
+
     def apply_along_axes(self, func: Callable, variable: str,
                          dims: Union[str, List[str]] = None,
-                         kwargs: Dict[str, Any] = None, **keys):
-        """Apply a function on specific axes."""
+                         kwargs: Dict[str, Any] = None,
+                         threads: int = None, **keys):
+        """Apply a function on specific axes.
+
+        :param func: Function to apply, taking an array and an `axis`
+            argument.
+        :param dims: [opt] Dimensions to apply the function along.
+            Default to all dimensions of the variable.
+        :param kwargs: [opt] Passed to the function.
+        :param threads: [opt] If more than one, data is split in
+            blocks processed by a pool of threads (see
+            :func:`apply_threaded`).
+        :param keys: Part of the data to select.
+
+        For masked data, numpy.nanmean, nansum and nanstd are replaced
+        by equivalent functions working directly on the data and mask
+        arrays (see :func:`reduce_masked
+        <tomate.var_types.variable_masked.reduce_masked>`).
+        """
 
         var = self[variable]
         var.check_loaded()
@@ -197,12 +440,382 @@ class DataCompute(DataBase):
 
         data = var.view(keyring=keyring)
         log.debug("Applying '%s' over axes %s", func.__name__, axes)
+        if (isinstance(data, np.ma.MaskedArray) and func in MOMENTS_FUNCS
+                and set(kwargs) <= {'ddof'}):
+            func = functools.partial(reduce_masked, how=MOMENTS_FUNCS[func],
+                                     **kwargs)
+            kwargs = {}
+        if threads is not None and threads > 1:
+            return apply_threaded(func, data, axes, kwargs, threads)
         result = func(data, axis=axes, **kwargs)
         return result
 
 
+class HistogramAccumulator():
+    """Histogram with fixed bins, filled incrementally.
+
+    Data can be added in chunks (for instance while iterating over
+    data on disk), counts are accumulated.
+    Masked, NaN, and out of bounds values are ignored. The last bin
+    includes its right edge, as in numpy.histogram.
+    Edges are always stored as float64.
+
+    Values are attributed to bins with arithmetic for regular bins, or
+    a binary search otherwise, and counted with numpy.bincount.
+    No copy of the valid values is made.
+
+    :param bins: Number of bins, or bin edges (monotonically increasing).
+    :param bounds: [opt] Range of the bins. Necessary if `bins` is
+        a number.
+
+    :attr edges: np.ndarray: Bin edges.
+    :attr counts: np.ndarray: Number of values in each bin.
+
+    Examples
+    --------
+    >>> hist = HistogramAccumulator(50, (-2., 30.))
+    >>> for _ in db.iter_load('time', 12, 'SST'):
+    ...     hist.add(db['SST'][:])
+    >>> hist.counts
+    """
+
+    def __init__(self, bins: Union[int, Sequence[float]],
+                 bounds: Tuple[float, float] = None):
+        if np.ndim(bins) == 0:
+            if bounds is None:
+                raise ValueError("Bounds are necessary for a number of bins.")
+            if bins < 1:
+                raise ValueError("Number of bins must be positive.")
+            if not bounds[0] < bounds[1]:
+                raise ValueError("Bounds must be increasing.")
+            self.edges = np.linspace(bounds[0], bounds[1], int(bins)+1)
+            self._regular = True
+        else:
+            self.edges = np.asarray(bins, dtype=np.float64)
+            if self.edges.size < 2 or np.any(np.diff(self.edges) < 0):
+                raise ValueError("Bin edges must be monotonically increasing.")
+            self._regular = False
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+
+    def __repr__(self):
+        return "Histogram: {} bins [{}, {}], {} values".format(
+            self.counts.size, self.edges[0], self.edges[-1], self.total)
+
+    @property
+    def total(self) -> int:
+        """Number of values counted."""
+        return int(self.counts.sum())
+
+    BLOCK = 2**16
+    """Approximate number of values processed at once."""
+
+    def add(self, data: Array):
+        """Count values of an array.
+
+        Large arrays are processed by blocks along their first axis,
+        to limit the size of temporary arrays.
+        """
+        if np.ndim(data) == 0:
+            data = np.ma.atleast_1d(data)
+        row = max(1, int(np.prod(np.shape(data)[1:])))
+        step = max(1, self.BLOCK // row)
+        for start in range(0, np.shape(data)[0], step):
+            self._add(data[start:start+step])
+
+    def _add(self, data: Array):
+        """Count values of an array."""
+        # Computations are made in float64
+        values = np.ma.getdata(data).astype(np.float64).ravel()
+        n = self.counts.size
+        first, last = self.edges[0], self.edges[-1]
+
+        # NaN are discarded by comparisons
+        keep = values >= first
+        keep &= values <= last
+        if np.ma.is_masked(data):
+            keep &= ~np.ma.getmaskarray(data).ravel()
+        np.copyto(values, first, where=~keep)
+
+        if self._regular:
+            scaled = values - first
+            scaled *= n / (last - first)
+            idx = scaled.astype(np.intp)
+            # Correct rounding errors, as numpy.histogram does,
+            # only for values close to an edge
+            scaled -= idx
+            near = np.flatnonzero((scaled < 1e-6) | (scaled > 1 - 1e-6))
+            if near.size > 0:
+                val = values[near]
+                i = np.minimum(idx[near], n-1)
+                i -= val < self.edges[i]
+                i += (val >= self.edges[i+1]) & (i != n-1)
+                idx[near] = i
+            np.minimum(idx, n-1, out=idx)
+        else:
+            idx = np.searchsorted(self.edges, values, side='right') - 1
+            np.minimum(idx, n-1, out=idx)
+
+        np.copyto(idx, n, where=~keep)
+        self.counts += np.bincount(idx, minlength=n+1)[:n]
+
+    def get(self, density: bool = False) -> np.ndarray:
+        """Return histogram.
+
+        :param density: If True, return the probability density.
+        """
+        if density:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return self.counts / np.diff(self.edges) / self.total
+        return self.counts.copy()
+
+
 class SqueezedAxesException(Exception):
     """Computing on only squeezed axes."""
     def __init__(self, var, keyring):
         self.var = var
         self.keyring = keyring
+
+
+Moments = Tuple[np.ndarray, np.ndarray, np.ndarray]
+"""Number of valid values, mean, and sum of squared deviations to the mean."""
+
+
+def get_moments(data: Array, axis: Tuple[int]) -> Moments:
+    """Compute moments of data along axes.
+
+    NaN and masked values are ignored.
+    """
+    values = np.ma.getdata(data)
+    valid = ~np.ma.getmaskarray(data)
+    if values.dtype.kind in 'fc':
+        valid &= ~np.isnan(values)
+
+    count = np.sum(valid, axis=axis, dtype=np.int64)
+    total = np.sum(values, axis=axis, where=valid, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+    dev = np.subtract(values, np.expand_dims(mean, axis), dtype=np.float64)
+    np.square(dev, out=dev)
+    m2 = np.sum(dev, axis=axis, where=valid)
+    return count, mean, m2
+
+
+def merge_moments(a: Moments, b: Moments) -> Moments:
+    """Merge moments of two sets of values.
+
+    Use the pairwise update of Chan et al. (1979).
+    """
+    count_a, mean_a, m2_a = a
+    count_b, mean_b, m2_b = b
+    count = count_a + count_b
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = mean_b - mean_a
+        frac = count_b / count
+        mean = np.where(count_a == 0, mean_b,
+                        np.where(count_b == 0, mean_a, mean_a + delta*frac))
+        m2 = m2_a + m2_b + np.where(count_a*count_b > 0,
+                                    delta*delta*count_a*frac, 0)
+    return count, mean, m2
+
+
+def finalize_moments(count: np.ndarray, mean: np.ndarray, m2: np.ndarray,
+                     how: str, masked: bool = False,
+                     dtype: np.dtype = None) -> Array:
+    """Return reduction from moments.
+
+    :param how: {'mean', 'sum', 'std'}
+    :param masked: If True, return a masked array, masked where there
+        is no valid values.
+    :param dtype: [opt] Datatype of the original data. Results are cast
+        to it if it is a float type.
+    """
+    empty = count == 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if how == 'mean':
+            result = mean
+        elif how == 'sum':
+            result = np.where(empty, 0., mean*count)
+        else:
+            result = np.sqrt(m2 / count)
+    result = np.asarray(result)
+    if dtype is not None and np.dtype(dtype).kind == 'f':
+        result = result.astype(dtype)
+
+    if masked:
+        return np.ma.array(result, mask=empty)
+    return result
+
+
+MOMENTS_FUNCS = {np.nanmean: 'mean', np.nansum: 'sum', np.nanstd: 'std'}
+"""Functions that can be computed by merging moments of blocks."""
+
+
+def apply_threaded(func: Callable, data: np.ndarray, axis: Tuple[int],
+                   kwargs: Dict[str, Any], threads: int) -> Array:
+    """Apply a function along axes, by blocks in a pool of threads.
+
+    Numpy releases the GIL in most operations, so blocks are
+    effectively processed in parallel.
+
+    Data is split along the largest axis the function is not applied
+    along, and results of each block are concatenated. Otherwise, if
+    that axis is too small and the function is one of
+    :attr:`MOMENTS_FUNCS` (with no additional arguments), data is split
+    along the largest axis the function is applied along, and results
+    merged (see :func:`merge_moments`).
+    If data cannot be split, the function is applied directly.
+
+    :param axis: Axes to apply the function along.
+    :param kwargs: Passed to the function.
+    :param threads: Number of threads.
+    """
+    free = [i for i in range(data.ndim) if i not in axis]
+    split_free = max(free, key=lambda i: data.shape[i], default=None)
+    split_axis = max(axis, key=lambda i: data.shape[i])
+    size_free = 0 if split_free is None else data.shape[split_free]
+
+    use_moments = (func in MOMENTS_FUNCS and not kwargs
+                   and not isinstance(data, np.ma.MaskedArray)
+                   and data.dtype.kind == 'f'
+                   and size_free < threads
+                   and data.shape[split_axis] >= threads)
+    if not use_moments:
+        if size_free < 2:
+            return func(data, axis=axis, **kwargs)
+        split_axis = split_free
+
+    n = min(threads, data.shape[split_axis])
+    bounds = np.linspace(0, data.shape[split_axis], n+1).astype(int)
+    blocks = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        idx = [slice(None)] * data.ndim
+        idx[split_axis] = slice(start, stop)
+        blocks.append(data[tuple(idx)])
+
+    with ThreadPoolExecutor(n) as executor:
+        if use_moments:
+            moments = list(executor.map(lambda b: get_moments(b, axis),
+                                        blocks))
+        else:
+            results = list(executor.map(lambda b: func(b, axis=axis, **kwargs),
+                                        blocks))
+
+    if use_moments:
+        merged = functools.reduce(merge_moments, moments)
+        result = finalize_moments(*merged, MOMENTS_FUNCS[func],
+                                  dtype=data.dtype)
+        return result[()] if result.ndim == 0 else result
+
+    if kwargs.get('keepdims', False):
+        out_axis = split_axis
+    else:
+        out_axis = free.index(split_axis)
+    if any(isinstance(r, np.ma.MaskedArray) for r in results):
+        return np.ma.concatenate(results, axis=out_axis)
+    return np.concatenate(results, axis=out_axis)
+
+
+RESAMPLE_FUNCS = ['mean', 'sum', 'std', 'min', 'max']
+"""Reductions available for :func:`DataCompute.resample`."""
+
+
+def get_groups(coord: Coord,
+               freq: Union[str, int]) -> Tuple[Union[np.ndarray, None],
+                                               np.ndarray]:
+    """Return groups of a coordinate values.
+
+    :param freq: 'day', 'month', 'year', or a number of consecutive
+        indices.
+    :returns: Indices sorting the coordinate by groups (None if it
+        already is), and start index of each group in the sorted
+        coordinate.
+    :raises ValueError: If freq is not valid.
+    :raises TypeError: If grouping by date on a coordinate that is
+        not a subclass of Time.
+    """
+    if isinstance(freq, (int, np.integer)):
+        if freq < 1:
+            raise ValueError("Number of indices by group must be positive.")
+        return None, np.arange(0, coord.size, freq)
+
+    if freq not in ['day', 'month', 'year']:
+        raise ValueError("Frequency should be one of 'day', 'month', 'year'"
+                         " or an integer (is {})".format(freq))
+    if not isinstance(coord, Time):
+        raise TypeError("'{}' is not a subclass of Time (is {})"
+                        .format(coord.name, type(coord)))
+
+    if freq == 'day':
+        groups = coord.get_days()
+    elif freq == 'month':
+        groups = coord.get_months()
+    else:
+        groups = coord.calendar_fields['year']
+
+    order = None
+    if np.any(groups[1:] < groups[:-1]):
+        order = np.argsort(groups, kind='stable')
+        groups = groups[order]
+    starts = np.flatnonzero(np.diff(groups)) + 1
+    return order, np.concatenate(([0], starts))
+
+
+def reduce_groups(data: Array, starts: np.ndarray, axis: int,
+                  how: str) -> Array:
+    """Reduce data by groups of consecutive indices.
+
+    NaN and masked values are ignored.
+
+    :param starts: Start index of each group along `axis`.
+    :param how: {'mean', 'sum', 'std', 'min', 'max'}
+    :returns: Reduced data. If `data` is masked, groups without valid
+        values are masked. Otherwise, they are NaN (or 0 for a sum).
+    """
+    masked = isinstance(data, np.ma.MaskedArray)
+    values = np.ma.getdata(data)
+    valid = ~np.ma.getmaskarray(data)
+    if values.dtype.kind in 'fc':
+        valid &= ~np.isnan(values)
+        acc_type = np.result_type(values.dtype, np.float64)
+    else:
+        acc_type = None
+
+    count = np.add.reduceat(valid, starts, axis=axis, dtype=np.int64)
+    empty = count == 0
+
+    if how in ['min', 'max']:
+        ufunc = {'min': np.minimum, 'max': np.maximum}[how]
+        if values.dtype.kind in 'fc':
+            fill = {'min': np.inf, 'max': -np.inf}[how]
+        elif values.dtype.kind == 'b':
+            fill = how == 'min'
+        else:
+            info = np.iinfo(values.dtype)
+            fill = {'min': info.max, 'max': info.min}[how]
+        result = ufunc.reduceat(np.where(valid, values, fill), starts,
+                                axis=axis)
+    else:
+        total = np.add.reduceat(np.where(valid, values, 0), starts,
+                                axis=axis, dtype=acc_type)
+        if how == 'sum':
+            result = total
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = total / count
+            if how == 'std':
+                sizes = np.diff(np.append(starts, values.shape[axis]))
+                dev = values - np.repeat(result, sizes, axis=axis)
+                dev = np.where(valid, dev*np.conj(dev), 0)
+                sq = np.add.reduceat(dev, starts, axis=axis, dtype=acc_type)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    result = np.sqrt(sq.real / count)
+            if values.dtype.kind == 'f':
+                result = result.astype(values.dtype, copy=False)
+
+    if masked:
+        return np.ma.array(result, mask=empty)
+    if np.any(empty) and how != 'sum':
+        if result.dtype.kind not in 'fc':
+            result = result.astype(np.float64)
+        result[empty] = np.nan
+    return result
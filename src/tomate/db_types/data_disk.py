@@ -6,19 +6,23 @@
 # at the root of this project. © 2020 Clément HAËCK
 
 
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import logging
 import itertools
-from typing import Any, Dict, List, Type, Union
+import queue
+from typing import Any, Callable, Dict, Iterator, List, Type, Union
 
 import numpy as np
 
 from tomate.coordinates.coord import Coord
-from tomate.custom_types import KeyLike, KeyLikeValue
+from tomate.custom_types import Array, KeyLike, KeyLikeValue
 from tomate.data_base import DataBase
 from tomate.filegroup.filegroup_load import FilegroupLoad
 from tomate.filegroup.filegroup_scan import make_filegroup
 from tomate.filegroup.spec import CoordScanSpec
 from tomate.keys.keyring import Keyring
+from tomate.profiling import HookRegistry
 from tomate.scope import Scope
 from tomate.variables_info import VariablesInfo
 
@@ -47,6 +51,8 @@ class DataDisk(DataBase):
     :attr allow_advanced: bool: If allows advanced data arrangement.
     :attr post_loading_funcs: List[PostLoadingFunc]: Functions applied
         after loading data.
+    :attr hooks: HookRegistry: Profiling hooks. They are notified of
+        the stages of the database, and of all its filegroups.
     """
 
     CSS = CoordScanSpec
@@ -67,6 +73,8 @@ class DataDisk(DataBase):
 
         self.post_loading_funcs = []
 
+        self.hooks = HookRegistry()
+
     def __repr__(self):
         s = [super().__repr__()]
         s.append("{} Filegroups:".format(len(self.filegroups)))
@@ -147,19 +155,20 @@ class DataDisk(DataBase):
         keyring.make_full(self.dims)
         keyring.make_total()
 
-        self.loaded = self.get_subscope('avail', keyring, name='loaded')
-        self.remove_loaded_variables([v for v in self.loaded
-                                      if v not in self.var_disk])
+        with self.profile('load', keyring=keyring):
+            self.loaded = self.get_subscope('avail', keyring, name='loaded')
+            self.remove_loaded_variables([v for v in self.loaded
+                                          if v not in self.var_disk])
 
-        for var in self.loaded.var:
-            self.variables[var].allocate()
+            for var in self.loaded.var:
+                self.variables[var].allocate()
 
-        loaded = [fg.load_from_available(self.loaded.parent_keyring)
-                  for fg in self.filegroups]
-        if not any(loaded):
-            log.warning("Nothing loaded.")
-        else:
-            self.do_post_loading()
+            loaded = [fg.load_from_available(self.loaded.parent_keyring)
+                      for fg in self.filegroups]
+            if not any(loaded):
+                log.warning("Nothing loaded.")
+            else:
+                self.do_post_loading()
 
     def load_by_value(self, *keys: KeyLikeValue, by_day=False,
                       **kw_keys: KeyLikeValue):
@@ -233,12 +242,259 @@ class DataDisk(DataBase):
         scope_.slice(int2list=False, keyring=keyring, **keys)
         self.load(**scope_.parent_keyring.kw)
 
+    def iter_load(self, coord: str, size: int = 12, *keys: KeyLike,
+                  **kw_keys: KeyLike) -> Iterator[KeyLike]:
+        """Load data by chunks along a coordinate.
+
+        Each chunk is loaded in turn (replacing the previous one), so that
+        only one is in memory at any time.
+        The database is unloaded once iteration is over, or when it is
+        interrupted (the generator being closed).
+
+        :param coord: Coordinate to iterate along.
+        :param size: [opt] Maximum size of chunks.
+        :param keys: [opt] Part of the data to load, as for :func:`load`.
+            Keys act on the available scope.
+        :returns: Generator yielding the key of the chunk loaded, acting
+            on the available scope.
+
+        Examples
+        --------
+        >>> for slc in db.iter_load('time', 12, 'SST'):
+        ...     process(db['SST'][:])
+
+        See also
+        --------
+        iter_slices: Iter through slices of a coordinate.
+        """
+        kw_keys = self.get_kw_keys(*keys, **kw_keys)
+        key = kw_keys.pop(coord, None)
+        try:
+            for slc in self.avail.iter_slices(coord, size, key=key):
+                self.load(**kw_keys, **{coord: slc})
+                yield slc
+        finally:
+            self.unload()
+
+    def map_overlap(self, func: Callable[['DataDisk'], Array],
+                    dims: List[str], chunks: Dict[str, int],
+                    halo: Union[int, Dict[str, int]] = 1,
+                    output: Array = None, **keys: KeyLike) -> Array:
+        """Apply a function by overlapping blocks of data on disk.
+
+        The data is split in blocks along the dimensions of `chunks`.
+        Each block is loaded along with a halo of neighbouring values,
+        `func` is applied, and the interior of the result (without
+        halo) is placed in `output`.
+        This allows to compute stencil operations (gradients, filters, ...)
+        with only one block in memory at any time. The halo should be
+        at least as large as the stencil radius.
+        Results are identical to those obtained on the whole
+        selection, at its borders included, as halos do not extend
+        outside of the selection.
+
+        Data previously loaded is lost, and the database is unloaded
+        at the end.
+
+        :param func: Function applied on each block. Receives the
+            database, with the block loaded, and returns an array with
+            the dimensions `dims`, in the loaded scope.
+        :param dims: Dimensions of the arrays returned by `func`.
+        :param chunks: Size of the blocks for each dimension to split.
+            Each must be in `dims`.
+        :param halo: [opt] Size of the halo, for all dimensions in `chunks`
+            or for each one.
+        :param output: [opt] Array to place results into, of shape
+            corresponding to `dims`. It can be on disk (a numpy
+            memmap, or a netCDF variable for instance).
+            If None, a new array is created.
+        :param keys: [opt] Part of the data to compute on, as for
+            :func:`load`. Keys for dimensions in `chunks` must be
+            slices of step 1. Keys act on the available scope.
+
+        :returns: Output array.
+        :raises ValueError: If a dimension in `chunks` is not in `dims`, or
+            if the result of `func` has not the expected shape.
+        :raises TypeError: If a key of a dimension in `chunks` is not
+            a slice.
+
+        Examples
+        --------
+        Compute the SST gradient magnitude by blocks of 100x100
+        pixels.
+
+        >>> grad = db.map_overlap(
+        ...     lambda db: db.gradient_magn('SST', ['lat', 'lon']),
+        ...     ['time', 'lat', 'lon'], chunks=dict(lat=100, lon=100),
+        ...     halo=1, var='SST')
+        """
+        for d in chunks:
+            if d not in dims:
+                raise ValueError(f"Chunked dimension '{d}' is not in dims.")
+        if isinstance(halo, int):
+            halo = dict.fromkeys(chunks, halo)
+
+        kw_keys = self.get_kw_keys(**keys)
+        ranges = {}
+        for d in chunks:
+            key = kw_keys.get(d)
+            if key is None:
+                key = slice(None)
+            if not isinstance(key, slice):
+                raise TypeError("Key for chunked dimension '{}' must be a"
+                                " slice (is {})".format(d, key))
+            start, stop, step = key.indices(self.avail.dims[d].size)
+            if step != 1:
+                raise ValueError("Key for chunked dimension '{}' must have a"
+                                 " step of 1 (is {})".format(d, step))
+            ranges[d] = (start, max(start, stop))
+
+        blocks = [[(i, min(i+chunks[d], stop))
+                   for i in range(start, stop, chunks[d])]
+                  for d, (start, stop) in ranges.items()]
+
+        for block in itertools.product(*blocks):
+            load_keys = dict(kw_keys)
+            interior = {}
+            placement = {}
+            for d, (start, stop) in zip(chunks, block):
+                first, last = ranges[d]
+                start_halo = max(first, start - halo.get(d, 0))
+                stop_halo = min(last, stop + halo.get(d, 0))
+                load_keys[d] = slice(start_halo, stop_halo)
+                interior[d] = slice(start - start_halo, stop - start_halo)
+                placement[d] = slice(start - first, stop - first)
+
+            log.debug("Computing on block %s", load_keys)
+            self.load(**load_keys)
+            result = func(self)
+
+            expected = tuple(self.loaded.dims[d].size for d in dims)
+            if np.shape(result) != expected:
+                raise ValueError("Result of function has shape {}, expected {}"
+                                 .format(np.shape(result), expected))
+
+            if output is None:
+                shape = [ranges[d][1] - ranges[d][0] if d in ranges
+                         else self.loaded.dims[d].size for d in dims]
+                if isinstance(result, np.ma.MaskedArray):
+                    output = np.ma.masked_all(shape, dtype=result.dtype)
+                else:
+                    output = np.empty(shape, dtype=np.asarray(result).dtype)
+
+            idx = tuple(interior.get(d, slice(None)) for d in dims)
+            idx_out = tuple(placement.get(d, slice(None)) for d in dims)
+            output[idx_out] = result[idx]
+
+        self.unload()
+        return output
+
+    def map_to_disk(self, func: Callable[['DataDisk'], Any], pregex: str,
+                    along: str = 'time', size: int = 1,
+                    directory: str = None, workers: int = None,
+                    file_kw: Dict = None, var_kw: Dict[str, Dict] = None,
+                    **keys: KeyLike) -> List[str]:
+        """Transform data on disk, and write results in new files.
+
+        Data is loaded by chunks along a dimension. For each chunk,
+        `func` is applied, and loaded data is written to a new file (see
+        :func:`write`). The filename is generated from a pre-regex, using
+        the first value of the chunk for each coordinate (see
+        :func:`FilegroupScan.render_pregex
+        <tomate.filegroup.filegroup_scan.FilegroupScan.render_pregex>`).
+
+        With multiple workers, chunks are processed concurrently by
+        independent copies of the database: while one is computing,
+        another can read or write. Reading and writing files is not done
+        concurrently, see :attr:`FilegroupLoad.io_lock
+        <tomate.filegroup.filegroup_load.FilegroupLoad.io_lock>`.
+
+        Data previously loaded is lost, and the database is unloaded
+        at the end.
+
+        :param func: Function applied to each chunk. Receives the database
+            (or a copy of it) with the chunk loaded, and should modify
+            loaded data in place. Its return value is ignored.
+        :param pregex: Pre-regex of the output files. The same syntax as
+            for scanning, the matchers are replaced by coordinates
+            values. Can contain directories.
+        :param along: [opt] Dimension to iterate along.
+        :param size: [opt] Maximum size of chunks along `along`.
+            Data of each chunk is written in one file.
+        :param directory: [opt] Directory to place the files. If None,
+            filegroups roots are used.
+        :param workers: [opt] Number of threads. If None, the chunks are
+            processed one after the other.
+        :param file_kw: [opt] Passed to :func:`write`.
+        :param var_kw: [opt] Passed to :func:`write`.
+        :param keys: [opt] Part of the data to transform. Keys act on the
+            available scope.
+
+        :returns: Filenames written, in order of chunks.
+
+        Examples
+        --------
+        Write the SST in Kelvin, one file per day.
+
+        >>> def to_kelvin(db):
+        ...     db['SST'][:] += 273.15
+        >>> db.map_to_disk(to_kelvin, r'SST_K_%(time:x)\\.nc', var='SST',
+        ...                directory='/data/sst_k')
+        """
+        kw_keys = self.get_kw_keys(**keys)
+        key = kw_keys.pop(along, None)
+        slices = self.avail.iter_slices(along, size, key=key)
+        self.unload()
+
+        def process(db: 'DataDisk', slc: KeyLike) -> str:
+            with FilegroupLoad.io_lock:
+                db.load(**kw_keys, **{along: slc})
+            func(db)
+            filename = db.filegroups[0].get_filename(pregex)
+            with FilegroupLoad.io_lock:
+                db.write(filename, directory, file_kw=file_kw, var_kw=var_kw)
+            db.unload()
+            return filename
+
+        if workers is None or workers < 2 or len(slices) < 2:
+            return [process(self, slc) for slc in slices]
+
+        workers = min(workers, len(slices))
+        pool = queue.Queue()
+        for _ in range(workers):
+            db = copy.deepcopy(self)
+            db.hooks = self.hooks
+            pool.put(db)
+
+        def process_worker(slc: KeyLike) -> str:
+            db = pool.get()
+            try:
+                return process(db, slc)
+            finally:
+                pool.put(db)
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(process_worker, slices))
+
     def do_post_loading(self):
         """Apply post loading functions."""
         var_loaded = self.loaded.var[:]
         for plf in self.post_loading_funcs:
             if plf.is_to_launch(var_loaded):
-                plf.launch(self, var_loaded)
+                with self.profile('post_loading', function=plf.name,
+                                  variables=plf.get_variables(var_loaded)):
+                    plf.launch(self, var_loaded)
+
+    def profile(self, stage: str, **context: Any):
+        """Signal start and end of a stage to hooks.
+
+        :returns: Context manager.
+
+        See also
+        --------
+        tomate.profiling.HookRegistry.stage
+        """
+        return self.hooks.stage(stage, **context)
 
     def write(self, filename: str, directory: str = None,
               file_kw: Dict = None, var_kw: Dict[str, Dict] = None,
@@ -281,6 +537,105 @@ class DataDisk(DataBase):
                 fg.write(filename, directory, keyring=keyring_fg,
                          file_kw=file_kw, var_kw=var_kw)
 
+    def write_append(self, filename: str, dim: str = 'time',
+                     directory: str = None, file_kw: Dict = None,
+                     var_kw: Dict[str, Dict] = None, **keys: KeyLike):
+        """Append loaded data to a file, along an unlimited dimension.
+
+        The file is created on the first call, with `dim` unlimited.
+        Subsequent calls append loaded data at the end of `dim`,
+        with one write per variable. This allows to stream results
+        computed chunk by chunk into a single file.
+
+        As for :func:`write`, variables are written by the first
+        filegroup containing them.
+        Wrapper around :func:`FilegroupLoad.write_append
+        <tomate.filegroup.filegroup_load.FilegroupLoad.write_append>`.
+
+        :param filename: File to write. Relative to each filegroup root
+            directory, or from `directory` if specified.
+        :param dim: [opt] Dimension to append along.
+        :param directory: [opt] Force to write `filename` in this directory
+            instead of each filegroups root.
+        :param file_kw: Keywords argument to pass to `open_file`.
+        :param var_kw: Variables specific arguments, used when creating
+            the file.
+        :param keys: [opt] Only write a subpart of loaded data.
+
+        Examples
+        --------
+        >>> for _ in db.iter_load('time', 10, 'SST'):
+        ...     db.write_append('sst_chunks.nc', 'time', var='SST')
+        """
+        keyring = Keyring(**keys)
+        keyring.make_full(self.dims)
+        keyring.make_total()
+        keyring.make_str_idx(**self.loaded.dims)
+
+        variables = self.loaded.var.get_str_names(keyring['var'].no_int())
+
+        for fg in self.filegroups:
+            variables_fg = [v for v in variables if v in fg.variables]
+            for v in variables_fg:
+                variables.remove(v)
+            if variables_fg:
+                keyring_fg = keyring.copy()
+                keyring_fg['var'] = variables_fg
+                fg.write_append(filename, dim, directory, keyring=keyring_fg,
+                                file_kw=file_kw, var_kw=var_kw)
+
+    def write_split(self, along: str = 'time', freq: Union[int, str] = 1,
+                    pregex: str = None, directory: str = None,
+                    workers: int = None, file_kw: Dict = None,
+                    var_kw: Dict[str, Dict] = None,
+                    **keys: KeyLike) -> List[str]:
+        """Write loaded data in multiple files, split along a coordinate.
+
+        As for :func:`write`, variables are written by the first
+        filegroup containing them.
+        Wrapper around :func:`FilegroupLoad.write_split
+        <tomate.filegroup.filegroup_load.FilegroupLoad.write_split>`, see
+        for more details on arguments.
+
+        :param along: [opt] Coordinate to split data along.
+        :param freq: [opt] Number of indices per file, or 'day', 'month',
+            'year'.
+        :param pregex: [opt] Pre-regex of filenames. If None, each
+            filegroup pre-regex is used.
+        :param directory: [opt] Force to write files in this directory
+            instead of each filegroups root.
+        :param workers: [opt] Number of threads.
+        :param keys: [opt] Only write a subpart of loaded data.
+
+        :returns: Filenames written.
+
+        Examples
+        --------
+        Write loaded SST, one file per month
+
+        >>> db.write_split('time', 'month', r'SST_%(time:Y)%(time:m)\\.nc',
+        ...                directory='/data/sst_monthly', var='SST')
+        """
+        keyring = Keyring(**keys)
+        keyring.make_full(self.dims)
+        keyring.make_total()
+        keyring.make_str_idx(**self.loaded.dims)
+
+        variables = self.loaded.var.get_str_names(keyring['var'].no_int())
+
+        filenames = []
+        for fg in self.filegroups:
+            variables_fg = [v for v in variables if v in fg.variables]
+            for v in variables_fg:
+                variables.remove(v)
+            if variables_fg:
+                keyring_fg = keyring.copy()
+                keyring_fg['var'] = variables_fg
+                filenames += fg.write_split(along, freq, pregex, directory,
+                                            workers, file_kw, var_kw,
+                                            keyring=keyring_fg)
+        return filenames
+
     def write_add_variable(self, var: str, sibling: str,
                            kwargs: Dict = None, **keys: KeyLike):
         """Add variable to existing files.
@@ -318,7 +673,8 @@ class DataDisk(DataBase):
             raise IndexError("No filegroups in database.")
         self.check_scanning_functions()
         for fg in self.filegroups:
-            fg.scan_files()
+            with self.profile('scan_files', filegroup=fg.name):
+                fg.scan_files()
 
     def compile_scanned(self):
         """Compile metadata scanned.
@@ -6,9 +6,11 @@
 # at the root of this project. © 2020 Clément HAËCK
 
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import itertools
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -35,6 +37,14 @@ class FilegroupLoad(FilegroupScan):
 
     acs = Accessor  #: Accessor type used to fetch data in files.
 
+    io_lock = threading.Lock()
+    """Lock serializing file access between threads.
+
+    Shared by all filegroups, as the netCDF library is not thread-safe.
+    Filegroups for a thread-safe format can replace it by a null context
+    (`contextlib.nullcontext()`) to read and write files concurrently.
+    """
+
     def load_from_available(self, keyring: Keyring) -> bool:
         """Load data.
 
@@ -42,7 +52,7 @@ class FilegroupLoad(FilegroupScan):
 
         :returns: False if nothing was loaded, True otherwise.
         """
-        memory = Keyring(**{d: list(range(k.size))
+        memory = Keyring(**{d: np.arange(k.size)
                             for d, k in keyring.items()})
         cmd = self.get_fg_keyrings(keyring, memory)
         if cmd is None:
@@ -58,12 +68,15 @@ class FilegroupLoad(FilegroupScan):
         :param keyring: Data to load, acting on this filegroup scope.
         :param memory: Corresponding memory keyring, acting on loaded scope.
         """
-        commands = self.get_commands(keyring, memory)
+        with self.profile('get_commands', keyring=keyring, memory=memory):
+            commands = self.get_commands(keyring, memory)
         for cmd in commands:
             log.debug('Command: %s', str(cmd).replace('\n', '\n\t'))
 
-            with self.open_file(cmd.filename, mode='r', log_lvl='info') as file:
-                self.load_cmd(file, cmd)
+            with self._open_file(cmd.filename, mode='r', log_lvl='info') as file:
+                with self.profile('load_cmd', filename=cmd.filename,
+                                  keyrings=cmd.keyrings):
+                    self.load_cmd(file, cmd)
 
         self.do_post_loading(keyring)
 
@@ -86,7 +99,7 @@ class FilegroupLoad(FilegroupScan):
             if dim not in self.cs:
                 continue
             indices_inf = np.array(self.contains[dim][key])
-            indices_mem = np.array(memory[dim].as_list())
+            indices_mem = memory[dim].as_array()
 
             if indices_inf.size != indices_mem.size:
                 raise IndexError(f"Infile and memory keys for {dim} have "
@@ -99,7 +112,7 @@ class FilegroupLoad(FilegroupScan):
             if len(indices_inf) == 0:
                 return None
 
-            krg_infile[dim] = indices_inf
+            krg_infile[dim] = indices_inf.astype(np.int64)
             krg_memory[dim] = indices_mem
 
         krg_infile.simplify()
@@ -231,6 +244,8 @@ class FilegroupLoad(FilegroupScan):
         # Number of matches ordered by shared coordinates
         lengths = [len(m_c) for m_c in matches]
 
+        mem_lists = [memory[name].as_list() for name in self.iter_shared(True)]
+
         commands = []
         seg = self.segments.copy()
         # Imbricked for loops (one per shared coord)
@@ -248,7 +263,7 @@ class FilegroupLoad(FilegroupScan):
             krgs_mem = Keyring()
             for i_c, name in enumerate(self.iter_shared(True)):
                 krgs_inf[name] = in_idxs[i_c][m[i_c]]
-                krgs_mem[name] = memory[name].as_list()[m[i_c]]
+                krgs_mem[name] = mem_lists[i_c][m[i_c]]
 
             cmd.append(krgs_inf, krgs_mem)
             commands.append(cmd)
@@ -321,7 +336,9 @@ class FilegroupLoad(FilegroupScan):
         var_loaded = keyring['var'].apply(self.cs['var'][:])
         for plf in self.post_loading_funcs:
             if plf.is_to_launch(var_loaded):
-                plf.launch(self.db, var_loaded)
+                with self.profile('post_loading', function=plf.name,
+                                  variables=plf.get_variables(var_loaded)):
+                    plf.launch(self.db, var_loaded)
 
     def scan_variables_attributes(self):
         """Scan for variables specific attributes.
@@ -354,7 +371,7 @@ class FilegroupLoad(FilegroupScan):
         cmds = self.get_commands(infile, memory)
 
         for cmd in cmds:
-            with self.open_file(cmd.filename, 'r', 'debug') as file:
+            with self._open_file(cmd.filename, 'r', 'debug') as file:
                 log.debug('Scanning %s for variables specific attributes.', cmd.filename)
 
                 for k in cmd:
@@ -404,6 +421,76 @@ class FilegroupLoad(FilegroupScan):
         filename = os.path.join(directory, filename)
 
         krg_mem = Keyring.get_default(keyring=keyring, **keys)
+        cmd = self._get_write_command(filename, krg_mem)
+
+        if file_kw is None:
+            file_kw = {}
+        if var_kw is None:
+            var_kw = {}
+
+        file_kw.setdefault('mode', 'w')
+        file_kw.setdefault('log_lvl', 'INFO')
+
+        with self._open_file(filename, **file_kw) as file:
+            with self.profile('write', filename=filename,
+                              keyrings=cmd.keyrings):
+                self._write(file, cmd, var_kw)
+
+    def write_append(self, filename: str, along: str, directory: str = None,
+                     file_kw: Dict = None, var_kw: Dict[str, Dict] = None,
+                     keyring: Keyring = None, **keys: KeyLike):
+        """Write data to disk, appending along an unlimited dimension.
+
+        If the file does not exist, it is created as by :func:`write`, with
+        `along` as an unlimited dimension. Otherwise, loaded data and
+        `along` coordinate values are appended at the end of the file,
+        with one write per variable. Other dimensions must match those
+        in file.
+
+        :param along: Dimension to append along.
+        :param directory: [opt] Directory to place the file. If None, the
+            filegroup root is used instead.
+        :param file_kw: [opt] Keywords argument to pass to `open_file`.
+        :param var_kw: [opt] Variables specific arguments, used when
+            creating the file. See :func:`write`.
+
+        Examples
+        --------
+        >>> for _ in db.iter_load('time', 12):
+        ...     fg.write_append('results.nc', 'time', var=['SST'])
+        """
+        if directory is None:
+            directory = self.root
+        filename = os.path.join(directory, filename)
+
+        krg_mem = Keyring.get_default(keyring=keyring, **keys)
+        krg_mem.set_default(along, slice(None))
+        # Keep the dimension for single indices
+        krg_mem.make_int_list(along)
+        cmd = self._get_write_command(filename, krg_mem)
+
+        if file_kw is None:
+            file_kw = {}
+        if var_kw is None:
+            var_kw = {}
+
+        exists = os.path.isfile(filename)
+        file_kw['mode'] = 'r+' if exists else 'w'
+        file_kw.setdefault('log_lvl', 'INFO')
+
+        with self._open_file(filename, **file_kw) as file:
+            with self.profile('write', filename=filename,
+                              keyrings=cmd.keyrings):
+                if exists:
+                    self._append(file, cmd, along)
+                else:
+                    self._write(file, cmd, var_kw, unlimited=[along])
+
+    def _get_write_command(self, filename: str, krg_mem: Keyring) -> Command:
+        """Return command to write loaded data.
+
+        :param krg_mem: Part of loaded data to write.
+        """
         krg_mem.set_default('var', slice(None))
         krg_mem.make_idx_str(var=self.db.loaded.var)
 
@@ -433,20 +520,135 @@ class FilegroupLoad(FilegroupScan):
             inf.make_total()
             inf.sort_by(['var'] + list(dims))
 
-        if file_kw is None:
-            file_kw = {}
-        if var_kw is None:
-            var_kw = {}
+        return cmd
 
-        file_kw.setdefault('mode', 'w')
-        file_kw.setdefault('log_lvl', 'INFO')
+    def get_filename(self, pregex: str = None, keyring: Keyring = None,
+                     **replacements: str) -> str:
+        """Generate a filename for loaded data.
+
+        Matchers of the pre-regex are replaced using the first loaded value
+        of each coordinate (see :func:`render_pregex
+        <tomate.filegroup.filegroup_scan.FilegroupScan.render_pregex>`).
+        Indices are taken in the available scope.
+
+        :param pregex: [opt] Pre-regex. If None, the filegroup pre-regex
+            is used.
+        :param keyring: [opt] Part of loaded data.
+        :param replacements: [opt] Matchers to be replaced by a constant.
+        """
+        if pregex is None:
+            pregex = self.pregex
+        if keyring is None:
+            keyring = Keyring()
+        db = self.db
+        indices = {}
+        for name in db.dims:
+            key = db.loaded.parent_keyring[name].copy()
+            key.make_str_idx(db.avail.dims[name])
+            if name in keyring:
+                key_loaded = keyring[name].copy()
+                key_loaded.make_str_idx(db.loaded.dims[name])
+                key = key * key_loaded
+            indices[name] = key.as_list()[0]
+        return self.render_pregex(pregex, db.avail.dims, indices,
+                                  **replacements)
+
+    def write_split(self, along: str, freq: Union[int, str] = 1,
+                    pregex: str = None, directory: str = None,
+                    workers: int = None, file_kw: Dict = None,
+                    var_kw: Dict[str, Dict] = None, keyring: Keyring = None,
+                    **keys: KeyLike) -> List[str]:
+        """Write loaded data in multiple files.
+
+        Data is split along a coordinate, and each part is written in a
+        different file (see :func:`write`). Filenames are generated
+        from a pre-regex (see :func:`get_filename`).
+
+        If the pre-regex contains a matcher for variables, each
+        variable is written in a separate file.
+
+        With multiple workers, files are written by a pool of threads.
+        File access is still serialized by :attr:`io_lock`.
+
+        :param along: Coordinate to split data along.
+        :param freq: [opt] Number of indices per file, or 'day', 'month',
+            'year' to group indices by date (see :func:`Scope.iter_slices_date
+            <tomate.scope.Scope.iter_slices_date>`).
+        :param pregex: [opt] Pre-regex of filenames. If None, the filegroup
+            pre-regex is used.
+        :param directory: [opt] Directory to place the files. If None, the
+            filegroup root is used instead.
+        :param workers: [opt] Number of threads.
+        :param file_kw: [opt] Passed to :func:`write`.
+        :param var_kw: [opt] Passed to :func:`write`.
+        :param keyring: [opt] Part of loaded data to write.
+
+        :returns: Filenames written, in order.
+        :raises ValueError: If two parts would be written in the same file.
+
+        Examples
+        --------
+        Write one file per day
 
-        with self.open_file(filename, **file_kw) as file:
-            self._write(file, cmd, var_kw)
+        >>> fg.write_split('time', 'day', r'SST_%(time:x)\\.nc',
+        ...                var=['SST'])
+        """
+        krg_mem = Keyring.get_default(keyring=keyring, **keys)
+        krg_mem.set_default('var', slice(None))
+        krg_mem.make_idx_str(var=self.db.loaded.var)
+
+        key = krg_mem.pop(along).value if along in krg_mem else None
+        if isinstance(freq, str):
+            slices = self.db.loaded.iter_slices_date(along, freq, key=key)
+        else:
+            slices = self.db.loaded.iter_slices(along, freq, key=key)
 
-    def _write(self, file: File, cmd: Command, var_kw: Dict[str, Any]):
+        if pregex is None:
+            pregex = self.pregex
+        # One variable per file if variables appear in filenames
+        if any(m.group(1) == 'var' for m in self.scan_pregex(pregex)):
+            var_groups = [[v] for v in krg_mem['var'].as_list()]
+        else:
+            var_groups = [krg_mem['var'].value]
+        parts = []
+        for var, slc in itertools.product(var_groups, slices):
+            krg = krg_mem.copy()
+            krg['var'], krg[along] = var, slc
+            parts.append((self.get_filename(pregex, krg), krg))
+
+        filenames = [filename for filename, _ in parts]
+        if len(set(filenames)) < len(filenames):
+            duplicates = sorted({f for f in filenames
+                                 if filenames.count(f) > 1})
+            raise ValueError("Pre-regex '{}' gives the same filename to"
+                             " different parts ({})."
+                             .format(pregex, ', '.join(duplicates)))
+
+        def write_part(part: Tuple[str, Keyring]) -> str:
+            filename, krg = part
+            with self.io_lock:
+                self.write(filename, directory, keyring=krg,
+                           file_kw=file_kw, var_kw=var_kw)
+            return filename
+
+        if workers is None or workers < 2 or len(parts) < 2:
+            return [write_part(part) for part in parts]
+
+        with ThreadPoolExecutor(min(workers, len(parts))) as executor:
+            return list(executor.map(write_part, parts))
+
+    def _write(self, file: File, cmd: Command, var_kw: Dict[str, Any],
+               unlimited: List[str] = None):
         """Write data in file.
 
+        :param cmd: Memory acts on loaded scope.
+        :param unlimited: [opt] Dimensions to create as unlimited.
+        """
+        raise NotImplementedError()
+
+    def _append(self, file: File, cmd: Command, along: str):
+        """Append data in file along a dimension.
+
         :param cmd: Memory acts on loaded scope.
         """
         raise NotImplementedError()
@@ -481,8 +683,10 @@ class FilegroupLoad(FilegroupScan):
                 cks.infile.limit(cks.memory)
             log.debug('Command: %s', cmd)
 
-            with self.open_file(cmd.filename, mode='r+', log_lvl='info') as file:
-                self.add_variables_to_file(file, cmd[0], **{var: kwargs})
+            with self._open_file(cmd.filename, mode='r+', log_lvl='info') as file:
+                with self.profile('write', filename=cmd.filename,
+                                  keyrings=cmd.keyrings, variable=var):
+                    self.add_variables_to_file(file, cmd[0], **{var: kwargs})
 
         return True
 
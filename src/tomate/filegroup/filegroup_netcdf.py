@@ -7,7 +7,9 @@
 
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+
+import numpy as np
 
 try:
     import netCDF4 as nc
@@ -56,7 +58,8 @@ class FilegroupNetCDF(FilegroupLoad):
 
             log.info("Taking keys %s from variable %s",
                      krg_inf.print(), ncname)
-            chunk = self.acs.take_normal(krg_inf, file[ncname])
+            with self.profile('take', variable=ncname, infile=krg_inf):
+                chunk = self.acs.take_normal(krg_inf, file[ncname])
 
             chunk_shape = self.acs.shape(chunk)
             if not krg_inf.is_shape_equivalent(self.acs.shape(chunk)):
@@ -68,9 +71,13 @@ class FilegroupNetCDF(FilegroupLoad):
                                      krg_mem.get_non_zeros(), log_lvl='INFO')
 
             log.info("Placing it in %s, %s", name, krg_mem.print())
-            self.db.variables[name].set_data(chunk, krg_mem)
+            with self.profile('place', variable=name, memory=krg_mem):
+                self.db.variables[name].set_data(chunk, krg_mem)
 
-    def _write(self, file: nc.Dataset, cmd: Command, var_kw: Dict):
+    def _write(self, file: nc.Dataset, cmd: Command, var_kw: Dict,
+               unlimited: List[str] = None):
+        if unlimited is None:
+            unlimited = []
 
         def add_coord(name, mem):
             coord = self.db.loaded.coords[name]
@@ -82,19 +89,23 @@ class FilegroupNetCDF(FilegroupLoad):
             key = mem[name].copy()
             key.set_size_coord(coord)
             if key.size != 0:
-                file.createDimension(ncname, key.size)
+                size = None if name in unlimited else key.size
+                file.createDimension(ncname, size)
+                values = coord[key.value]
                 if isinstance(coord, CoordStr):
-                    file.createVariable(ncname, 'S2', [ncname])
-                    for i, v in enumerate(coord[:]):
-                        file[ncname][i] = v
+                    # Variable length strings, written all at once
+                    values = np.asarray(values, dtype=object)
+                    file.createVariable(ncname, str, [ncname])
                 else:
-                    file.createVariable(ncname, 'f', [ncname])
-                    file[ncname][:] = coord[key.value]
+                    values = np.asarray(values)
+                    file.createVariable(ncname, values.dtype, [ncname])
+                file[ncname][:] = values
                 log.info("Laying %s values, extent %s", name,
                          coord.get_extent_str(key.no_int()))
 
-                file[ncname].setncattr('fullname', coord.fullname)
-                file[ncname].setncattr('units', coord.units)
+                self.set_attributes(file[ncname],
+                                    {'fullname': coord.fullname,
+                                     'units': coord.units})
 
         self.add_vi_to_file(file, add_attr=False)
 
@@ -107,27 +118,93 @@ class FilegroupNetCDF(FilegroupLoad):
         for cmd_krgs in cmd:
             self.add_variables_to_file(file, cmd_krgs, **var_kw)
 
+    def _append(self, file: nc.Dataset, cmd: Command, along: str):
+        ncalong = self.cs[along].name if along in self.cs else along
+        if ncalong not in file.dimensions:
+            raise KeyError(f"Dimension '{ncalong}' not in file.")
+        if not file.dimensions[ncalong].isunlimited():
+            raise ValueError(f"Dimension '{ncalong}' is not unlimited"
+                             " in file.")
+        start = file.dimensions[ncalong].size
+
+        krg_inf, krg_mem = cmd[0]
+        coord = self.db.loaded.coords[along]
+        key = krg_mem[along].copy()
+        key.set_size_coord(coord)
+        stop = start + key.size
+
+        for dim in krg_inf.dims:
+            if dim in ['var', along]:
+                continue
+            ncname = self.cs[dim].name if dim in self.cs else dim
+            key = krg_mem[dim].copy()
+            key.set_size_coord(self.db.loaded.coords[dim])
+            if key.size != 0 and file.dimensions[ncname].size != key.size:
+                raise ValueError(f"Dimension '{ncname}' size mismatch (is"
+                                 f" {file.dimensions[ncname].size} in file,"
+                                 f" {key.size} to append).")
+
+        log.info("Appending %s values at %d, extent %s", along, start,
+                 coord.get_extent_str(krg_mem[along].no_int()))
+        if ncalong in file.variables:
+            file[ncalong][start:stop] = coord[krg_mem[along].value]
+
+        for krg_inf, krg_mem in cmd:
+            name = self.db.loaded.var.get_str_name(krg_mem.pop('var').value)
+            ncname = krg_inf.pop('var').value
+            if ncname not in file.variables:
+                raise KeyError(f"Variable '{ncname}' not in file, cannot"
+                               " append to it.")
+
+            order = self.translate_dimensions(list(file[ncname].dimensions))
+            if order != krg_inf.get_non_zeros():
+                raise IndexError("File dimensions ({}) does not"
+                                 " match keyring ({})"
+                                 .format(order, krg_inf.get_non_zeros()))
+
+            chunk = self.db.variables[name].view(keyring=krg_mem, order=order,
+                                                 log_lvl='INFO')
+            krg_inf[along] = slice(start, stop)
+            log.info("Appending variable %s in file at %s.",
+                     ncname, krg_inf.print())
+            self.acs.place_normal(krg_inf, file[ncname], chunk)
+
     def add_vi_to_file(self, file, add_info=True, add_attr=True,
                        name=None, ncname=None):
-        """Add metada to file."""
+        """Add metada to file.
+
+        Attributes are set in one batch for the file, and one for
+        the variable.
+        """
         if add_info:
-            for info in self.vi.infos:
-                if not info.startswith('_'):
-                    value = self.db.vi.get_info(info)
-                    try:
-                        file.setncattr(info, value)
-                    except TypeError:
-                        file.setncattr(info, str(value))
+            infos = {info: self.db.vi.get_info(info)
+                     for info in self.vi.infos if not info.startswith('_')}
+            self.set_attributes(file, infos)
         if add_attr:
             if name in self.vi.variables:
-                attrs = self.vi[name]
-                for attr in attrs:
-                    if not attr.startswith('_'):
-                        value = self.vi.get_attribute(name, attr)
-                        try:
-                            file[ncname].setncattr(attr, value)
-                        except TypeError:
-                            file[ncname].setncattr(attr, str(value))
+                attrs = {attr: self.vi.get_attribute(name, attr)
+                         for attr in self.vi[name] if not attr.startswith('_')}
+                self.set_attributes(file[ncname], attrs)
+
+    @staticmethod
+    def set_attributes(obj: Union['nc.Dataset', 'nc.Variable'],
+                       attrs: Dict[str, Any]):
+        """Set multiple attributes at once.
+
+        Attributes whose value cannot be written are converted to string.
+
+        :param obj: File or variable.
+        """
+        if not attrs:
+            return
+        try:
+            obj.setncatts(attrs)
+        except TypeError:
+            for attr, value in attrs.items():
+                try:
+                    obj.setncattr(attr, value)
+                except TypeError:
+                    obj.setncattr(attr, str(value))
 
     def add_variables_to_file(self, file: 'nc.Dataset', cmd: CmdKeyrings,
                               **var_kw: Dict[str, Dict]):
@@ -22,6 +22,7 @@ from tomate.filegroup.matcher import Matcher
 from tomate.filegroup.scanner import Scanner
 from tomate.filegroup.spec import CoordScanSpec
 from tomate.keys.key import Key, KeyValue
+from tomate.profiling import HookRegistry
 from tomate.variables_info import VariablesInfo
 if TYPE_CHECKING:
     from tomate.data_base import DataBase
@@ -69,6 +70,8 @@ class FilegroupScan():
         Each element is a tuple of the function, the variable that triggers
         the call, a boolean True if all said variables must present to trigger,
         False if any variable must be loaded, and kwargs to pass.
+    :attr hooks: HookRegistry: Profiling hooks notified of scanning, loading
+        and writing stages of this filegroup.
     """
 
     MAX_DEPTH_SCAN = 3
@@ -100,6 +103,8 @@ class FilegroupScan():
         self.post_loading_funcs = []
         self.selection = {}
 
+        self.hooks = HookRegistry()
+
     @property
     def variables(self) -> List[str]:
         """List of variables contained in this filegroup."""
@@ -245,6 +250,51 @@ class FilegroupScan():
         m = re.finditer(regex, pregex)
         return m
 
+    @staticmethod
+    def render_pregex(pregex: str, coords: Dict[str, Coord],
+                      indices: Dict[str, int], **replacements: str) -> str:
+        """Generate a filename from a pre-regex.
+
+        Inverse of scanning: each matcher is replaced by the element
+        corresponding to a coordinate value (see :func:`Matcher.format
+        <tomate.filegroup.matcher.Matcher.format>`). Regex escapes
+        outside of matchers are removed.
+
+        :param coords: Coordinates to take values from.
+        :param indices: Index of the value to use for each coordinate.
+        :param replacements: Matchers to be replaced by a constant.
+            As in :func:`set_scan_regex`.
+
+        :raises KeyError: A matcher coordinate is missing.
+
+        Example
+        -------
+        >>> FilegroupScan.render_pregex(r'SST_%(time:x)\\.nc',
+        ...                             db.avail.dims, dict(time=10))
+        'SST_20070111.nc'
+        """
+        for k, z in replacements.items():
+            pregex = pregex.replace("%({:s})".format(k), z)
+
+        def unescape(s):
+            return re.sub(r'\\(.)', r'\1', s)
+
+        filename = []
+        end = 0
+        for idx, match in enumerate(FilegroupScan.scan_pregex(pregex)):
+            matcher = Matcher(match, idx)
+            coord = coords[matcher.coord]
+            index = indices[matcher.coord]
+            if matcher.elt in Matcher.ELT_FMT:
+                value = coord.index2date(index)
+            else:
+                value = coord[index]
+            filename.append(unescape(pregex[end:match.start()]))
+            filename.append(matcher.format(value, index))
+            end = match.end()
+        filename.append(unescape(pregex[end:]))
+        return ''.join(filename)
+
     def find_segments(self, m: Iterator[re.match]):
         """Find segments in filename.
 
@@ -277,6 +327,33 @@ class FilegroupScan():
         """
         raise NotImplementedError
 
+    def _open_file(self, filename: str,
+                   mode: str = 'r',
+                   log_lvl: str = 'info',
+                   **kwargs: Any) -> File:
+        """Open a file, signaling it to hooks.
+
+        Wrapper around `open_file`.
+        """
+        with self.profile('open_file', filename=filename, mode=mode):
+            return self.open_file(filename, mode=mode, log_lvl=log_lvl,
+                                  **kwargs)
+
+    def profile(self, stage: str, **context: Any):
+        """Signal start and end of a stage to hooks.
+
+        Hooks of the filegroup and of its parent database are notified.
+        The filegroup name is added to the context.
+
+        :returns: Context manager.
+        """
+        hooks = self.hooks
+        db_hooks = getattr(self.db, 'hooks', None)
+        if db_hooks:
+            hooks = hooks + db_hooks
+        context['filegroup'] = self.name
+        return hooks.stage(stage, **context)
+
     def is_to_open(self) -> bool:
         """Return if the current file has to be opened."""
         to_open = (any(cs.is_to_open() for cs in self.cs.values())
@@ -307,8 +384,8 @@ class FilegroupScan():
             if not filename:
                 raise NameError("No files matching the regex.")
 
-        with self.open_file(os.path.join(self.root, filename),
-                            log_lvl='DEBUG') as file:
+        with self._open_file(os.path.join(self.root, filename),
+                             log_lvl='DEBUG') as file:
             coords = func(file, **kwargs)
             coords_return = []  # Only return coords not already in FG
             for c in coords:
@@ -358,12 +435,13 @@ class FilegroupScan():
 
         self.found_file = True
 
-        if self.is_to_open():
-            with self.open_file(os.path.join(self.root, filename),
-                                mode='r', log_lvl='debug') as file:
-                execute_scanning(file)
-        else:
-            execute_scanning(None)
+        with self.profile('scan_file', filename=filename):
+            if self.is_to_open():
+                with self._open_file(os.path.join(self.root, filename),
+                                     mode='r', log_lvl='debug') as file:
+                    execute_scanning(file)
+            else:
+                execute_scanning(None)
 
     def find_files(self):
         """Find files to scan.
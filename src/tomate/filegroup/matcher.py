@@ -10,6 +10,9 @@ Handles matches in the pre-regex.
 
 
 import re
+from typing import Any
+
+import numpy as np
 
 
 class Matcher():
@@ -43,6 +46,11 @@ class Matcher():
                "char": r"\S*"}
     """Regex str for each type of element."""
 
+    ELT_FMT = {"Y": "%Y", "m": "%m", "d": "%d", "j": "%j",
+               "H": "%H", "M": "%M", "S": "%S",
+               "x": "%Y%m%d", "X": "%H%M%S", "B": "%B"}
+    """Date format for each date element."""
+
     def __init__(self, m: re.match, idx: int):
         coord = m.group(1)
         elt = m.group(2)
@@ -85,6 +93,34 @@ class Matcher():
         rgx_new = re.sub("%([a-zA-Z%])", replace, rgx)
         return rgx_new
 
+    def format(self, value: Any, index: int) -> str:
+        """Return string for a coordinate value.
+
+        Inverse of scanning: the string is matched by this matcher.
+
+        :param value: Coordinate value. For date elements, a date object
+            (cftime or datetime).
+        :param index: Index of the value in its coordinate. Used by the
+            'idx' element, padded with zeros if the regex is a fixed number
+            of digits.
+            Values are written in positional notation, with as many digits
+            as needed to be read back exactly (trailing zeros removed).
+        :raises KeyError: Element cannot be formatted.
+        """
+        if self.elt in self.ELT_FMT:
+            return value.strftime(self.ELT_FMT[self.elt])
+        if self.elt == 'idx':
+            width = 0
+            if re.fullmatch(r'(\\d)+', self.rgx):
+                width = len(self.rgx) // 2
+            return '{:0{}d}'.format(index, width)
+        if self.elt == 'value':
+            # Shortest representation that round-trips, without exponent
+            return np.format_float_positional(float(value), trim='-')
+        if self.elt in ['text', 'char']:
+            return str(value)
+        raise KeyError("Cannot format element '{}'.".format(self.elt))
+
     def __repr__(self):
         s = '{0}:{1}, idx={2}'.format(self.coord, self.elt, self.idx)
         if self.dummy:
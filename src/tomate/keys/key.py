@@ -27,6 +27,8 @@ class Key():
     """Element for indexing an iterable.
 
     Can be None, int, str, List[int], List[str] or slice.
+    A list of integers given as a numpy array is stored as an int64 array,
+    and operations on the key are then vectorized.
 
     See :doc:`../accessor` for more information.
 
@@ -84,6 +86,12 @@ class Key():
             tp = 'int'
             s = True
 
+        elif isinstance(key, np.ndarray) and key.dtype.kind in 'iu':
+            tp = 'list'
+            if key.ndim != 1:
+                reject = 'Array of indices must be one-dimensional'
+            key = np.array(key, dtype=np.int64)
+
         elif isinstance(key, (list, tuple, np.ndarray)):
             tp = 'list'
             key = list(key)
@@ -135,8 +143,17 @@ class Key():
             self._size = len(self.value)
 
     def __eq__(self, other: 'Key'):
+        if self.is_array or other.is_array:
+            if self.type != 'list' or other.type != 'list' or other.str:
+                return False
+            return np.array_equal(self.value, other.value)
         return self.value == other.value
 
+    @property
+    def is_array(self) -> bool:
+        """If the key is a list of integers stored as a numpy array."""
+        return isinstance(self.value, np.ndarray)
+
     def __iter__(self) -> Iterator:
         """Iterate on the key.
 
@@ -165,6 +182,8 @@ class Key():
         return '{}: {}'.format(str(self.__class__.__name__), self)
 
     def __str__(self):
+        if self.is_array:
+            return str(self.value.tolist())
         return str(self.value)
 
     def set_size_coord(self, coord: Iterable):
@@ -176,7 +195,7 @@ class Key():
         """
         self.parent_size = len(coord)
         if self.type == 'slice':
-            self._size = len(self.apply(coord))
+            self._size = len(self.as_range())
 
     def no_int(self) -> KeyLike:
         """Return value but replace int with list."""
@@ -195,8 +214,7 @@ class Key():
             if is_none_slice(self.value):
                 self.value = slice(None, None, -1)
             else:
-                self.set(self.as_list()[::-1])
-                self.simplify()
+                self.set(range2slice(self.as_range()[::-1]))
 
     def simplify(self):
         """Simplify list into a slice if possible.
@@ -208,7 +226,7 @@ class Key():
             key = list2slice(self.value)
             if isinstance(key, slice):
                 self.type = 'slice'
-            self.value = key
+                self.value = key
 
     def as_list(self) -> Union[List[int], List[str]]:
         """Return list of key.
@@ -219,16 +237,45 @@ class Key():
         a = self.value
         if self.type == 'int':
             a = [a]
+        elif self.is_array:
+            a = a.tolist()
         elif self.type == 'list':
             a = a.copy()
         elif self.type == 'slice':
-            if self.parent_size is None:
-                raise TypeError("parent_size must be set to transform"
-                                " slice into list")
-            a = list(range(*a.indices(self.parent_size)))
+            a = list(self.as_range())
 
         return a
 
+    def as_array(self) -> np.ndarray:
+        """Return indices as an int64 array.
+
+        :raises TypeError: If the key is a None key or contains strings,
+            or if it is a slice and parent size was not set.
+        """
+        if self.type == 'none' or self.str:
+            raise TypeError("Cannot transform key into array of indices"
+                            f" (key: {self.value})")
+        if self.type == 'slice':
+            rng = self.as_range()
+            return np.arange(rng.start, rng.stop, rng.step, dtype=np.int64)
+        return np.array(self.value, dtype=np.int64, ndmin=1)
+
+    def as_range(self) -> range:
+        """Return range of indices selected by a slice key.
+
+        Does not create any list.
+
+        :raises TypeError: If key is not a slice, or if its parent size
+            was not set.
+        """
+        if self.type != 'slice':
+            raise TypeError("Only slice keys can be turned into range"
+                            f" (key type '{self.type}')")
+        if self.parent_size is None:
+            raise TypeError("parent_size must be set to transform"
+                            " slice into list")
+        return range(*self.value.indices(self.parent_size))
+
     def apply(self, seq: Sequence,
               int2list: bool = False) -> Union[List[Any], Any]:
         """Apply key to a sequence.
@@ -250,6 +297,10 @@ class Key():
             if self.type == 'list':
                 return out
 
+        if self.is_array:
+            if isinstance(seq, np.ndarray):
+                return seq[self.value]
+            return [seq[z] for z in self]
         if self.type == 'list' or (int2list and self.type == 'int'):
             return [seq[z] for z in self]
         if self.type == 'int':
@@ -277,10 +328,25 @@ class Key():
         if other.type == 'slice' and is_none_slice(other.value):
             return self
 
-        a = self.as_list()
         if other.str and not self.str:
             raise TypeError("Cannot multiply an integer indices key"
                             " by a string indices key")
+
+        # Composition of slices is computed on ranges, without lists.
+        if self.type == 'slice' and other.type == 'slice':
+            out = self.as_range()[other.value]
+            key = self.__class__(range2slice(out))
+            key._size = len(out)
+            key.parent_size = self.parent_size
+            return key
+
+        if self.is_array or other.is_array:
+            return self._mul_array(other)
+
+        if self.type == 'slice':
+            a = self.as_range()
+        else:
+            a = self.as_list()
         out = other.apply(a, int2list=True)
 
         if self.type == 'int' or other.type == 'int':
@@ -290,12 +356,36 @@ class Key():
         else:
             key = self.__class__(list2slice(out))
             key._size = len(out)
-            if key._size > 2:
-                assert key.type == 'slice', 'slice * slice should be slice'
 
         key.parent_size = self.parent_size
         return key
 
+    def _mul_array(self, other: 'Key') -> 'Key':
+        """Subset key by another, one of them being an array.
+
+        Vectorized version of :func:`__mul__`. If one of the keys is a
+        slice, the result is simplified to a slice when regular.
+        """
+        if other.type == 'none':
+            raise TypeError("Key not applicable")
+
+        if self.str:
+            out = other.apply(self.as_list(), int2list=True)
+        else:
+            idx = other.as_array() if other.type == 'list' else other.value
+            out = self.as_array()[idx]
+
+        if self.type == 'int' or other.type == 'int':
+            out = np.ravel(out)[0]
+            if not self.str:
+                out = int(out)
+        elif not self.str and 'slice' in [self.type, other.type]:
+            # Keep slice access (a view rather than a copy) when possible
+            out = list2slice(out)
+        key = self.__class__(out)
+        key.parent_size = self.parent_size
+        return key
+
     def __add__(self, other: 'Key') -> 'Key':
         """Expand a key by another.
 
@@ -309,6 +399,17 @@ class Key():
 
         :returns: self + other
         """
+        if self.type == 'slice' and other.type == 'slice':
+            out = concatenate_ranges(self.as_range(), other.as_range())
+            if out is not None:
+                return self.__class__(range2slice(out))
+
+        if self.is_array or other.is_array:
+            out = np.concatenate([self.as_array(), other.as_array()])
+            if self.type == 'slice' or other.type == 'slice':
+                out = list2slice(out)
+            return self.__class__(out)
+
         a = self.as_list()
         b = other.as_list()
         out = a + b
@@ -331,6 +432,8 @@ class Key():
         if self.type == 'list' and self.size == 1:
             self.type = 'int'
             self.value = self.value[0]
+            if self.is_array:
+                self.value = int(self.value)
             self._size = 0
 
     def make_int_list(self):
@@ -430,15 +533,16 @@ def list2slice(L: List[int]) -> Union[slice, List[int]]:
     if len(L) < 2:
         return L
 
-    if np.any(np.sign(L) >= 0) and np.any(np.sign(L) < 0):
+    arr = np.asarray(L)
+    if np.any(arr >= 0) and np.any(arr < 0):
         return L
 
-    diff = np.diff(L)
+    diff = np.diff(arr)
+    step = int(diff[0])
 
-    if len(set(diff)) == 1:
-        start = L[0]
-        stop = L[-1]
-        step = diff[0]
+    if step != 0 and np.all(diff == step):
+        start = int(arr[0])
+        stop = int(arr[-1])
 
         shift = 1 if step > 0 else -1
         stop += shift
@@ -451,6 +555,48 @@ def list2slice(L: List[int]) -> Union[slice, List[int]]:
     return L
 
 
+def range2slice(rng: range) -> Union[slice, List[int]]:
+    """Transform a range into a slice.
+
+    Equivalent to `list2slice(list(rng))` for ranges of positive
+    integers, without creating a list.
+    Ranges of less than two elements are returned as lists.
+    """
+    if len(rng) < 2:
+        return list(rng)
+
+    step = rng.step
+    stop = rng[-1] + (1 if step > 0 else -1)
+    if step < 0 and stop == -1:
+        stop = None
+    return slice(rng[0], stop, step)
+
+
+def concatenate_ranges(r1: range, r2: range) -> Optional[range]:
+    """Concatenate two ranges if the result is a range.
+
+    :returns: None if the concatenation cannot be written as a range.
+    """
+    if len(r1) == 0:
+        return r2
+    if len(r2) == 0:
+        return r1
+
+    if len(r1) > 1:
+        step = r1.step
+    elif len(r2) > 1:
+        step = r2.step
+    else:
+        step = r2[0] - r1[0]
+
+    if (step == 0
+            or (len(r1) > 1 and r1.step != step)
+            or (len(r2) > 1 and r2.step != step)
+            or r2[0] - r1[-1] != step):
+        return None
+    return range(r1[0], r2[-1] + step, step)
+
+
 def guess_slice_size(slc: slice) -> Optional[int]:
     """Guess the size of a slice.
 
@@ -346,7 +346,7 @@ class Keyring():
                 s.append(str(k.value))
             elif k.type == 'list':
                 if len(k.value) <= 5:
-                    s.append(str(k.value))
+                    s.append(str(k))
                 else:
                     z = '[{}, {}, ..., {}, {}]'.format(*k.value[:2], *k.value[-2:])
                     s.append(z)
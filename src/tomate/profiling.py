@@ -0,0 +1,204 @@
+"""Profiling hooks.
+
+Allow to plug tracers into the scanning, loading and
+writing pipeline.
+Registered callables are notified of the start and end
+of each stage, along with some context (filename,
+keyrings, variable, ...).
+"""
+
+# This file is part of the 'tomate' project
+# (http://github.com/Descanonge/tomate) and subject
+# to the MIT License as defined in the file 'LICENSE',
+# at the root of this project. © 2020 Clément HAËCK
+
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List
+
+
+log = logging.getLogger(__name__)
+
+
+Hook = Callable[[str, str, float, Dict[str, Any]], None]
+"""Signature of a hook: stage name, event ('start' or 'end'),
+timestamp (from `time.perf_counter`), and context."""
+
+
+class HookRegistry():
+    """Collection of profiling hooks.
+
+    Each hook is called with the stage name, the event ('start' or 'end'),
+    a timestamp in seconds (from `time.perf_counter`), and a dictionnary
+    containing context about the stage.
+
+    When no hook is registered, signaling a stage costs close to nothing.
+
+    :param hooks: [opt] Hooks to register.
+
+    :attr hooks: List[Callable]: Registered hooks.
+
+    Examples
+    --------
+    >>> def print_hook(stage, event, timestamp, context):
+    ...     print(stage, event, context.get('filename'))
+    >>> db.hooks.add(print_hook)
+    """
+
+    def __init__(self, hooks: List[Hook] = None):
+        if hooks is None:
+            hooks = []
+        self.hooks = list(hooks)
+
+    def __repr__(self):
+        names = [getattr(h, '__name__', type(h).__name__) for h in self.hooks]
+        return "Hooks: {}".format(', '.join(names))
+
+    def __bool__(self):
+        """If any hook is registered."""
+        return len(self.hooks) > 0
+
+    def __len__(self) -> int:
+        return len(self.hooks)
+
+    def __iter__(self) -> Iterator[Hook]:
+        return iter(self.hooks)
+
+    def __add__(self, other: 'HookRegistry') -> 'HookRegistry':
+        """Return registry with hooks of both registries."""
+        return self.__class__(self.hooks + [h for h in other
+                                            if h not in self.hooks])
+
+    def add(self, hook: Hook):
+        """Register a hook."""
+        if hook not in self.hooks:
+            self.hooks.append(hook)
+
+    def remove(self, hook: Hook):
+        """Unregister a hook.
+
+        :raises ValueError: If hook is not registered.
+        """
+        self.hooks.remove(hook)
+
+    def clear(self):
+        """Unregister all hooks."""
+        self.hooks = []
+
+    def emit(self, stage: str, event: str, **context: Any):
+        """Send an event to all hooks."""
+        timestamp = time.perf_counter()
+        for hook in self.hooks:
+            hook(stage, event, timestamp, context)
+
+    @contextlib.contextmanager
+    def stage(self, stage: str, **context: Any):
+        """Signal start and end of a stage to hooks.
+
+        The end event is sent even if an exception is raised.
+
+        Examples
+        --------
+        >>> with db.hooks.stage('my_computation', variable='SST'):
+        ...     compute()
+        """
+        if not self.hooks:
+            yield
+            return
+
+        self.emit(stage, 'start', **context)
+        try:
+            yield
+        finally:
+            self.emit(stage, 'end', **context)
+
+
+class TraceCollector():
+    """Hook storing events in memory.
+
+    Events can be exported in the Chrome trace-event format, which can be
+    opened offline in a timeline viewer (such as chrome://tracing or
+    Perfetto).
+
+    Context values that are not JSON serializable (keyrings notably) are
+    stored as strings, at the moment of the event.
+
+    :attr events: List[Dict]: Events received, in the trace-event format.
+
+    Examples
+    --------
+    >>> collector = TraceCollector()
+    >>> db.hooks.add(collector)
+    >>> db.load(time=slice(0, 50))
+    >>> collector.write('load_trace.json')
+    """
+
+    PHASES = {'start': 'B', 'end': 'E'}
+    """Trace-event phase for each hook event."""
+
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter()
+
+    def __call__(self, stage: str, event: str,
+                 timestamp: float, context: Dict[str, Any]):
+        self.events.append({
+            'name': stage,
+            'cat': 'tomate',
+            'ph': self.PHASES[event],
+            'ts': (timestamp - self._origin) * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': {k: serialize_context(v) for k, v in context.items()}
+        })
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def clear(self):
+        """Remove all events, and reset time origin."""
+        self.events = []
+        self._origin = time.perf_counter()
+
+    def get_durations(self) -> Dict[str, float]:
+        """Return total duration of each stage, in seconds.
+
+        Nested calls of a same stage are only counted once.
+        """
+        durations = {}
+        opened = {}
+        for e in self.events:
+            key = (e['tid'], e['name'])
+            if e['ph'] == 'B':
+                opened.setdefault(key, []).append(e['ts'])
+            elif opened.get(key):
+                start = opened[key].pop()
+                if not opened[key]:
+                    durations.setdefault(e['name'], 0.)
+                    durations[e['name']] += (e['ts'] - start) / 1e6
+        return durations
+
+    def to_trace(self) -> Dict[str, Any]:
+        """Return events in the Chrome trace-event format."""
+        return {'traceEvents': list(self.events),
+                'displayTimeUnit': 'ms'}
+
+    def write(self, filename: str):
+        """Write events to a JSON file."""
+        with open(filename, 'w') as f:
+            json.dump(self.to_trace(), f)
+        log.info("Wrote %d trace events to %s", len(self.events), filename)
+
+
+def serialize_context(value: Any) -> Any:
+    """Make a context value JSON serializable."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [serialize_context(v) for v in value]
+    return str(value)
@@ -16,6 +16,7 @@ except ImportError:
 else:
     _has_cftime = True
 
+import tomate.coordinates.time_conversion as tconv
 from tomate.filegroup.coord_scan import CoordScan
 from tomate.filegroup.scanner import make_scanner
 
@@ -102,7 +103,7 @@ def get_date_from_matches(cs: CoordScan,
     if elt is not None:
         date["second"] = int(elt)
 
-    return cftime.date2num(cftime.datetime(**date), cs.units)
+    return float(tconv.date2num([cftime.datetime(**date)], cs.units)[0])
 
 
 @make_scanner('filename', ['values'])
@@ -77,10 +77,16 @@ class Scope():
             s += ": {}".format(self.name)
         return s
 
-    def __getattribute__(self, name):
-        if name in super().__getattribute__('dims'):
-            return super().__getattribute__('dims')[name]
-        return super().__getattribute__(name)
+    def __getattr__(self, name: str) -> Coord:
+        """Get coordinate.
+
+        Only called if `name` is not found as a normal attribute.
+        """
+        dims = self.__dict__.get('dims', {})
+        if name in dims:
+            return dims[name]
+        raise AttributeError("'{}' object has no attribute '{}'"
+                             .format(self.__class__.__name__, name))
 
     def __getitem__(self, item: str) -> Coord:
         """Return a dimension.
@@ -99,6 +105,10 @@ class Scope():
             varlist = list(self.var)
         return iter(varlist)
 
+    def __contains__(self, variable: str) -> bool:
+        """If variable is in scope."""
+        return not self.is_empty() and variable in self.var
+
     @property
     def coords(self) -> Dict[str, Coord]:
         """Coordinates present in the scope.
@@ -262,6 +272,26 @@ class Scope():
 
         :param coord: Coordinate to iterate along to. Must be subclass of Time.
 
+        See also
+        --------
+        iter_slices: Iter through any coordinate
+        iter_slices_date: Iter through days, months, or years.
+        """
+        return self.iter_slices_date(coord, 'month', key)
+
+    def iter_slices_date(self, coord: str = 'time', freq: str = 'month',
+                         key: KeyLikeInt = None) -> List[KeyLikeInt]:
+        """Iter through days, monthes, or years of a time coordinate.
+
+        Each slice contains consecutive indices of the same date.
+
+        :param coord: Coordinate to iterate along to. Must be subclass of Time.
+        :param freq: {'day', 'month', 'year'}
+        :param key: Subpart of coordinate to iter through.
+
+        :raises TypeError: If the coordinate is not a subclass of Time.
+        :raises ValueError: If `freq` is not valid.
+
         See also
         --------
         iter_slices: Iter through any coordinate
@@ -277,23 +307,23 @@ class Scope():
             raise TypeError("'{}' is not a subclass of Time (is {})"
                             .format(coord, type(coord)))
 
-        dates = c.index2date(key.value)
+        if freq == 'day':
+            groups = c.get_days()
+        elif freq == 'month':
+            groups = c.get_months()
+        elif freq == 'year':
+            groups = c.calendar_fields['year']
+        else:
+            raise ValueError("Frequency should be one of 'day', 'month', 'year'"
+                             " (is {})".format(freq))
+
+        groups = np.atleast_1d(groups[key.value])
+        bounds = [0, *(np.flatnonzero(np.diff(groups)) + 1), groups.size]
         slices = []
-        indices = []
-        m_old = dates[0].month
-        y_old = dates[0].year
-        for i, d in enumerate(dates):
-            m = d.month
-            y = d.year
-            if m != m_old or y != y_old:
-                key_out = key * Key(indices)
-                key_out.simplify()
-                slices.append(key_out.value)
-                indices = []
-            indices.append(i)
-            m_old = m
-            y_old = y
-        slices.append(indices)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            key_out = key * Key(list(range(start, stop)))
+            key_out.simplify()
+            slices.append(key_out.value)
 
         return slices
 
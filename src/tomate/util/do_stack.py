@@ -6,6 +6,7 @@
 # at the root of this project. © 2020 Clément HAËCK
 
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, List
 
 import numpy as np
@@ -16,43 +17,91 @@ from tomate.custom_types import Array
 def do_stack(func: Callable, ndim: int,
              array: Array, *args: Any,
              axes: List[int] = None,
-             output=None, **kwargs: Any):
+             output: np.ndarray = None,
+             vectorized: bool = False,
+             threads: int = None, **kwargs: Any) -> np.ndarray:
     """Apply func over certain axes of array. Loop over remaining axes.
 
+    Remaining axes are stacked into a single one.
+    If `vectorized`, func is called with a batch of slices,
+    of shape (n, ...), rather than one slice at a time. This is the case
+    of most functions of scipy.ndimage, by adding a leading singleton
+    dimension to their kernel.
+    With `threads`, the stack is split in contiguous blocks, processed
+    in a pool of threads. This is only beneficial if func releases the
+    GIL (as numpy and scipy.ndimage do).
+
+    Results are written directly into the output array.
+
     :param func: Function which takes a slice of array.
-        Dimension of slice is dictated by `ndim`.
+        Dimension of slice is dictated by `ndim`. Results must have
+        the same number of dimensions.
     :param ndim: The number of dimensions func works on. The remaining dimension
         in input array will be treated as stacked and looped over.
     :param axes: Axes that func should work over, default is the last ndim axes.
-    :param output: Result passed to output. default to np.zeros.
+    :param output: Result passed to output. Default to a new array, of the type
+        returned by func.
+    :param vectorized: [opt] If True, func is called on batches of slices.
+    :param threads: [opt] Number of threads to use.
+
+    Examples
+    --------
+    Convolve each time step of an array of shape (time, lat, lon)
+
+    >>> do_stack(ndimage.convolve, 2, array, kernel)
+
+    or all at once
+
+    >>> do_stack(ndimage.convolve, 2, array, kernel[None, :, :],
+    ...          vectorized=True)
     """
     if axes is None:
         axes = list(range(-ndim, 0))
     lastaxes = list(range(-ndim, 0))
 
-    # Swap axes to the end
-    for i in range(ndim):
-        array = np.swapaxes(array, axes[i], lastaxes[i])
-
-    # Save shape
+    # Move axes to the end, and place all stack into one dimension
+    array = np.moveaxis(array, axes, lastaxes)
     stackshape = array.shape[:-ndim]
+    stack = np.reshape(array, (-1, *array.shape[-ndim:]))
+    n = stack.shape[0]
+
+    def apply(start: int, stop: int):
+        if vectorized:
+            out_stack[start:stop] = func(stack[start:stop], *args, **kwargs)
+        else:
+            for i in range(start, stop):
+                out_stack[i] = func(stack[i], *args, **kwargs)
+
+    start = 0
+    if output is not None:
+        out_stack = np.moveaxis(output, axes, lastaxes)
+        out_stack = np.reshape(out_stack, (-1, *out_stack.shape[-ndim:]))
+    elif n == 0:
+        out_stack = np.zeros(stack.shape)
+    else:
+        # Compute first slice to know the output type
+        if vectorized:
+            first = func(stack[:1], *args, **kwargs)[0]
+        else:
+            first = np.asarray(func(stack[0], *args, **kwargs))
+        out_stack = np.empty((n, *first.shape), dtype=first.dtype)
+        out_stack[0] = first
+        start = 1
+
+    if threads is None or threads < 2 or n - start < 2:
+        apply(start, n)
+    else:
+        threads = min(threads, n - start)
+        bounds = np.linspace(start, n, threads+1).astype(int)
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(apply, bounds[:-1], bounds[1:]))
+
+    out_stack = np.reshape(out_stack, (*stackshape, *out_stack.shape[-ndim:]))
+    out_stack = np.moveaxis(out_stack, lastaxes, axes)
 
     if output is None:
-        output = np.zeros(array.shape)
-
-    # Place all stack into one dimension
-    array = np.reshape(array, (-1, *array.shape[-ndim:]))
-    output = np.reshape(output, (-1, *output.shape[-ndim:]))
-
-    for i in range(array.shape[0]):
-        output[i] = func(array[i], *args, **kwargs)
-
-    array = np.reshape(array, (*stackshape, *array.shape[-ndim:]))
-    output = np.reshape(output, (*stackshape, *output.shape[-ndim:]))
-
-    # Reswap axes
-    for i in range(ndim):
-        array = np.swapaxes(array, axes[i], lastaxes[i])
-        output = np.swapaxes(output, axes[i], lastaxes[i])
-
+        return out_stack
+    # Reshaping the output may have made a copy
+    if not np.may_share_memory(out_stack, output):
+        output[...] = out_stack
     return output
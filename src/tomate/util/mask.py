@@ -10,6 +10,7 @@ import numpy as np
 
 try:
     import scipy.ndimage as ndimage
+    import scipy.signal as signal
 except ImportError:
     _has_scipy = False
 else:
@@ -18,6 +19,10 @@ else:
 from tomate.util.do_stack import do_stack
 
 
+DILATION_METHODS = ['auto', 'dilation', 'fft', 'distance']
+"""Methods available to enlarge masks."""
+
+
 def get_circle_kernel(n):
     """Return circular kernel for convolution of size nxn.
 
@@ -31,17 +36,30 @@ def get_circle_kernel(n):
     Array
         Shape (n, n)
     """
-    kernel = np.zeros((n, n))
-    for i in range(n):
-        for j in range(n):
-            kernel[i, j] = (i-(n-1)/2)**2 + (j-(n-1)/2)**2 <= (n/2)**2
+    x = np.arange(n) - (n-1)/2
+    kernel = x[:, None]**2 + x[None, :]**2 <= (n/2)**2
+    return kernel.astype(float)
 
-    return kernel
 
-
-def enlarge_mask(mask, n_neighbors, axes=None):
+def enlarge_mask(mask, n_neighbors, axes=None, method='auto'):
     """Enlarge a stack of boolean mask by `n_neighbors`.
 
+    All points at a distance less than `n_neighbors` + 1/2 of a masked
+    point are masked (the circular kernel of :func:`get_circle_kernel`).
+
+    Different methods are available:
+
+    * 'dilation': binary dilation of the whole stack at once. Exact,
+      and does not copy the mask, but its cost grows with the kernel
+      area.
+    * 'fft': convolution by Fast Fourier Transform. Its cost barely
+      depends on the kernel size, but it makes a float copy of the
+      mask.
+    * 'distance': euclidean distance transform, slice by slice. Exact,
+      its cost does not depend on the kernel size.
+    * 'auto': dilation for small kernels (`n_neighbors` up to 2),
+      fft for medium ones (up to 16), distance transform otherwise.
+
     Parameters
     ----------
     mask: Array
@@ -49,13 +67,57 @@ def enlarge_mask(mask, n_neighbors, axes=None):
     axes: List[int]
         Position of the two horizontal dimensions,
         other axes will be looped over.
+    method: str
+        Method to use, see above.
+
+    Returns
+    -------
+    Array
+        Boolean array, same shape as `mask`.
     """
     if not _has_scipy:
         raise ImportError("scipy package necessary to use enlarge_mask.")
-
+    if method not in DILATION_METHODS:
+        raise ValueError("Method must be one of {} (is '{}')."
+                         .format(DILATION_METHODS, method))
+
+    mask = np.asarray(mask, dtype=bool)
+    if axes is None:
+        axes = [-2, -1]
+    axes = [a % mask.ndim for a in axes]
+    if n_neighbors < 1:
+        return mask.copy()
+
+    if method == 'auto':
+        if n_neighbors <= 2:
+            method = 'dilation'
+        elif n_neighbors <= 16:
+            method = 'fft'
+        else:
+            method = 'distance'
+
+    if method == 'distance':
+        return do_stack(_dilate_distance, 2, mask, n_neighbors, axes=axes)
+
+    # Kernel with singleton dimensions for stacked axes
     N = 2*n_neighbors + 1
     kernel = get_circle_kernel(N)
+    shape = [1] * mask.ndim
+    shape[axes[0]] = shape[axes[1]] = N
+    kernel = kernel.reshape(shape)
+
+    if method == 'dilation':
+        return ndimage.binary_dilation(mask, kernel > 0)
+
+    conv = signal.fftconvolve(mask.astype(np.float32),
+                              kernel.astype(np.float32),
+                              mode='same', axes=axes)
+    return conv > 0.5
 
-    mask = do_stack(ndimage.convolve, 2, 1.*mask, kernel, axes) > 0
 
-    return mask
+def _dilate_distance(mask, n_neighbors):
+    """Enlarge 2D mask using the distance transform."""
+    if not mask.any():
+        return mask.copy()
+    distance = ndimage.distance_transform_edt(~mask)
+    return distance <= n_neighbors + 0.5
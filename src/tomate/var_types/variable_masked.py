@@ -6,7 +6,7 @@
 # at the root of this project. © 2020 Clément HAËCK
 
 
-from typing import List, Union
+from typing import List, Tuple, Union
 import logging
 
 import numpy as np
@@ -121,11 +121,91 @@ class VariableMasked(Variable):
         """
         if not dims:
             dims = self.dims
-        axis = [self.dims.index(c) for c in dims]
+        axis = tuple(self.dims.index(c) for c in dims)
 
         size = 1
         for c in dims:
             size *= self._db.loaded[c].size
 
-        cover = np.sum(~self[:].mask, axis=tuple(axis))
+        mask = np.ma.getmask(self[:])
+        if mask is np.ma.nomask:
+            shape = [n for i, n in enumerate(self.shape) if i not in axis]
+            cover = np.full(shape, size)[()]
+        else:
+            cover = size - np.count_nonzero(mask, axis=axis)
         return cover / size * 100
+
+
+def get_valid(data: Array) -> np.ndarray:
+    """Return valid values of an array.
+
+    Values are invalid if masked or NaN.
+    Work directly on the data and mask arrays.
+
+    :returns: Boolean array, True where values are valid.
+    """
+    values = np.ma.getdata(data)
+    mask = np.ma.getmask(data)
+    if values.dtype.kind in 'fc':
+        valid = np.isnan(values)
+        if mask is not np.ma.nomask:
+            valid |= mask
+        return np.logical_not(valid, out=valid)
+    if mask is not np.ma.nomask:
+        return ~mask
+    return np.ones(values.shape, dtype=bool)
+
+
+def reduce_masked(data: Array, axis: Union[int, Tuple[int]] = None,
+                  how: str = 'mean', ddof: int = 0) -> Array:
+    """Reduce a masked array, ignoring masked and NaN values.
+
+    Equivalent to numpy.nanmean, nansum and nanstd applied on a masked
+    array, but works directly on the data and mask arrays. This avoids
+    the overhead of numpy masked arrays functions, and their temporary
+    arrays.
+
+    :param axis: [opt] Axes to reduce along. Default to all.
+    :param how: {'mean', 'sum', 'std'}
+    :param ddof: [opt] Delta degrees of freedom for the standard deviation.
+    :returns: Masked array, masked where there is no valid values.
+        If all axes are reduced, a scalar (or numpy.ma.masked).
+    """
+    values = np.ma.getdata(data)
+    if axis is None:
+        axis = tuple(range(values.ndim))
+    elif isinstance(axis, int):
+        axis = (axis,)
+    is_float = values.dtype.kind in 'fc'
+    acc_type = np.result_type(values.dtype, np.float64)
+
+    valid = get_valid(data)
+    count = np.count_nonzero(valid, axis=axis)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if how == 'sum':
+            result = np.add.reduce(values, axis=axis, where=valid,
+                                   dtype=acc_type if is_float else None)
+        else:
+            total = np.add.reduce(values, axis=axis, where=valid,
+                                  dtype=acc_type)
+            result = total / count
+        if how == 'std':
+            dev = np.subtract(values, np.expand_dims(result, axis),
+                              dtype=acc_type)
+            if dev.dtype.kind == 'c':
+                dev = np.abs(dev)
+            np.square(dev, out=dev)
+            m2 = np.add.reduce(dev, axis=axis, where=valid).real
+            del dev
+            result = np.sqrt(m2 / (count - ddof))
+
+    if is_float:
+        out_type = values.dtype
+        if how == 'std':
+            out_type = np.zeros(0, values.dtype).real.dtype
+        result = result.astype(out_type, copy=False)
+    empty = count == 0
+    if np.ndim(result) == 0:
+        return np.ma.masked if empty else result[()]
+    return np.ma.array(result, mask=empty)
@@ -55,10 +55,15 @@ class VariableAttributes(dict):
         super().__setattr__('_vi', vi)
         super().__init__(**kwargs)
 
-    def __getattribute__(self, name: str):
+    def __getattr__(self, name: str):
+        """Get attribute value.
+
+        Only called if `name` is not found as a normal attribute.
+        """
         if name in self:
             return self[name]
-        return super().__getattribute__(name)
+        raise AttributeError("Variable '{}' has no attribute '{}'"
+                             .format(self.__dict__.get('_name'), name))
 
     def __setattr__(self, name: str, value: Any):
         self._vi.set_attribute(self._name, name, value)
@@ -97,7 +102,7 @@ class VariablesInfo():
         self._infos = {}
 
         for var, attrs in attributes.items():
-            self.set_attributes_variable(var, **attrs)
+            self.set_attributes(var, **attrs)
         self.set_infos(**infos)
 
     @property
@@ -124,26 +129,24 @@ class VariablesInfo():
         s.append("Infos: {}".format(', '.join(self.infos)))
         return '\n'.join(s)
 
-    def __getattribute__(self, item: str):
-        """Make attributes and infos accessible as attributes."""
-        get = super().__getattribute__
+    def __getattr__(self, item: str):
+        """Make attributes and infos accessible as attributes.
 
-        # Allow to access self._attributes and self._infos
-        # normally, useful when calling self.attributes
-        # Does not allow use of methods in self.attributes
-        if item in get('__dict__'):
-            return get('__dict__')[item]
-
-        if item in super().__getattribute__('attributes'):
-            d = {var: values[item]
-                 for var, values in get('_attributes').items()
-                 if item in values}
+        Only called if `item` is not found as a normal attribute, so
+        methods and properties take precedence.
+        """
+        attributes = self.__dict__.get('_attributes', {})
+        d = {var: values[item] for var, values in attributes.items()
+             if item in values}
+        if d:
             return Attribute(item, self, d)
 
-        if item in get('_infos'):
-            return get('_infos')[item]
+        infos = self.__dict__.get('_infos', {})
+        if item in infos:
+            return infos[item]
 
-        return get(item)
+        raise AttributeError("'{}' object has no attribute '{}'"
+                             .format(self.__class__.__name__, item))
 
     def __iter__(self) -> Iterator[str]:
         """Enumerate over attributes attributes / variables pairs."""
@@ -291,15 +294,15 @@ class VariablesInfo():
         """Return copy of self."""
         vi = VariablesInfo()
 
-        for attr, values in self._attrs.items():
-            for var, value in values.items():
+        for var, values in self._attributes.items():
+            for attr, value in values.items():
                 try:
                     value_copy = copy.deepcopy(value)
                 except AttributeError:
                     log.warning("Could not copy '%s' attribute (type: %s)",
                                 attr, type(value))
                     value_copy = value
-                vi.set_attr(var, attr, value_copy)
+                vi.set_attribute(var, attr, value_copy)
 
         for info, value in self._infos.items():
             try:
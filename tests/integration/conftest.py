@@ -0,0 +1,27 @@
+"""Fixtures for tests on synthetic archives on disk."""
+
+import pytest
+
+pytest.importorskip('netCDF4')
+pytest.importorskip('cftime')
+
+from benchmarks.archive import generate_archive, get_constructor  # noqa: E402
+
+
+@pytest.fixture
+def make_archive(tmp_path):
+    """Return a function generating a single filegroup archive.
+
+    The function returns the database scanned from the archive (of type
+    DataCompute), with time in hours, and latitude descending in files.
+    """
+    def make(n_files, n_steps, variables=('SST', 'SSH'), var_shared=False,
+             scale=0.1):
+        archive = dict(filegroups=[dict(name='data', variables=list(variables),
+                                        n_files=n_files, n_steps=n_steps,
+                                        var_shared=var_shared)],
+                       scale=scale)
+        root = str(tmp_path / 'archive')
+        generate_archive(root, archive)
+        return get_constructor(root, archive).make_data(scan=True)
+    return make
@@ -0,0 +1,57 @@
+
+import numpy as np
+import pytest
+
+
+def gradient_magn(db):
+    return db.gradient_magn('SST', ['lat', 'lon'], fill=0.)
+
+
+@pytest.mark.parametrize('chunks', [dict(lat=4, lon=5),
+                                    dict(time=3, lat=2, lon=12),
+                                    dict(lat=9)])
+@pytest.mark.parametrize('keys', [{}, dict(lat=slice(1, None),
+                                          lon=slice(0, 10))])
+def test_map_overlap(make_archive, chunks, keys):
+    db = make_archive(2, 5)
+    dims = ['time', 'lat', 'lon']
+    result = db.map_overlap(gradient_magn, dims, chunks, halo=1,
+                            var='SST', **keys)
+    assert db.loaded.is_empty()
+
+    db.load(var='SST', **keys)
+    expected = gradient_magn(db)
+    # Masked input
+    assert np.ma.getmaskarray(expected).any()
+    assert isinstance(result, np.ma.MaskedArray)
+    assert result.shape == expected.shape
+    assert np.array_equal(np.ma.getmaskarray(result),
+                          np.ma.getmaskarray(expected))
+    np.testing.assert_allclose(result.compressed(), expected.compressed())
+
+    # First and last chunks
+    for idx in [(slice(None), slice(0, 2)), (slice(None), slice(-2, None)),
+                (slice(None), slice(None), 0), (slice(None), slice(None), -1)]:
+        np.testing.assert_allclose(result[idx].filled(0.),
+                                   expected[idx].filled(0.))
+
+
+def test_map_overlap_output(make_archive):
+    db = make_archive(2, 5)
+    output = np.zeros((10, 9, 12))
+    result = db.map_overlap(lambda db: db.gradient('SST', ['time'], fill=0.),
+                            ['time', 'lat', 'lon'], dict(time=3),
+                            output=output, var='SST')
+    assert result is output
+
+    db.load(var='SST')
+    np.testing.assert_allclose(output, db.gradient('SST', ['time'], fill=0.))
+
+    with pytest.raises(TypeError):
+        db.map_overlap(gradient_magn, ['time', 'lat', 'lon'], dict(lat=4),
+                       lat=[0, 1, 2])
+    with pytest.raises(ValueError):
+        db.map_overlap(gradient_magn, ['time', 'lat', 'lon'], dict(lat=4),
+                       lat=slice(0, 8, 2))
+    with pytest.raises(ValueError):
+        db.map_overlap(gradient_magn, ['lat', 'lon'], dict(time=4))
@@ -0,0 +1,32 @@
+
+import os
+
+import pytest
+
+from tests.integration.test_write_split import assert_same_data, rescan
+
+
+def transform(db):
+    db['SST'][:] = 2.*db['SST'][:] + 1.
+
+
+@pytest.mark.parametrize('workers', [None, 3])
+def test_map_to_disk(make_archive, tmp_path, workers):
+    db = make_archive(3, 5)
+    directory = str(tmp_path / 'mapped')
+    os.makedirs(directory)
+
+    pregex = r'sst_%(time:Y:dummy)%(time:m:dummy)%(time:d:dummy)\.nc'
+    filenames = db.map_to_disk(transform, pregex, size=4,
+                               directory=directory, workers=workers,
+                               var='SST', lat=slice(2, None))
+    assert db.loaded.is_empty()
+    assert filenames == ['sst_20000101.nc', 'sst_20000105.nc',
+                         'sst_20000109.nc', 'sst_20000113.nc']
+    assert sorted(os.listdir(directory)) == filenames
+
+    db.load(var='SST', lat=slice(2, None))
+    transform(db)
+    db_mapped = rescan(directory, pregex, 'time')
+    assert db_mapped.avail.var[:].tolist() == ['SST']
+    assert_same_data(db, db_mapped)
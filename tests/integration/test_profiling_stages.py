@@ -0,0 +1,71 @@
+
+import os
+
+from tomate.profiling import TraceCollector
+
+from benchmarks.archive import generate_archive, get_constructor
+
+
+def get_stages(collector, event='B'):
+    """Return (stage, args) of events of a phase."""
+    return [(e['name'], e['args']) for e in collector.events
+            if e['ph'] == event]
+
+
+def assert_balanced(collector):
+    starts = [e['name'] for e in collector.events if e['ph'] == 'B']
+    ends = [e['name'] for e in collector.events if e['ph'] == 'E']
+    assert sorted(starts) == sorted(ends)
+
+
+def test_profiling_stages(tmp_path):
+    root = str(tmp_path / 'archive')
+    archive = dict(filegroups=[dict(name='data', variables=['SST', 'SSH'],
+                                    n_files=2, n_steps=3, var_shared=False)],
+                   scale=0.1)
+    generate_archive(root, archive)
+    cstr = get_constructor(root, archive)
+    collector = TraceCollector()
+    cstr.add_hook(collector)
+
+    # Scanning
+    db = cstr.make_data(scan=True)
+    assert_balanced(collector)
+    stages = get_stages(collector)
+    scanned = [args['filename'] for name, args in stages
+               if name == 'scan_file']
+    assert scanned == ['data_0000.nc', 'data_0001.nc']
+    opened = [args for name, args in stages if name == 'open_file']
+    assert opened[0]['filename'] == os.path.join(root, 'data', 'data_0000.nc')
+    assert opened[0]['mode'] == 'r'
+    assert all(args['filegroup'] == 'data' for _, args in stages)
+
+    # Loading, hooks of the database
+    collector_db = TraceCollector()
+    db.hooks.add(collector_db)
+    collector.clear()
+    db.load(var='SST', time=slice(1, 5))
+    assert_balanced(collector)
+    stages = get_stages(collector)
+    assert get_stages(collector_db) == stages
+    assert [name for name, _ in stages] == (
+        ['load', 'get_commands']
+        + ['open_file', 'load_cmd', 'take', 'place'] * 2)
+    cmds = [args['filename'] for name, args in stages if name == 'load_cmd']
+    assert cmds == [os.path.join(root, 'data', f)
+                    for f in ['data_0000.nc', 'data_0001.nc']]
+    for name, args in stages:
+        if name in ['take', 'place']:
+            assert args['variable'] == 'SST'
+            assert args['filegroup'] == 'data'
+
+    # Writing
+    collector.clear()
+    db.write('out.nc', str(tmp_path))
+    assert_balanced(collector)
+    stages = get_stages(collector)
+    assert [name for name, _ in stages] == ['open_file', 'write']
+    filename = str(tmp_path / 'out.nc')
+    assert stages[0][1]['mode'] == 'w'
+    assert all(args['filename'] == filename for _, args in stages)
+    assert 'SST' in stages[1][1]['keyrings'][0]
@@ -0,0 +1,87 @@
+
+import numpy as np
+import pytest
+
+
+def assert_same(result, expected):
+    assert np.shape(result) == np.shape(expected)
+    assert np.array_equal(np.ma.getmaskarray(result),
+                          np.ma.getmaskarray(expected))
+    np.testing.assert_allclose(np.ma.filled(result, 0.),
+                               np.ma.filled(expected, 0.),
+                               rtol=1e-5, atol=1e-6)
+
+
+def test_iter_load(make_archive):
+    db = make_archive(3, 5)
+    db.load(var='SST')
+    whole = db['SST'][:].copy()
+
+    slices = []
+    for slc in db.iter_load('time', 4, 'SST', lat=slice(2, 7)):
+        slices.append(slc)
+        assert db.loaded.time.size == len(range(15)[slc])
+        assert np.ma.allequal(db['SST'][:], whole[slc, 2:7])
+    assert [range(15)[s] for s in slices] == [range(0, 4), range(4, 8),
+                                              range(8, 12), range(12, 15)]
+    assert db.loaded.is_empty()
+
+
+def test_iter_load_interrupted(make_archive):
+    db = make_archive(3, 5)
+    for slc in db.iter_load('time', 4, 'SST'):
+        assert not db.loaded.is_empty()
+        break
+    assert db.loaded.is_empty()
+
+    with pytest.raises(ValueError):
+        for slc in db.iter_load('time', 4, 'SST'):
+            raise ValueError()
+    assert db.loaded.is_empty()
+
+
+@pytest.mark.parametrize('size', [1, 4, 15])
+@pytest.mark.parametrize('dims', ['time', ['lat', 'lon'], None])
+@pytest.mark.parametrize('keys', [{}, dict(time=slice(1, 14), lat=slice(2, 9),
+                                          lon=0)])
+def test_reduce_disk(make_archive, dims, size, keys):
+    db = make_archive(3, 5)
+    # lon is squeezed by its key
+    if dims is not None and 'lon' in dims and 'lon' in keys:
+        dims = 'lat'
+    results = {how: func('SST', dims, size=size, **keys)
+               for how, func in [('mean', db.mean_disk),
+                                 ('sum', db.sum_disk),
+                                 ('std', db.std_dev_disk)]}
+    assert db.loaded.is_empty()
+
+    db.load('SST', **keys)
+    assert db.loaded.time.size > size or size == 15
+    # Squeeze dimensions selected by an integer, as on disk
+    squeeze = {d: 0 for d, k in keys.items() if isinstance(k, int)}
+    for how, func in [('mean', db.mean), ('sum', db.sum),
+                      ('std', db.std_dev)]:
+        assert_same(results[how], func('SST', dims, **squeeze))
+
+
+@pytest.mark.parametrize('bins', [8, [-3., -1., -0.2, 0., 0.5, 3.]])
+@pytest.mark.parametrize('size', [1, 4, 15])
+def test_histogram_disk(make_archive, bins, size):
+    db = make_archive(3, 5)
+    keys = dict(time=slice(1, 14), lat=slice(3, None))
+    hist, edges = db.histogram_disk('SST', bins, (-2.5, 2.5), size=size,
+                                    **keys)
+    density, _ = db.histogram_disk('SST', bins, (-2.5, 2.5), density=True,
+                                   size=size, **keys)
+    assert db.loaded.is_empty()
+
+    db.load('SST', **keys)
+    data = db['SST'][:]
+    # Masked values
+    assert np.ma.getmaskarray(data).any()
+    expected, expected_edges = db.histogram('SST', bins, (-2.5, 2.5))
+    assert np.array_equal(edges, expected_edges)
+    assert np.array_equal(hist, expected)
+    assert hist.sum() == np.sum((data >= edges[0]) & (data <= edges[-1]))
+    np.testing.assert_allclose(
+        density, db.histogram('SST', bins, (-2.5, 2.5), density=True)[0])
@@ -0,0 +1,61 @@
+
+import os
+
+import numpy as np
+import pytest
+
+nc = pytest.importorskip('netCDF4')
+
+
+def test_write_append(make_archive, tmp_path):
+    db = make_archive(4, 5)
+    directory = str(tmp_path)
+    filename = os.path.join(directory, 'append.nc')
+
+    chunks = [slice(0, 7), slice(7, 8), slice(8, 20)]
+    for slc in chunks:
+        db.load(time=slc)
+        db.write_append('append.nc', 'time', directory=directory)
+
+    db.load()
+    with nc.Dataset(filename) as f:
+        assert f.dimensions['time'].isunlimited()
+        assert not f.dimensions['lat'].isunlimited()
+        assert f.dimensions['time'].size == 20
+        assert f['time'].dtype == np.float64
+        np.testing.assert_array_equal(f['time'][:], db.loaded.time[:])
+        np.testing.assert_array_equal(f['lat'][:], db.loaded.lat[:])
+        for var in db.loaded.var:
+            data = db[var][:]
+            written = f[var][:]
+            assert np.array_equal(np.ma.getmaskarray(written),
+                                  np.ma.getmaskarray(data))
+            assert np.array_equal(written.compressed(), data.compressed())
+
+    # A single index keeps the dimension
+    db.load(time=3)
+    db.write_append('append.nc', 'time', directory=directory, var='SST')
+    with nc.Dataset(filename) as f:
+        assert f.dimensions['time'].size == 21
+        assert f['time'][20] == db.loaded.time[0]
+        assert np.ma.allclose(f['SST'][20], db['SST'][0])
+
+
+def test_write_append_mismatch(make_archive, tmp_path):
+    db = make_archive(2, 5)
+    directory = str(tmp_path)
+
+    db.load(time=slice(0, 2), lat=slice(0, 4))
+    db.write_append('append.nc', directory=directory)
+
+    db.load(time=slice(2, 4))
+    with pytest.raises(ValueError):
+        db.write_append('append.nc', directory=directory)
+
+    # Not unlimited
+    db.load(time=slice(2, 4), lat=slice(0, 4))
+    with pytest.raises(ValueError):
+        db.filegroups[0].write_append('append.nc', 'lon', directory)
+
+    with nc.Dataset(os.path.join(directory, 'append.nc')) as f:
+        assert f.dimensions['time'].size == 2
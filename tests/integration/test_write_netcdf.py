@@ -0,0 +1,69 @@
+
+import os
+
+import numpy as np
+import pytest
+
+nc = pytest.importorskip('netCDF4')
+
+from tomate.db_types import DataCompute  # noqa: E402
+from tomate.scan_library.nc import scan_file  # noqa: E402
+
+
+def get_db(directory):
+    """Scan a file with a string coordinate, and float64 time."""
+    filename = os.path.join(directory, 'in.nc')
+    with nc.Dataset(filename, 'w') as f:
+        f.createDimension('station', 50)
+        f.createDimension('time', 4)
+        f.createVariable('station', str, ['station'])
+        f['station'][:] = np.array(['st{:02d}'.format(i) for i in range(50)],
+                                   dtype=object)
+        f.createVariable('time', 'f8', ['time'])
+        f['time'].units = 'days since 2000-01-01'
+        f['time'][:] = [0.1234567891, 1.5, 2.25, 3.0000001]
+        f.createVariable('A', 'f8', ['time', 'station'])
+        f['A'][:] = np.arange(200.).reshape(4, 50)
+        f['A'].long_name = 'Some variable'
+        f.title = 'Input'
+    return scan_file(filename, [DataCompute])
+
+
+def test_write_coords_attributes(tmp_path):
+    directory = str(tmp_path)
+    db = get_db(directory)
+    db.load()
+    # Attributes that cannot be written as is
+    db.vi.set_attributes('A', flag=True, missing=None)
+    db.vi.set_infos(checked=True)
+
+    db.write('out.nc', directory=directory)
+    db.write('out_sub.nc', directory=directory, station=slice(10, 20))
+
+    with nc.Dataset(os.path.join(directory, 'out.nc')) as f:
+        assert f['station'].dtype is str
+        assert f['station'][:].tolist() == db.loaded.station[:].tolist()
+        assert f['time'].dtype == np.float64
+        assert f['time'][:].tolist() == db.loaded.time[:].tolist()
+        assert np.array_equal(f['A'][:], np.arange(200.).reshape(4, 50))
+
+        assert f.getncattr('title') == 'Input'
+        assert f.getncattr('checked') == 'True'
+        assert f['A'].getncattr('long_name') == 'Some variable'
+        assert f['A'].getncattr('flag') == 'True'
+        assert f['A'].getncattr('missing') == 'None'
+        for dim in ['station', 'time']:
+            assert set(f[dim].ncattrs()) >= {'fullname', 'units'}
+        assert f['time'].units == db.loaded.time.units
+
+    with nc.Dataset(os.path.join(directory, 'out_sub.nc')) as f:
+        assert f['station'][:].tolist() == ['st{:02d}'.format(i)
+                                            for i in range(10, 20)]
+        assert f['A'].shape == (4, 10)
+
+    # Written file is scanned back the same
+    db_out = scan_file(os.path.join(directory, 'out.nc'), [DataCompute])
+    db_out.load()
+    assert db_out.loaded.station[:].tolist() == db.loaded.station[:].tolist()
+    assert np.array_equal(db_out.loaded.time[:], db.loaded.time[:])
+    assert np.array_equal(db_out['A'][:], db['A'][:])
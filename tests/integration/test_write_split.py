@@ -0,0 +1,79 @@
+
+import os
+
+import numpy as np
+import pytest
+
+from tomate import Constructor, Lat, Lon, Time
+from tomate.db_types import DataCompute
+from tomate.filegroup import FilegroupNetCDF
+import tomate.scan_library as scanlib
+
+from benchmarks.archive import DB_UNITS
+
+
+def rescan(root, pregex, along):
+    """Scan written files, `along` being shared among files.
+
+    Files are written with the database time units.
+    """
+    cstr = Constructor(root, [Time('time', None, DB_UNITS), Lat(), Lon()])
+    coords = [cstr.CSS(c, 'shared' if c == along else 'in')
+              for c in ['time', 'lat', 'lon']]
+    cstr.add_filegroup(FilegroupNetCDF, coords, name='split')
+    cstr.set_fg_regex(pregex)
+    if along == 'lat':
+        cstr.add_scan_filename(scanlib.get_value_from_matches, 'lat')
+        cstr.set_elements_constant('lat', in_idx=0)
+        cstr.add_scan_in_file(scanlib.nc.scan_dims, 'time', 'lon')
+    else:
+        cstr.add_scan_in_file(scanlib.nc.scan_dims, 'time', 'lat', 'lon')
+    cstr.add_scan_in_file(scanlib.nc.scan_variables, 'var')
+    cstr.add_scan_variables_attributes(scanlib.nc.scan_variables_attributes)
+    cstr.add_scan_variables_attributes(scanlib.nc.scan_variables_datatype)
+    cstr.set_data_types([DataCompute])
+    return cstr.make_data(scan=True)
+
+
+def assert_same_data(db, db_split):
+    db_split.load()
+    for dim in db.dims:
+        assert np.array_equal(db_split.loaded[dim][:], db.loaded[dim][:])
+    for var in db.loaded.var:
+        data = db[var][:]
+        split = db_split[var][:]
+        assert np.array_equal(np.ma.getmaskarray(split),
+                              np.ma.getmaskarray(data))
+        assert np.array_equal(split.compressed(), data.compressed())
+
+
+@pytest.mark.parametrize('workers', [None, 3])
+@pytest.mark.parametrize('along, freq, pregex, n_files', [
+    ('time', 'month', r'%(time:Y:dummy)%(time:m:dummy)\.nc', 3),
+    ('time', 7, r'week_%(time:idx:dummy)\.nc', 12),
+    ('lat', 1, r'lat_%(lat:value:custom=[-\d.]+:)\.nc', 9)
+])
+def test_write_split(make_archive, tmp_path, along, freq, pregex, n_files,
+                     workers):
+    db = make_archive(4, 20)
+    db.load()
+    directory = str(tmp_path / 'split')
+    os.makedirs(directory)
+
+    filenames = db.write_split(along, freq, pregex, directory=directory,
+                               workers=workers)
+    assert len(filenames) == n_files
+    assert sorted(os.listdir(directory)) == sorted(filenames)
+    if freq == 'month':
+        assert filenames == ['200001.nc', '200002.nc', '200003.nc']
+
+    assert_same_data(db, rescan(directory, pregex, along))
+
+
+def test_write_split_same_filename(make_archive, tmp_path):
+    db = make_archive(4, 20)
+    db.load(var='SST')
+    with pytest.raises(ValueError):
+        db.write_split('time', 'month', r'%(time:Y:dummy)\.nc',
+                       directory=str(tmp_path))
+    assert os.listdir(str(tmp_path)) == ['archive']
@@ -12,9 +12,11 @@ def values():
     return a
 
 
-@pytest.fixture
-def coord(values):
+@pytest.fixture(params=['array', 'regular'])
+def coord(values, request):
     c = Coord('coord_test', values)
+    if request.param == 'regular':
+        assert c.make_regular()
     return c
 
 
@@ -84,6 +86,20 @@ def test_get_index(coord):
     test(coord)
 
 
+def test_get_indices(coord):
+    targets = np.concatenate([np.linspace(-2, 12, 57), coord[:]])
+
+    def test(c):
+        for loc in ['below', 'above', 'closest']:
+            indices = c.get_indices(targets, loc)
+            assert indices.dtype == np.int64
+            assert indices.tolist() == [c.get_index(v, loc) for v in targets]
+
+    test(coord)
+    coord.update_values(coord[::-1])
+    test(coord)
+
+
 def test_get_index_exact(coord):
 
     def test(c):
@@ -145,3 +161,37 @@ def test_subset_desc(coord):
 
     assert c.subset(3.4, 7.4) == slice(1, 7, 1)
     assert c.subset(3.4, 7.4, exclude=True) == slice(2, 6, 1)
+
+
+def test_regular_mode(values):
+    c = Coord('coord_test')
+    c.set_regular(9., -1., 10)
+    ref = Coord('coord_test', values[::-1])
+
+    assert c.is_descending()
+    assert np.array_equal(c[:], ref[:])
+    assert np.array_equal(c[[0, -1, 3]], ref[[0, -1, 3]])
+    assert c[-2] == ref[-2]
+    assert c.get_step() == -1.
+
+    targets = np.linspace(-2, 12, 57)
+    for loc in ['below', 'above', 'closest']:
+        assert np.array_equal(c.get_indices(targets, loc),
+                              ref.get_indices(targets, loc))
+    assert c.subset(3.4, 7.4, exclude=True) == ref.subset(3.4, 7.4, exclude=True)
+
+    c2 = c.copy()
+    c2.slice(slice(2, 8, 2))
+    assert c2._regular is not None
+    assert np.array_equal(c2[:], [7., 5., 3.])
+    c2.slice([2, 0])
+    assert c2._regular is not None
+    assert np.array_equal(c2[:], [3., 7.])
+    c2 = c.copy()
+    c2.slice([0, 1, 5])
+    assert c2._regular is None
+    assert np.array_equal(c2[:], [9., 8., 4.])
+
+    c.update_values(values)
+    assert c._regular is None
+    assert not c.is_descending()
@@ -0,0 +1,65 @@
+
+import pytest
+
+import numpy as np
+
+from tomate import Variables
+from tomate.coordinates.coord_str import CoordStr
+from tomate.keys.key import Key
+
+
+@pytest.fixture
+def var():
+    return Variables(['SST', 'SSH', 'CHL', 'U', 'V'])
+
+
+def test_get_index(var):
+    assert var.get_str_index('CHL') == 2
+    assert var.get_str_index(np.int64(3)) == 3
+    assert var.get_str_indices(['V', 'SST', 1]) == [4, 0, 1]
+    assert var.get_str_indices(np.array([3, 1])) == [3, 1]
+    assert var.get_str_indices(slice('SSH', 'V')) == [1, 2, 3]
+    assert var.get_str_names([4, 0]) == ['V', 'SST']
+
+    with pytest.raises(KeyError, match="not in variables"):
+        var.get_str_indices(['SST', 'W'])
+
+
+def test_update_index(var):
+    var.append('W')
+    assert var.get_str_index('W') == 5
+    assert var[:].tolist() == ['SST', 'SSH', 'CHL', 'U', 'V', 'W']
+
+    var.remove('SSH')
+    assert var.get_str_indices(['SST', 'CHL', 'W']) == [0, 1, 4]
+    assert 'SSH' not in var
+    with pytest.raises(ValueError):
+        var.remove('SSH')
+
+    var.slice([4, 3])
+    assert var.get_str_indices(['V', 'W']) == [1, 0]
+
+    var.empty()
+    assert 'V' not in var
+    var.append('V')
+    assert var.get_str_index('V') == 0
+
+
+def test_key_str(var):
+    key = Key(['U', 'SST'])
+    key.make_str_idx(var)
+    assert key.value == [3, 0]
+    key.make_idx_str(var)
+    assert key.value == ['U', 'SST']
+
+
+def test_get_indices(var):
+    assert var.get_indices(['CHL', 'SST']).tolist() == [2, 0]
+    assert var.get_indices('U').tolist() == [3]
+    with pytest.raises(KeyError, match="not in variables"):
+        var.get_indices(['SST', 'W'])
+
+    coord = CoordStr('station', ['a', 'b', 'c'])
+    assert coord.get_indices(['b', 'c']).tolist() == [1, 2]
+    with pytest.raises(KeyError):
+        coord.get_indices(['d'])
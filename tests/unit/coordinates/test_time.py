@@ -3,6 +3,7 @@ import cftime
 import pytest
 
 from tomate.coordinates.time import Time
+from tomate.scope import Scope
 
 
 @pytest.fixture
@@ -72,6 +73,17 @@ def test_get_index(coord):
     assert f([2000, 3, 13, 0]) == 7
 
 
+def test_get_indices(coord):
+    values = [[2000, 1, 10, 5],
+              cftime.datetime(2000, 3, 13, calendar=coord.calendar),
+              coord[4] + 1.]
+    assert coord.get_indices(values).tolist() == [1, 8, 4]
+    assert coord.get_indices(values, 'above').tolist() == [1, 8, 5]
+
+    coord.update_values(coord[::-1])
+    assert coord.get_indices(values, 'below').tolist() == [15, 7, 11]
+
+
 def test_get_index_by_day(coord):
     f = coord.get_index_by_day
 
@@ -113,3 +125,33 @@ def test_subset_by_day(coord):
     assert f([2000, 1, 10], [2004, 3, 16]) == slice(0, 14, 1)
     assert f([2000, 2, 11], [2000, 3, 13], True) == slice(8, 8, 1)
     assert f([2000, 1, 10], [2004, 3, 16], True) == slice(4, 13, 1)
+
+
+def test_calendar_fields(coord, dates):
+    fields = coord.calendar_fields
+    assert fields['year'].tolist() == [d[0] for d in dates]
+    assert fields['month'].tolist() == [d[1] for d in dates]
+    assert fields['day'].tolist() == [d[2] for d in dates]
+
+    coord.slice(slice(4, 12))
+    assert coord.calendar_fields['month'].tolist() == [2]*4 + [3]*4
+    coord.update_values(coord[::-1])
+    assert coord.calendar_fields['month'].tolist() == [3]*4 + [2]*4
+
+
+def test_get_indices_by_day(coord):
+    f = coord.get_indices_by_day
+    values = [[2000, 1, 10, 5], [2000, 3, 13, 7], [2004, 3, 18, 0]]
+    assert f(values).tolist() == [1, 9, 15]
+    assert f(values[:2], 'below').tolist() == [0, 9]
+
+    with pytest.raises(IndexError):
+        f(values, 'below')
+
+
+def test_iter_slices_month(coord):
+    scope = Scope([coord])
+    assert scope.iter_slices_month() == [slice(0, 4, 1), slice(4, 8, 1),
+                                         slice(8, 12, 1), slice(12, 16, 1)]
+    assert scope.iter_slices_month(key=[1, 3, 6, 13]) == [slice(1, 4, 2), [6],
+                                                         [13]]
@@ -0,0 +1,115 @@
+
+import cftime
+import numpy as np
+import pytest
+
+import tomate.coordinates.time_conversion as tconv
+from tomate.coordinates.time import Time
+
+
+FIELDS = ['year', 'month', 'day', 'dayofyr', 'hour', 'minute', 'second',
+          'microsecond']
+
+
+@pytest.fixture(params=['standard', 'gregorian', 'proleptic_gregorian'])
+def calendar(request):
+    return request.param
+
+
+@pytest.fixture(params=['hours since 2000-01-01',
+                        'days since 1850-01-01 12:00:00',
+                        'seconds since 1970-01-01T00:00:00Z',
+                        'minutes since 1990-5-3 +02:00'])
+def units(request):
+    return request.param
+
+
+@pytest.fixture
+def values(units):
+    rng = np.random.default_rng(0)
+    step = tconv.UNITS_STEPS[units.split()[0]]
+    values = rng.uniform(-5e4, 5e4, 500) * 86400e6 / step
+    return np.round(values, 2)
+
+
+def test_parse_units():
+    assert tconv.parse_units('days since 2000-01-01', 'standard') == (
+        86400 * 10**6, np.datetime64('2000-01-01', 'us'))
+    assert tconv.parse_units('hr since 2000-01-01 06:00:00 +02:00',
+                             'standard')[1] == np.datetime64('2000-01-01T04',
+                                                             'us')
+    assert tconv.parse_units('days since 2000-01-01', 'noleap') is None
+    assert tconv.parse_units('months since 2000-01-01', 'standard') is None
+    assert tconv.parse_units('days since 1500-01-01', 'standard') is None
+
+
+def test_fields(values, units, calendar):
+    dates = cftime.num2date(values, units, calendar)
+    fields = tconv.get_calendar_fields(values, units, calendar, FIELDS)
+    for f in FIELDS:
+        assert fields[f].tolist() == [getattr(d, f) for d in dates]
+
+
+def test_num2date(values, units, calendar):
+    assert tconv.num2date(values, units, calendar, pydate=True).tolist() == \
+        cftime.num2pydate(values, units, calendar).tolist()
+    assert tconv.num2date(values[0], units, calendar, pydate=True) == \
+        cftime.num2pydate(values[0], units, calendar)
+
+
+def test_num2date_rounding(units):
+    """Non-round values, rounded to the microsecond as cftime."""
+    rng = np.random.default_rng(1)
+    step = tconv.UNITS_STEPS[units.split()[0]]
+    values = rng.uniform(-5e4, 5e4, 5000) * 86400e6 / step
+    values = np.concatenate([values, [43507.24237877682 * 86400e6 / step],
+                             np.arange(-50, 50) * 86400e6 / step])
+    assert tconv.num2date(values, units, pydate=True).tolist() == \
+        cftime.num2pydate(values, units).tolist()
+    # A microsecond away from the second
+    values = (np.array([1., 59., 3601.]) + np.array([[-1e-6], [1e-6]]))
+    values = values.ravel() * 10**6 / step
+    assert tconv.num2date(values, units, pydate=True).tolist() == \
+        cftime.num2pydate(values, units).tolist()
+
+
+def test_date2num(values, units, calendar):
+    dates = cftime.num2date(values, units, calendar)
+    np.testing.assert_allclose(tconv.date2num(dates, units, calendar), values,
+                               rtol=0, atol=1e-6)
+    new = 'hours since 1900-01-01'
+    np.testing.assert_allclose(tconv.change_units(values, units, new, calendar),
+                               cftime.date2num(dates, new, calendar),
+                               rtol=0, atol=1e-6)
+
+
+def test_fallback():
+    units = 'days since 1600-01-01'
+    # Before the gregorian reform
+    values = np.array([0., -10000.])
+    assert tconv.num2datetime64(values, units, 'standard') is None
+    dates = cftime.num2date(values, units, 'standard')
+    np.testing.assert_array_equal(
+        tconv.get_calendar_fields(values, units, 'standard', ['year'])['year'],
+        [d.year for d in dates])
+    np.testing.assert_array_equal(tconv.date2num(dates, units, 'standard'),
+                                  values)
+    assert tconv.date2num([(1582, 10, 4)], units, 'standard')[0] == -6288
+
+    # Other calendar
+    assert tconv.date2num([(2000, 3, 1)], units, 'noleap')[0] == 400*365 + 59
+    assert tconv.fields2datetime64(
+        [cftime.datetime(2000, 1, 1, calendar='noleap')]) is None
+
+    # Invalid date
+    assert tconv.fields2datetime64([(2001, 2, 29)]) is None
+    with pytest.raises(ValueError):
+        tconv.date2num([(2001, 2, 29)], units, 'standard')
+
+
+def test_time_pydate():
+    coord = Time('time', [0., 36., 72.], 'hours since 2000-01-01')
+    dates = coord.index2date(pydate=True)
+    assert [d.day for d in dates] == [1, 2, 4]
+    assert coord.index2date(1, pydate=True).hour == 12
+    assert coord.get_index(dates[1]) == 1
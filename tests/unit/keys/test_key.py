@@ -1,5 +1,7 @@
 
-from tomate.keys.key import Key, list2slice, guess_slice_size
+import numpy as np
+
+from tomate.keys.key import Key, list2slice, range2slice, guess_slice_size
 
 
 def test_list2slice():
@@ -57,6 +59,13 @@ def test_multiplication():
     test(slice(10, 20), [5, 3, 2], [15, 13, 12], 20)
     test(slice(10, 20), slice(0, 6, 2), slice(10, 15, 2), 20)
     test(slice(2, 18, 3), slice(1, 7, 2), slice(5, 18, 6), 20)
+    test(slice(2, 18, 3), slice(None, None, -1), slice(17, 1, -3), 20)
+    test(slice(0, 10), slice(3, 4), [3], 20)
+    test(slice(0, 10), slice(4, 3), [], 20)
+
+    # Large sizes should not create lists
+    test(slice(5, None, 3), slice(100, 200000, 2),
+         slice(305, 600000, 6), 10**12)
 
 
 def test_addition():
@@ -73,6 +82,62 @@ def test_addition():
     test(slice(10, 15), [15, 16], slice(10, 17, 1), 50)
 
     test(slice(0, 5), slice(20, 25), [0, 1, 2, 3, 4, 20, 21, 22, 23, 24], 50, 50)
+    test(slice(0, 5), slice(5, 10), slice(0, 10, 1), 50, 50)
+    test(slice(0, 10, 2), slice(10, None, 2), slice(0, 49, 2), 50, 50)
+    test(slice(4, None, -2), slice(None, 0), slice(4, None, -2), 50, 50)
+
+
+def test_range2slice():
+    for rng in [range(0), range(3, 4), range(0, 10), range(2, 11, 3),
+                range(9, -1, -1), range(9, 0, -2), range(5, 2, -1)]:
+        assert range2slice(rng) == list2slice(list(rng))
+
+
+def test_array_keys():
+    idx = np.array([2, 5, 6, 9])
+    key = Key(idx)
+    assert key.is_array and key.type == 'list' and key.size == 4
+    assert key == Key([2, 5, 6, 9])
+    assert key != Key(slice(2, 10))
+    idx[0] = 0
+    assert key.value[0] == 2
+
+    key.parent_size = 10
+    assert (key * Key(slice(1, 3))) == Key(slice(5, 7, 1))
+    assert (key * Key(slice(0, 3))) == Key([2, 5, 6])
+    assert (key * Key(2)).value == 6
+    slc = Key(slice(0, 20, 2))
+    slc.parent_size = 20
+    assert (slc * key) == Key([4, 10, 12, 18])
+    assert (key + Key(np.array([1]))) == Key([2, 5, 6, 9, 1])
+    assert key.apply(np.arange(10)*10).tolist() == [20, 50, 60, 90]
+    assert key.as_list() == [2, 5, 6, 9]
+
+    # Regular results are simplified to slices
+    key = Key(np.arange(0, 100, 2))
+    key.parent_size = 100
+    for other, expected in [(slice(10, 20), slice(20, 39, 2)),
+                            (slice(None, None, -5), slice(98, 7, -10)),
+                            (slice(3, 4), [6])]:
+        result = key * Key(other)
+        assert result.type == Key(expected).type
+        assert result == Key(expected)
+        assert result.size == len(range(0, 100, 2)[other])
+    slc = Key(slice(5, 50))
+    slc.parent_size = 100
+    result = slc * Key(np.array([1, 4, 7, 10]))
+    assert result.value == slice(6, 16, 3)
+    assert (slc * Key(np.array([1, 2, 4]))) == Key([6, 7, 9])
+
+    key = Key(np.array([8, 6, 4]))
+    key.sort()
+    assert key == Key([4, 6, 8])
+    key.simplify()
+    assert key.value == slice(4, 9, 2)
+
+    key = Key(np.array([3]))
+    key.make_list_int()
+    assert key.type == 'int' and key.value == 3
 
 
 def test_guess_size():
@@ -0,0 +1,74 @@
+
+import numpy as np
+
+from tomate.accessor import Accessor
+from tomate.var_types.variable_masked import AccessorMask
+from tomate.keys.keyring import Keyring
+
+
+def get_array():
+    return np.arange(4*5*6).reshape(4, 5, 6)
+
+
+def test_take_complex():
+    array = get_array()
+    krg = Keyring(time=[0, 2, 3], lat=[1, 4], lon=slice(1, 5, 2))
+    out = Accessor.take(krg, array)
+    assert np.array_equal(out, array[np.ix_([0, 2, 3], [1, 4], [1, 3])])
+
+    krg = Keyring(time=1, lat=[1, 4], lon=[0, 5, 2])
+    out = Accessor.take(krg, array)
+    assert np.array_equal(out, array[1][np.ix_([1, 4], [0, 5, 2])])
+
+
+def test_place_complex():
+    array = get_array()
+    krg = Keyring(time=[0, 2], lat=[1, 4], lon=slice(None))
+    krg.make_full(['time', 'lat', 'lon'])
+    chunk = -np.ones((2, 2, 6), int)
+    Accessor.place(krg, array, chunk)
+    expected = get_array()
+    expected[np.ix_([0, 2], [1, 4])] = -1
+    assert np.array_equal(array, expected)
+
+
+def test_take_int_list():
+    array = get_array()
+    krg = Keyring(time=0, lat=slice(None), lon=[1, 2])
+    out = Accessor.take(krg, array)
+    assert out.shape == (5, 2)
+    assert np.array_equal(out, array[0][:, [1, 2]])
+
+
+def test_masked_complex():
+    array = np.ma.masked_array(get_array(), mask=get_array() % 3 == 0)
+    krg = Keyring(time=[1, 3], lat=2, lon=[0, 4, 5])
+    out = AccessorMask.take(krg, array)
+    assert np.array_equal(out.mask, array.mask[1::2, 2][:, [0, 4, 5]])
+
+    chunk = np.ma.masked_array(-np.ones((2, 3), int), mask=[[1, 0, 0]]*2)
+    AccessorMask.place(krg, array, chunk)
+    assert np.array_equal(array[1::2, 2][:, [0, 4, 5]], chunk)
+    assert np.array_equal(array.mask[1::2, 2][:, [0, 4, 5]], chunk.mask)
+
+
+def test_mixed_keys():
+    """Compare with taking along each axis successively."""
+    array = np.arange(4*5*6*7).reshape(4, 5, 6, 7)
+    dims = ['time', 'depth', 'lat', 'lon']
+    keys = [
+        [0, slice(1, 4), [0, 2], slice(None)],
+        [[1, 3], slice(None), [0, 2, 5], 3],
+        [slice(None, None, 2), 1, slice(None), [6, 0]],
+        [[2, 0], [4], 5, [1, 1]],
+    ]
+    for key in keys:
+        krg = Keyring(**dict(zip(dims, key)))
+        expected = array
+        for axis, k in reversed(list(enumerate(key))):
+            expected = expected[(slice(None),)*axis + (k,)]
+        assert np.array_equal(Accessor.take(krg, array), expected)
+
+        out = array.copy()
+        Accessor.place(krg, out, -expected)
+        assert np.array_equal(Accessor.take(krg, out), -expected)
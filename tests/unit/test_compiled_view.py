@@ -0,0 +1,66 @@
+
+import numpy as np
+import pytest
+
+from tomate import DataBase, Lat, Lon, Time
+
+
+def get_db():
+    db = DataBase([Time('time', np.arange(10.), 'days since 2000-01-01'),
+                   Lat('lat', np.linspace(-10., 10., 5)),
+                   Lon('lon', np.linspace(0., 20., 6))])
+    for var in ['A', 'B']:
+        db.add_variable(var, ['time', 'lat', 'lon'], datatype='f8')
+    db.set_data('A', np.arange(300.).reshape(10, 5, 6))
+    db.set_data('B', -np.arange(300.).reshape(10, 5, 6))
+    return db
+
+
+@pytest.mark.parametrize('keys', [
+    dict(var='A'),
+    dict(var='A', lat=[0, 2, 4], lon=slice(1, 5)),
+    dict(var='A', lat=3, lon=[5, 0]),
+    dict(var='A', lat=slice(0, 3), order=['lon', 'lat']),
+    dict(var=['A', 'B'], lat=[1, 2]),
+    dict(var=['B', 'A'], lon=2, stack=True),
+    dict(lat=[4, 1], stack=True, order=['lat', 'lon', 'var'])
+])
+def test_compiled_view(keys):
+    db = get_db()
+    cview = db.compile_view(along='time', **keys)
+    assert len(cview) == 10
+    for i, out in enumerate(cview):
+        expected = db.view(time=i, **keys)
+        if isinstance(expected, tuple):
+            assert all(np.array_equal(o, e) for o, e in zip(out, expected))
+        else:
+            assert np.array_equal(out, expected)
+
+    cview = db.compile_view(**keys)
+    out, expected = cview(), db.view(**keys)
+    if isinstance(expected, tuple):
+        assert all(np.array_equal(o, e) for o, e in zip(out, expected))
+    else:
+        assert np.array_equal(out, expected)
+
+
+def test_compiled_view_index():
+    db = get_db()
+    cview = db.compile_view('A', time=4, along='time')
+    assert cview.index == 4
+    assert np.array_equal(cview(), db.view('A', time=4))
+    cview.set_index(7)
+    assert np.array_equal(cview(), db.view('A', time=7))
+
+    with pytest.raises(TypeError):
+        db.compile_view('A', time=[1, 2], along='time')
+    with pytest.raises(TypeError):
+        db.compile_view('A').set_index(1)
+
+
+def test_compiled_view_changed():
+    db = get_db()
+    cview = db.compile_view('A', along='time')
+    db.slice_data(time=slice(0, 5))
+    with pytest.raises(RuntimeError):
+        cview(0)
@@ -0,0 +1,196 @@
+
+import numpy as np
+import pytest
+
+from tomate import Lat, Lon, Time
+from tomate.db_types import DataCompute
+from tomate.db_types.data_compute import (HistogramAccumulator,
+                                          finalize_moments, get_moments,
+                                          merge_moments)
+from tomate.var_types.variable_masked import VariableMasked
+
+
+def get_db(masked=False):
+    # 4 timestamps a day, 75 days
+    time = Time('time', np.arange(0., 75*24, 6.), 'hours since 2000-01-15')
+    db = DataCompute([time, Lat('lat', np.linspace(-10., 10., 4)),
+                      Lon('lon', np.linspace(0., 20., 5))])
+    shape = (time.size, 4, 5)
+    data = np.random.default_rng(0).standard_normal(shape)
+    if masked:
+        db.add_variable('A', ['time', 'lat', 'lon'], datatype='f8',
+                        var_class=VariableMasked)
+        mask = np.zeros(shape, bool)
+        mask[:4*20, 0, 0] = True  # first month fully masked
+        mask[::3, 1] = True
+        data = np.ma.array(data, mask=mask)
+    else:
+        db.add_variable('A', ['time', 'lat', 'lon'], datatype='f8')
+        data[::3, 1] = np.nan
+    db.set_data('A', data)
+    return db
+
+
+def expected(db, slices, how, **keys):
+    func = dict(mean=np.nanmean, sum=np.nansum, std=np.nanstd,
+                min=np.nanmin, max=np.nanmax)[how]
+    data = db.view('A', **keys)
+    if isinstance(data, np.ma.MaskedArray):
+        func = dict(mean=np.ma.mean, sum=np.ma.sum, std=np.ma.std,
+                    min=np.ma.min, max=np.ma.max)[how]
+    return [func(data[slc], axis=0) for slc in slices]
+
+
+@pytest.mark.parametrize('masked', [False, True])
+@pytest.mark.parametrize('how', ['mean', 'sum', 'std', 'min', 'max'])
+def test_resample(how, masked):
+    db = get_db(masked)
+    with np.errstate(invalid='ignore'):
+        result, time = db.resample('A', freq='month', how=how)
+    slices = db.loaded.iter_slices_month()
+    assert result.shape == (3, 4, 5)
+    assert time.calendar_fields['month'].tolist() == [1, 2, 3]
+    assert time[:].tolist() == [db.loaded.time[s][0] for s in slices]
+
+    for res, exp in zip(result, expected(db, slices, how)):
+        np.testing.assert_allclose(res, exp)
+        if masked:
+            assert np.array_equal(np.ma.getmaskarray(res),
+                                  np.ma.getmaskarray(exp))
+
+    result, _ = db.resample('A', freq=7, how=how, lat=slice(2, 4))
+    slices = [slice(i, i+7) for i in range(0, 300, 7)]
+    for res, exp in zip(result, expected(db, slices, how, lat=slice(2, 4))):
+        np.testing.assert_allclose(res, exp)
+
+
+def test_resample_groups():
+    db = get_db()
+    result, time = db.resample('A', freq='day', lon=0)
+    assert result.shape == (75, 4)
+    assert time.size == 75
+    np.testing.assert_allclose(result[3], np.nanmean(db['A'][12:16, :, 0],
+                                                     axis=0))
+
+    # Unsorted time
+    db.slice_data(time=np.arange(299, -1, -1))
+    result_rev, time_rev = db.resample('A', freq='year', lon=0)
+    assert result_rev.shape == (1, 4)
+    assert time_rev[0] == db.loaded.time[0]
+
+    with pytest.raises(ValueError):
+        db.resample('A', how='median')
+    with pytest.raises(ValueError):
+        db.resample('A', time=0)
+    with pytest.raises(TypeError):
+        db.resample('A', coord='lat', freq='day')
+
+
+@pytest.mark.parametrize('masked', [False, True])
+def test_moments(masked):
+    data = get_db(masked)['A'][:]
+    whole = get_moments(data, (0, 2))
+
+    chunks = [get_moments(data[i:i+40], (0, 2)) for i in range(0, 300, 40)]
+    merged = chunks[0]
+    for chunk in chunks[1:]:
+        merged = merge_moments(merged, chunk)
+    for a, b in zip(whole, merged):
+        np.testing.assert_allclose(a, b)
+
+    with np.errstate(invalid='ignore'):
+        funcs = [(np.nanmean, 'mean'), (np.nansum, 'sum'), (np.nanstd, 'std')]
+        if masked:
+            funcs = [(np.ma.mean, 'mean'), (np.ma.sum, 'sum'),
+                     (np.ma.std, 'std')]
+        for func, how in funcs:
+            np.testing.assert_allclose(
+                finalize_moments(*merged, how, masked), func(data, axis=(0, 2)))
+
+    # Along a dimension with no valid values
+    empty = get_moments(np.full((3, 2), np.nan), 0)
+    merged = merge_moments(empty, get_moments(np.ones((2, 2)), 0))
+    assert merged[0].tolist() == [2, 2]
+    assert merged[1].tolist() == [1., 1.]
+    assert finalize_moments(*empty, 'sum').tolist() == [0., 0.]
+    assert finalize_moments(*empty, 'mean', masked=True).mask.all()
+
+
+def test_reduce_disk():
+    db = get_db()
+    with pytest.raises(TypeError):
+        db.mean_disk('A', 'time')
+    with pytest.raises(TypeError):
+        db.histogram_disk('A', 10, (0., 1.))
+
+
+@pytest.mark.parametrize('masked', [False, True])
+@pytest.mark.parametrize('dims', ['time', ['lat', 'lon'],
+                                  ['time', 'lat', 'lon']])
+def test_threads(dims, masked):
+    db = get_db(masked)
+    with np.errstate(invalid='ignore'):
+        for func in [db.mean, db.sum, db.std_dev]:
+            serial = func('A', dims)
+            for keys in [{}, dict(time=slice(0, 3)), dict(lat=1, lon=2)]:
+                if keys:
+                    serial = func('A', dims, **keys)
+                threaded = func('A', dims, threads=4, **keys)
+                assert np.shape(threaded) == np.shape(serial)
+                np.testing.assert_allclose(threaded, serial)
+
+    res = db.apply_along_axes(np.nanmax, 'A', 'time', threads=3,
+                              kwargs=dict(keepdims=True))
+    assert np.array_equal(res, np.nanmax(db['A'][:], axis=0, keepdims=True))
+
+
+@pytest.mark.parametrize('masked', [False, True])
+def test_histogram(masked):
+    db = get_db(masked)
+    data = db['A'][:]
+    valid = ~np.isnan(np.ma.filled(data, np.nan))
+    hist, bins = db.histogram('A', bins=10, lat=slice(1, 3))
+    assert hist.sum() == valid[:, 1:3].sum()
+    expected, _ = np.histogram(np.ma.getdata(data)[:, 1:3][valid[:, 1:3]],
+                               bins=bins)
+    assert np.array_equal(hist, expected)
+
+
+@pytest.mark.parametrize('bins', [7, [-3., -1., -0.5, 0., 2., 2.5]])
+def test_histogram_accumulator(bins):
+    data = get_db(True)['A'][:]
+    values = np.ma.getdata(data)[~np.ma.getmaskarray(data)]
+    expected, edges = np.histogram(values, bins=bins, range=(-2.5, 2.5))
+
+    hist = HistogramAccumulator(bins, (-2.5, 2.5))
+    for i in range(0, 300, 70):
+        hist.add(data[i:i+70])
+    assert np.array_equal(hist.edges, edges)
+    assert np.array_equal(hist.counts, expected)
+    assert hist.total == expected.sum()
+    np.testing.assert_allclose(
+        hist.get(density=True),
+        np.histogram(values, bins=bins, range=(-2.5, 2.5), density=True)[0])
+
+    # Values on edges
+    hist = HistogramAccumulator(4, (0., 1.))
+    hist.add(np.array([0., 0.25, 0.5, 0.75, 1., 1.5, -1., np.nan]))
+    assert hist.counts.tolist() == [1, 1, 1, 2]
+
+    with pytest.raises(ValueError):
+        HistogramAccumulator(4)
+    with pytest.raises(ValueError):
+        HistogramAccumulator(4, (1., 1.))
+    with pytest.raises(ValueError):
+        HistogramAccumulator([0., 2., 1.])
+
+
+def test_view_by_value_var():
+    db = get_db()
+    db.add_variable('B', ['time', 'lat', 'lon'], datatype='f8')
+    db.set_data('B', 2*db['A'][:])
+    b, a = db.view_by_value(var=['B', 'A'])
+    np.testing.assert_array_equal(a, db['A'][:])
+    np.testing.assert_array_equal(b, db['B'][:])
+    np.testing.assert_array_equal(db.view_by_value(var='B', lon=20.),
+                                  db['B'][:, :, -1])
@@ -0,0 +1,77 @@
+
+import numpy as np
+import pytest
+
+from tomate.util.do_stack import do_stack
+from tomate.util.mask import enlarge_mask, get_circle_kernel
+
+ndimage = pytest.importorskip('scipy.ndimage')
+
+
+def get_array():
+    return np.random.default_rng(0).standard_normal((4, 6, 7, 5))
+
+
+@pytest.mark.parametrize('axes', [None, [1, 2], [0, 3], [3, 1]])
+@pytest.mark.parametrize('threads', [None, 3])
+def test_do_stack(axes, threads):
+    array = get_array()
+    axes_ = axes or [-2, -1]
+    moved = np.cumsum(np.moveaxis(array, axes_, [-2, -1]), axis=-1)
+    expected = np.moveaxis(moved, [-2, -1], axes_)
+
+    result = do_stack(np.cumsum, 2, array, axis=-1, axes=axes,
+                      threads=threads)
+    assert result.shape == array.shape
+    np.testing.assert_allclose(result, expected)
+
+    result = do_stack(np.cumsum, 2, array, axis=-1, axes=axes,
+                      threads=threads, vectorized=True)
+    np.testing.assert_allclose(result, expected)
+
+    output = np.zeros(array.shape)
+    result = do_stack(np.cumsum, 2, array, axis=-1, axes=axes,
+                      threads=threads, output=output)
+    assert result is output
+    np.testing.assert_allclose(output, expected)
+
+
+def test_do_stack_dtype():
+    array = np.zeros((3, 4, 4), dtype=bool)
+    array[:, 1, 1] = True
+    result = do_stack(ndimage.binary_dilation, 2, array)
+    assert result.dtype == bool
+    assert result.sum() == 3*5
+
+
+def test_circle_kernel():
+    for n in [1, 2, 5, 8]:
+        kernel = get_circle_kernel(n)
+        for i in range(n):
+            for j in range(n):
+                assert kernel[i, j] == ((i-(n-1)/2)**2 + (j-(n-1)/2)**2
+                                        <= (n/2)**2)
+
+
+@pytest.mark.parametrize('method', ['auto', 'dilation', 'fft', 'distance'])
+def test_enlarge_mask(method):
+    mask = np.zeros((3, 9, 4, 11), dtype=bool)
+    mask[1, 4, 2, 5] = True
+    expected = np.zeros(mask.shape, dtype=bool)
+    expected[1, 2:7, 2, 3:8] = get_circle_kernel(5) > 0
+    result = enlarge_mask(mask, 2, axes=[1, 3], method=method)
+    assert np.array_equal(result, expected)
+
+    mask = np.random.default_rng(0).random((4, 40, 30)) < 0.02
+    mask[0] = False
+    for n in [1, 4, 20]:
+        kernel = get_circle_kernel(2*n+1)
+        expected = do_stack(ndimage.convolve, 2, 1.*mask, kernel) > 0
+        result = enlarge_mask(mask, n, method=method)
+        assert np.array_equal(result, expected)
+    assert np.array_equal(enlarge_mask(mask, 0, method=method), mask)
+
+
+def test_enlarge_mask_wrong_method():
+    with pytest.raises(ValueError):
+        enlarge_mask(np.zeros((3, 3), bool), 1, method='convolve')
@@ -0,0 +1,86 @@
+
+import json
+
+import pytest
+
+from tomate.profiling import HookRegistry, TraceCollector
+
+
+@pytest.fixture
+def hooks():
+    return HookRegistry()
+
+
+def test_no_hooks(hooks):
+    assert not hooks
+    with hooks.stage('test', filename='a'):
+        pass
+
+
+def test_stage(hooks):
+    events = []
+
+    def hook(stage, event, timestamp, context):
+        events.append((stage, event, context))
+
+    hooks.add(hook)
+    hooks.add(hook)
+    assert len(hooks) == 1
+
+    with hooks.stage('outer', filename='a'):
+        with hooks.stage('inner'):
+            pass
+    assert [e[:2] for e in events] == [('outer', 'start'), ('inner', 'start'),
+                                       ('inner', 'end'), ('outer', 'end')]
+    assert events[0][2] == {'filename': 'a'}
+
+    events.clear()
+    with pytest.raises(ValueError):
+        with hooks.stage('fail'):
+            raise ValueError()
+    assert [e[1] for e in events] == ['start', 'end']
+
+    hooks.remove(hook)
+    assert not hooks
+
+
+def test_add(hooks):
+    def a(*args):
+        pass
+
+    def b(*args):
+        pass
+
+    hooks.add(a)
+    other = HookRegistry([a, b])
+    assert list(hooks + other) == [a, b]
+    assert list(hooks) == [a]
+
+
+def test_collector(hooks, tmp_path):
+    collector = TraceCollector()
+    hooks.add(collector)
+
+    with hooks.stage('load', keys=[0, slice(2, 5)]):
+        with hooks.stage('load'):
+            pass
+    with hooks.stage('write', obj=object()):
+        pass
+
+    assert len(collector) == 6
+    assert [e['ph'] for e in collector.events] == ['B', 'B', 'E', 'E', 'B', 'E']
+    assert collector.events[0]['args']['keys'] == [0, 'slice(2, 5, None)']
+    assert isinstance(collector.events[4]['args']['obj'], str)
+
+    durations = collector.get_durations()
+    assert set(durations) == {'load', 'write'}
+    assert all(d >= 0 for d in durations.values())
+
+    filename = tmp_path / 'trace.json'
+    collector.write(filename)
+    with open(filename) as f:
+        trace = json.load(f)
+    assert len(trace['traceEvents']) == 6
+
+    collector.clear()
+    assert len(collector) == 0
@@ -0,0 +1,62 @@
+
+
+import re
+
+import numpy as np
+import pytest
+
+from tomate import Coord, Time
+from tomate.coordinates.coord_str import CoordStr
+from tomate.filegroup.filegroup_scan import FilegroupScan
+from tomate.filegroup.matcher import Matcher
+
+
+def get_coords():
+    time = Time('time', np.arange(0., 400., 0.5), 'days since 2007-01-01')
+    depth = Coord('depth', [0., 1e-7, 0.1 + 0.2, 10.5, 1234567., 1234567.1,
+                            20070111., 123456789012.25])
+    var = CoordStr('var', ['SST', 'CHL'])
+    return dict(time=time, depth=depth, var=var)
+
+
+def test_render_pregex():
+    coords = get_coords()
+    render = FilegroupScan.render_pregex
+    assert render(r'SST_%(time:x)\.nc', coords, dict(time=21)) == \
+        'SST_20070111.nc'
+    assert render(r'%(time:Y)/%(time:B)_%(time:j)_%(time:X)', coords,
+                  dict(time=91)) == '2007/February_046_120000'
+    assert render(r'%(prefix)_%(time:idx)_%(time:idx:custom=\d\d\d:)'
+                  r'_%(depth:value:custom=[\d.]+:)_%(var:text)',
+                  coords, dict(time=45, depth=3, var=1),
+                  prefix='A') == 'A_45_045_10.5_CHL'
+
+    with pytest.raises(KeyError):
+        render(r'%(lat:idx)', coords, {})
+
+
+def get_regex(pregex):
+    """Regex from pre-regex, as in FilegroupScan.set_scan_regex."""
+    regex = pregex
+    for idx, match in enumerate(FilegroupScan.scan_pregex(pregex)):
+        matcher = Matcher(match, idx)
+        regex = regex.replace(match.group(), '(' + matcher.rgx + ')')
+    return regex
+
+
+def test_render_value():
+    coords = get_coords()
+    depth = coords['depth']
+    pregex = r'D_%(depth:value:custom=[\d.]+:)\.nc'
+    regex = get_regex(pregex)
+    filenames = [FilegroupScan.render_pregex(pregex, coords, dict(depth=i))
+                 for i in range(depth.size)]
+    assert filenames == ['D_0.nc', 'D_0.0000001.nc',
+                         'D_0.30000000000000004.nc', 'D_10.5.nc', 'D_1234567.nc', 'D_1234567.1.nc',
+                         'D_20070111.nc', 'D_123456789012.25.nc']
+    assert len(set(filenames)) == depth.size
+
+    for i, filename in enumerate(filenames):
+        m = re.fullmatch(regex, filename)
+        assert m is not None
+        assert float(m.group(1)) == depth[i]
@@ -0,0 +1,36 @@
+
+import numpy as np
+import pytest
+
+from tomate import Lat, Time
+from tomate.scope import Scope
+
+
+def get_scope():
+    # Every 12 hours, from 2000-01-30 to 2001-01-02
+    time = Time('time', np.arange(0., 339*24, 12.), 'hours since 2000-01-30')
+    return Scope([time, Lat('lat', np.linspace(-10., 10., 3))])
+
+
+def test_iter_slices_date():
+    scope = get_scope()
+    months = scope.iter_slices_date('time', 'month')
+    assert len(months) == 13
+    assert months[0] == slice(0, 4, 1)
+    assert months[1] == slice(4, 62, 1)
+    assert months[-1] == slice(674, 678, 1)
+    assert sum(len(range(678)[s]) for s in months) == 678
+
+    assert scope.iter_slices_date('time', 'year') == [slice(0, 674, 1),
+                                                      slice(674, 678, 1)]
+    days = scope.iter_slices_date('time', 'day', key=slice(1, 8))
+    assert days == [[1], slice(2, 4, 1), slice(4, 6, 1), slice(6, 8, 1)]
+
+    # Slices are given in the coordinate, not relative to the key
+    days = scope.iter_slices_date('time', 'day', key=[5, 6, 7, 2])
+    assert days == [[5], slice(6, 8, 1), [2]]
+
+    with pytest.raises(ValueError):
+        scope.iter_slices_date('time', 'week')
+    with pytest.raises(TypeError):
+        scope.iter_slices_date('lat')
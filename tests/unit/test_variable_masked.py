@@ -0,0 +1,54 @@
+
+import numpy as np
+import pytest
+
+from tomate import DataBase, Lat, Lon
+from tomate.var_types.variable_masked import VariableMasked, reduce_masked
+
+
+def get_data(dtype='f4'):
+    rng = np.random.default_rng(0)
+    values = (rng.standard_normal((6, 5, 4)) * 10).astype(dtype)
+    mask = rng.random(values.shape) < 0.3
+    mask[:, 0, 0] = True
+    if values.dtype.kind == 'f':
+        values[1, 2] = np.nan
+    return np.ma.array(values, mask=mask)
+
+
+@pytest.mark.parametrize('dtype', ['f4', 'f8', 'i4'])
+@pytest.mark.parametrize('axis', [0, (1, 2), None])
+def test_reduce_masked(dtype, axis):
+    data = get_data(dtype)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for how, func, kw in [('mean', np.nanmean, {}),
+                              ('sum', np.nansum, {}),
+                              ('std', np.nanstd, {}),
+                              ('std', np.nanstd, dict(ddof=1))]:
+            result = reduce_masked(data, axis, how, **kw)
+            expected = func(data, axis=axis, **kw)
+            rtol = 1e-5 if dtype == 'f4' else 1e-7
+            np.testing.assert_allclose(np.ma.filled(result, 0.),
+                                       np.ma.filled(expected, 0.), rtol=rtol)
+            assert np.array_equal(np.ma.getmaskarray(result),
+                                  np.ma.getmaskarray(expected))
+            if dtype != 'i4':
+                assert result.dtype == np.dtype(dtype)
+
+    assert reduce_masked(np.ma.masked_all((3, 2)), 0).mask.all()
+    assert reduce_masked(np.ma.masked_all((3, 2))) is np.ma.masked
+
+
+def test_coverage():
+    db = DataBase([Lat('lat', np.arange(5.)), Lon('lon', np.arange(4.))])
+    db.add_variable('A', ['lat', 'lon'], var_class=VariableMasked,
+                    datatype='f8')
+    data = get_data()[0]
+    db.set_data('A', data)
+    var = db['A']
+    assert var.get_coverage() == pytest.approx(np.mean(~data.mask)*100)
+    np.testing.assert_allclose(var.get_coverage('lon'),
+                               np.mean(~data.mask, axis=1)*100)
+
+    db.set_data('A', np.ma.array(data.data))
+    np.testing.assert_allclose(var.get_coverage('lat'), [100.]*4)
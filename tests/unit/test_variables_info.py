@@ -0,0 +1,39 @@
+
+import copy
+
+import pytest
+
+from tomate.variables_info import VariablesInfo
+
+
+@pytest.fixture
+def vi():
+    return VariablesInfo({'SST': {'units': 'K', 'fullname': 'Temperature'},
+                          'CHL': {'units': 'mg/m3'}},
+                         title='Test')
+
+
+def test_attribute_access(vi):
+    assert vi.units == {'SST': 'K', 'CHL': 'mg/m3'}
+    assert vi.fullname == {'SST': 'Temperature'}
+    assert vi.title == 'Test'
+    assert vi['CHL'].units == 'mg/m3'
+    assert sorted(vi.variables) == ['CHL', 'SST']
+
+    with pytest.raises(AttributeError):
+        vi.missing
+    with pytest.raises(AttributeError):
+        vi.CHL.fullname
+
+    vi.set_attribute('CHL', 'fullname', 'Chlorophyll')
+    assert vi.fullname['CHL'] == 'Chlorophyll'
+    vi['SST'].units = 'degC'
+    assert vi.get_attribute('SST', 'units') == 'degC'
+
+
+def test_copy(vi):
+    vi_copy = copy.deepcopy(vi)
+    assert vi_copy.units == vi.units
+    vi_copy = vi.copy()
+    assert vi_copy.title == 'Test'
+    assert vi_copy.units == vi.units